@@ -5,11 +5,16 @@ Manages camera connection, preview capture, and image processing for supported m
 import gphoto2 as gp
 import cv2
 import numpy as np
-import base64
+import queue
+import re
 import threading
 import time
 import io
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from jpeg_utils import JpegTransformer
 
 # Optional: Pillow for EXIF parsing
 try:
@@ -18,9 +23,98 @@ try:
 except ImportError:
     HAS_PIL = False
 
+# Optional: pybase64 for SIMD (SSSE3/AVX2/NEON) base64 encoding of live frames
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# Optional: libjpeg-turbo (PyTurboJPEG) for SIMD JPEG decode/encode on the rotation path
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_444, TJSAMP_422, TJSAMP_420
+    _turbojpeg = TurboJPEG()
+    HAS_TURBOJPEG = True
+except Exception:
+    # Package missing or libturbojpeg shared library could not be loaded
+    _turbojpeg = None
+    HAS_TURBOJPEG = False
+
 import logging
 logger = logging.getLogger(__name__)
 
+# Rotate 90/270° live frames through OpenCV's OpenCL T-API (UMat) when a device is available
+try:
+    _USE_OPENCL = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+except Exception:
+    _USE_OPENCL = False
+
+# gphoto2 error codes (GPhoto2Error.code) by how capture reacts to them
+_GP_IO_BUSY = frozenset({-110})          # GP_ERROR_CAMERA_BUSY ("I/O in progress"): retry
+_GP_DEVICE_LOST = frozenset({-52, -53})  # GP_ERROR_IO_USB_FIND / _CLAIM: device gone
+_GP_FATAL = frozenset({-1})              # GP_ERROR (unspecified): treat as lost
+# Fallback for exceptions without .code: a whole error code in the message, then known texts
+_GP_CODE_IN_MESSAGE_RE = re.compile(r"(?<![\w-])(-\d+)(?!\d)")
+_GP_MESSAGE_CODES = (
+    ("I/O in progress", -110),
+    ("Could not find the requested device", -52),
+    ("Unspecified error", -1),
+)
+
+
+def _gp_error_code(error):
+    """Return the gphoto2 error code of an exception, or None if it has none.
+
+    Uses GPhoto2Error.code when present; otherwise looks for a whole code such
+    as "[-52]" (so "-110" never reads as "-1") or a known message text. Only for
+    errors raised by gphoto2 calls (the capture path), since other libraries'
+    messages can contain such numbers too.
+    """
+    code = getattr(error, "code", None)
+    if code is not None:
+        return code
+    message = str(error)
+    match = _GP_CODE_IN_MESSAGE_RE.search(message)
+    if match:
+        return int(match.group(1))
+    for text, text_code in _GP_MESSAGE_CODES:
+        if text in message:
+            return text_code
+    return None
+
+# Chroma subsampling names used for preview re-encoding, mapped per encoder backend.
+# OpenCV only gained IMWRITE_JPEG_SAMPLING_FACTOR in 4.5.5; older builds keep their default.
+_TJ_SUBSAMPLE = (
+    {"444": TJSAMP_444, "422": TJSAMP_422, "420": TJSAMP_420} if HAS_TURBOJPEG else {}
+)
+_CV2_SUBSAMPLE = {
+    name: getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_" + name)
+    for name in ("444", "422", "420")
+    if hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_" + name)
+}
+
+# EOI marker scan: buffers below this size use bytes.rfind, larger ones are scanned
+# backwards in blocks of this size with vectorized NumPy comparisons
+_EOI_SCAN_BLOCK = 64 * 1024
+
+# Optional: Numba JIT for the EOI scan (compiled loop that runs without the GIL, so it
+# overlaps with capture on the producer thread)
+try:
+    from numba import njit
+
+    @njit(cache=True, nogil=True)
+    def _find_last_eoi(arr):
+        """Return the index of the last FF D9 pair in a uint8 array, or -1."""
+        i = arr.shape[0] - 2
+        while i >= 0:
+            if arr[i] == 0xFF and arr[i + 1] == 0xD9:
+                return i
+            i -= 1
+        return -1
+
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
 
 class CameraHandler:
     """Manages camera connection and frame capture with error handling."""
@@ -30,6 +124,8 @@ class CameraHandler:
     ORIENTATION_180 = 3
     ORIENTATION_270 = 6  # 90 CCW
     ORIENTATION_90 = 8   # 90 CW
+    # Orientation -> clockwise degrees for the lossless JPEG rotation
+    _ROTATE_DEGREES = {ORIENTATION_90: 90, ORIENTATION_180: 180, ORIENTATION_270: 270}
     
     def __init__(self):
         """Initialize camera handler with default settings."""
@@ -53,7 +149,30 @@ class CameraHandler:
         self._consecutive_corrupt_threshold = 5
         # Throttle captures to avoid hammering the camera/USB bus
         self._min_frame_interval = 0.03  # seconds between preview grabs (30ms = ~33fps max)
+        # Re-encode settings for rotated preview frames (preview only, never saved)
+        self._preview_jpeg_quality = 75
+        self._preview_subsample = "420"  # chroma subsampling: "444", "422" or "420"
+        # Rotated frames are downscaled to at most this many pixels on the long side
+        # before rotation/re-encode (None disables)
+        self._preview_max_dim = 1024
         self._last_capture_ts = 0.0
+        # Reusable capture buffers: preview data is copied into a pooled bytearray instead
+        # of a new bytes object per frame. A frame owns its buffer until it has been
+        # processed or dropped, then the buffer returns to the pool (grown on demand).
+        self._capture_buf_size = 4 << 20
+        self._free_capture_bufs = deque()
+
+        # Work buffers for the decode/rotate/encode path, sized lazily from the first frame
+        self._bgr_buf = None
+        self._rot_buf = None
+        self._encode_buf = None
+
+        # Pipelined capture: a producer thread grabs preview frames while the caller
+        # processes the previous one. The single-slot queue always holds the newest frame.
+        self._frame_q = queue.Queue(maxsize=1)
+        self._frame_wait_timeout = 1.0  # seconds get_frame_* waits for a captured frame
+        self._capture_thread = None
+        self._capture_stop_event = None
 
         # Tethering support (background thread)
         # Directory to save incoming tethered files
@@ -63,6 +182,19 @@ class CameraHandler:
         self._tether_running = False
         self._tether_stop_event = None
         self._tether_thread = None
+        # Event polling costs a USB round-trip, so it is rate-limited rather than per frame
+        self._tether_poll_interval = 0.5
+        self._max_events_per_poll = 16  # cap on events drained per poll
+        self._last_event_poll_ts = 0.0
+
+        # Files announced by FILE_ADDED events, queued as parallel folder/filename
+        # deques and downloaded after camera_lock is released
+        self._pending_folders = deque()
+        self._pending_filenames = deque()
+        self._download_executor = None  # created on first download
+
+        # Reused preview CameraFile (allocated on connect; None = allocate per capture)
+        self._preview_file = None
 
     def connect(self):
         """
@@ -76,6 +208,9 @@ class CameraHandler:
             self.camera = gp.Camera()
             self.camera.init(self.context)
             self.lost_device = False
+            # Preview frames are captured into one reused CameraFile
+            self._preview_file = gp.CameraFile()
+            self._warm_up_jit()
             
             # Get camera model info
             summary = self.camera.get_summary(self.context).text.splitlines()[0]
@@ -84,11 +219,29 @@ class CameraHandler:
             self.lost_device = True
             return False, str(e)
 
+    @staticmethod
+    def _warm_up_jit():
+        """Compile the Numba EOI scan now so the first live frame does not pay for it."""
+        if not HAS_NUMBA:
+            return
+        try:
+            # Numba specializes on array writability: _validate_trim_copy scans
+            # gphoto2's read-only memoryview (under camera_lock), later trims scan
+            # the writable pooled bytearray copies; compile both
+            _find_last_eoi(np.frombuffer(b"\xff\xd8\xff\xd9", dtype=np.uint8))
+            _find_last_eoi(np.frombuffer(bytearray(b"\xff\xd8\xff\xd9"), dtype=np.uint8))
+        except Exception:
+            logger.debug("Numba warm-up failed", exc_info=True)
+
     def get_frame_base64(self):
         """
-        Capture a preview frame and return it as a base64-encoded JPEG.
+        Return the newest preview frame as a base64-encoded JPEG.
+
+        The string carries no data URI prefix; Flet's Image.src accepts bare
+        base64 payloads directly.
         
-        Implements retry logic with exponential backoff for transient I/O errors.
+        Frames are captured on a background thread (with retry logic and backoff
+        for transient I/O errors) so USB capture overlaps with processing here.
         
         Returns:
             str: Base64-encoded JPEG string, or None on error
@@ -96,45 +249,148 @@ class CameraHandler:
         if not self.camera:
             return None
 
-        file_data = self._capture_preview_with_retry()
-        if not file_data:
+        file_data = self._next_frame()
+        try:
+            if not file_data:
+                return None
+            return self._process_frame_to_base64(file_data)
+        finally:
+            self._release_capture_buffer(file_data)
+
+    def get_frame_bytes(self):
+        """
+        Capture a preview frame and return it as raw JPEG bytes.
+        
+        Same as get_frame_base64() but skips the base64 encoding, for
+        consumers that accept raw bytes (e.g. Flet's Image.src).
+        
+        Returns:
+            bytes: JPEG data with rotation applied, or None on error
+        """
+        if not self.camera:
             return None
 
-        return self._process_frame_to_base64(file_data)
+        file_data = self._next_frame()
+        try:
+            if not file_data:
+                return None
+            jpeg_data = self._process_frame_to_jpeg(file_data)
+            if jpeg_data is None:
+                return None
+            return bytes(jpeg_data)
+        finally:
+            self._release_capture_buffer(file_data)
+
+    # --- Pipelined capture ---
+    def _next_frame(self):
+        """Start the capture thread if needed and wait for the newest frame.
+
+        Returns:
+            memoryview: Frame data (release with _release_capture_buffer), or None
+        """
+        self._ensure_capture_thread()
+        try:
+            return self._frame_q.get(timeout=self._frame_wait_timeout)
+        except queue.Empty:
+            return None
+
+    def _ensure_capture_thread(self):
+        """Start the preview capture thread unless it is already running."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._capture_stop_event = threading.Event()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, args=(self._capture_stop_event,), daemon=True
+        )
+        self._capture_thread.start()
+
+    def _stop_capture_thread(self):
+        """Stop the preview capture thread and drop any queued frame."""
+        if self._capture_stop_event is not None:
+            self._capture_stop_event.set()
+        thread = self._capture_thread
+        # release() may run on the capture thread itself (device lost during capture)
+        if thread is not None and thread is not threading.current_thread():
+            try:
+                thread.join(timeout=1.0)
+            except Exception:
+                pass
+        self._capture_thread = None
+        try:
+            self._release_capture_buffer(self._frame_q.get_nowait())
+        except queue.Empty:
+            pass
+
+    def _capture_loop(self, stop_event):
+        """Producer loop: capture preview frames and publish the newest one.
+
+        Failed captures back off (doubling up to 1s) instead of retrying at once,
+        so a camera in a bad state is not hammered while holding camera_lock.
+        """
+        backoff = 0.0
+        while not stop_event.is_set() and self.camera is not None:
+            frame = self._capture_preview_with_retry()
+            if stop_event.is_set():
+                self._release_capture_buffer(frame)
+                break
+            self._publish_frame(frame)
+            if frame is None:
+                backoff = min(max(backoff * 2, self._min_frame_interval), 1.0)
+                if stop_event.wait(backoff):
+                    break
+            else:
+                backoff = 0.0
+
+    def _publish_frame(self, frame):
+        """Replace any unconsumed frame in the single-slot queue with this one.
+
+        None is published as well so the consumer sees capture failures.
+        """
+        try:
+            self._release_capture_buffer(self._frame_q.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            self._frame_q.put_nowait(frame)
+        except queue.Full:
+            self._release_capture_buffer(frame)
 
     def _capture_preview_with_retry(self):
         """
         Capture preview with retry logic for I/O busy errors.
         
         Returns:
-            bytes: Preview image data, or None on failure
+            memoryview: Preview image data backed by a pooled capture buffer
+                (see _release_capture_buffer), or None on failure
         """
         for attempt, delay in enumerate(self._retry_delays, start=1):
             try:
-                # Enforce a minimal interval between captures to reduce truncated frames
-                now = time.time()
-                elapsed = now - self._last_capture_ts
-                if elapsed < self._min_frame_interval:
-                    time.sleep(self._min_frame_interval - elapsed)
+                # Enforce a minimal interval between capture starts to reduce truncated
+                # frames; one monotonic clock read serves throttle, event poll and timestamp
+                now = time.monotonic()
+                wait = self._min_frame_interval - (now - self._last_capture_ts)
+                if wait > 0:
+                    time.sleep(wait)
+                    now += wait
 
                 with self.camera_lock:
                     # Poll for any pending camera events (file downloads, etc.) first
-                    # This is quick and non-blocking (0ms timeout)
-                    self._poll_events_unlocked()
+                    # Non-blocking (0ms timeout) and rate-limited to the tether poll interval
+                    self._poll_events_unlocked(now)
                     
-                    camera_file = gp.check_result(gp.gp_camera_capture_preview(self.camera))
+                    camera_file = self._capture_preview_file()
                     file_data = gp.check_result(gp.gp_file_get_data_and_size(camera_file))
-                    # CRITICAL: Copy the memoryview to bytes immediately to avoid corruption
+                    # CRITICAL: Copy the memoryview immediately to avoid corruption
                     # The memoryview may reference camera internal buffers that get reused
                     if isinstance(file_data, memoryview):
-                        file_data = bytes(file_data)
+                        file_data = self._validate_trim_copy(file_data)
                 
                 # Process any queued downloads outside the lock
                 self._process_pending_downloads()
                 
                 # Success - reset error counter
                 self._io_error_counter = 0
-                self._last_capture_ts = time.time()
+                self._last_capture_ts = now
                 return file_data
                 
             except Exception as e:
@@ -149,6 +405,62 @@ class CameraHandler:
             self.lost_device = True
         return None
 
+    def _capture_preview_file(self):
+        """Capture a preview into the reused CameraFile. Call with camera_lock held.
+
+        Falls back to a new CameraFile per capture when the installed gphoto2
+        bindings do not accept a destination file.
+
+        Returns:
+            gp.CameraFile: File holding the preview data
+        """
+        camera_file = self._preview_file
+        if camera_file is not None:
+            try:
+                gp.check_result(gp.gp_file_clean(camera_file))
+                gp.check_result(gp.gp_camera_capture_preview(self.camera, camera_file, self.context))
+                return camera_file
+            except TypeError:
+                logger.debug("gp_camera_capture_preview does not accept a CameraFile; not reusing it")
+                self._preview_file = None
+        return gp.check_result(gp.gp_camera_capture_preview(self.camera))
+
+    def _copy_to_capture_buffer(self, data):
+        """Copy camera preview data into a pooled capture buffer.
+
+        Returns:
+            memoryview: View of the copied data inside the buffer
+        """
+        n = data.nbytes
+        try:
+            buf = self._free_capture_bufs.pop()
+        except IndexError:
+            buf = bytearray(self._capture_buf_size)
+        if n > len(buf):
+            self._capture_buf_size = max(self._capture_buf_size, n * 2)
+            buf = bytearray(self._capture_buf_size)
+        buf[:n] = data
+        return memoryview(buf)[:n]
+
+    def _validate_trim_copy(self, data):
+        """Validate SOI/EOI on the camera buffer and copy only the JPEG itself.
+
+        Trimming before the copy lets the capture-buffer copy double as the only
+        full pass over the frame; processing later finds it already ending in EOI.
+        Frames without valid markers are copied whole so processing can account
+        them as corrupt.
+
+        Returns:
+            memoryview: View of the copied data inside a pooled capture buffer
+        """
+        trimmed = self._trim_to_eoi(data)
+        return self._copy_to_capture_buffer(data if trimmed is None else trimmed)
+
+    def _release_capture_buffer(self, frame):
+        """Return the buffer behind a captured frame to the pool."""
+        if isinstance(frame, memoryview) and isinstance(frame.obj, bytearray):
+            self._free_capture_bufs.append(frame.obj)
+
     def _handle_capture_error(self, error, attempt, max_attempts):
         """
         Handle errors during preview capture.
@@ -156,51 +468,44 @@ class CameraHandler:
         Returns:
             bool: True if should retry, False otherwise
         """
-        err_str = str(error)
-        error_code = getattr(error, "code", None)
+        error_code = _gp_error_code(error)
         
         # I/O busy error (transient)
-        if "-110" in err_str or "I/O in progress" in err_str or error_code == -110:
+        if error_code in _GP_IO_BUSY:
             self._io_error_counter += 1
             logger.debug("I/O busy (-110) during preview capture, attempt %d/%d", attempt, max_attempts)
             return True
         
         # USB disconnect error (permanent)
-        if "-52" in err_str or "Could not find the requested device" in err_str:
-            logger.error("Device lost on USB: %s", err_str)
-            self.lost_device = True
-            try:
-                self.release()
-            except Exception:
-                pass
-            # Notify GUI/watcher about disconnect
-            try:
-                if hasattr(self, "_disconnect_callback") and self._disconnect_callback:
-                    self._disconnect_callback(False, err_str)
-            except Exception:
-                pass
+        if error_code in _GP_DEVICE_LOST:
+            logger.error("Device lost on USB: %s", error)
+            self._mark_device_lost(error)
             return False
 
         # Treat unspecified or fatal errors as disconnects as well
-        if "-1" in err_str or "Unspecified error" in err_str:
-            logger.exception("Fatal device error detected: %s — marking device lost", err_str)
-            self.lost_device = True
-            try:
-                self.release()
-            except Exception:
-                pass
-            # Notify GUI/watcher about disconnect
-            try:
-                if hasattr(self, "_disconnect_callback") and self._disconnect_callback:
-                    self._disconnect_callback(False, err_str)
-            except Exception:
-                pass
+        if error_code in _GP_FATAL:
+            logger.exception("Fatal device error detected: %s — marking device lost", error)
+            self._mark_device_lost(error)
             return False
 
         # Other errors
-        logger.error("Frame capture error: %s", err_str)
+        logger.error("Frame capture error: %s", error)
         return False
 
+    def _mark_device_lost(self, error):
+        """Release the camera after a device-level error and notify the disconnect callback."""
+        self.lost_device = True
+        try:
+            self.release()
+        except Exception:
+            pass
+        # Notify GUI/watcher about disconnect
+        try:
+            if hasattr(self, "_disconnect_callback") and self._disconnect_callback:
+                self._disconnect_callback(False, str(error))
+        except Exception:
+            pass
+
     @staticmethod
     def _trim_to_eoi(file_data):
         """Best-effort JPEG normalization: ensure SOI and trim at the last EOI.
@@ -208,44 +513,94 @@ class CameraHandler:
         Some cameras (or transports) append padding/metadata after the EOI marker,
         which causes strict EOI checks to fail even though the image decodes fine.
         This routine keeps data from SOI to the last EOI if both markers exist.
-        Returns trimmed bytes or None if markers are missing/too short.
+        Returns the input unchanged when it already ends at EOI, otherwise a
+        zero-copy memoryview slice, or None if markers are missing/too short.
         
-        Note: Memoryview conversion happens in _capture_preview_with_retry to
-        prevent buffer reuse corruption.
+        Note: Camera memoryviews are trimmed and copied into a capture buffer in
+        _validate_trim_copy to prevent buffer reuse corruption.
         """
-        if not isinstance(file_data, (bytes, bytearray)):
+        if not isinstance(file_data, (bytes, bytearray, memoryview)):
             return None
         if len(file_data) < 4:
             return None
 
         # Require a JPEG SOI at the start
-        if not file_data.startswith(b"\xff\xd8"):
+        if file_data[:2] != b"\xff\xd8":
             return None
 
+        # Common case: the frame already ends exactly at EOI, nothing to trim
+        if file_data[-2:] == b"\xff\xd9":
+            return file_data
+
         # Find the last End Of Image marker and trim anything after it
-        eoi_idx = file_data.rfind(b"\xff\xd9")
+        eoi_idx = CameraHandler._rfind_eoi(file_data)
         if eoi_idx == -1 or eoi_idx < 2:
             return None
 
-        return file_data[: eoi_idx + 2]
+        # Slice through a memoryview so bytes input is not copied either
+        return memoryview(file_data)[: eoi_idx + 2]
+
+    @staticmethod
+    def _rfind_eoi(file_data):
+        """Return the index of the last EOI marker (FF D9) in file_data, or -1.
+
+        The buffer is scanned backwards in _EOI_SCAN_BLOCK chunks using NumPy
+        comparisons, so trailing padding is skipped with SIMD instead of a scalar
+        byte loop while still stopping at the first block that holds a marker.
+        With Numba installed a JIT-compiled backward loop is used instead.
+        """
+        if HAS_NUMBA:
+            return int(_find_last_eoi(np.frombuffer(file_data, dtype=np.uint8)))
+
+        n = len(file_data)
+        if n < _EOI_SCAN_BLOCK and not isinstance(file_data, memoryview):
+            return file_data.rfind(b"\xff\xd9")
+
+        arr = np.frombuffer(file_data, dtype=np.uint8)
+        end = n
+        while end > 1:
+            start = max(0, end - _EOI_SCAN_BLOCK)
+            block = arr[start:end]
+            hits = np.flatnonzero((block[:-1] == 0xFF) & (block[1:] == 0xD9))
+            if hits.size:
+                return start + int(hits[-1])
+            # Overlap one byte so a marker straddling two blocks is still found
+            end = start + 1
+        return -1
 
     def _process_frame_to_base64(self, file_data):
         """
         Process raw preview data to base64 JPEG with rotation applied.
         
         Args:
-            file_data: Raw JPEG bytes from camera (already converted from memoryview)
+            file_data: Raw JPEG data from camera (bytes or capture buffer view)
             
         Returns:
             str: Base64-encoded JPEG, or None on error
         """
+        jpeg_data = self._process_frame_to_jpeg(file_data)
+        if jpeg_data is None:
+            return None
+        # Bare base64 string for Flet's Image.src (no data URI prefix to build)
+        return b64encode(jpeg_data).decode('ascii')
+
+    def _process_frame_to_jpeg(self, file_data):
+        """
+        Process raw preview data to JPEG with rotation applied.
+        
+        Args:
+            file_data: Raw JPEG data from camera (bytes or capture buffer view)
+            
+        Returns:
+            bytes-like: JPEG data (trimmed camera frame or re-encoded buffer), or None on error
+        """
         try:
             # Normalize JPEG by trimming to the last EOI; skip if markers are missing
             normalized = self._trim_to_eoi(file_data)
             if not normalized:
                 self._io_error_counter += 1
                 self._consecutive_corrupt_frames += 1
-                now = time.time()
+                now = time.monotonic()
                 if now - self._last_corrupt_frame_log > 1.0:
                     logger.warning("Incomplete or corrupted JPEG frame received; skipping frame")
                     self._last_corrupt_frame_log = now
@@ -256,12 +611,22 @@ class CameraHandler:
             if self.orientation == self.ORIENTATION_NORMAL:
                 self._io_error_counter = 0
                 self._consecutive_corrupt_frames = 0
-                b64_str = base64.b64encode(file_data).decode('utf-8')
-                return f"data:image/jpeg;base64,{b64_str}"
+                return file_data
+
+            # Lossless path: rotate in the JPEG (DCT) domain, no decode/encode
+            if HAS_LOSSLESS_ROTATE:
+                try:
+                    rotated = _jpeg_transformer.rotate(file_data, self._ROTATE_DEGREES[self.orientation])
+                except Exception:
+                    # Fall back to decode/rotate/encode, which also accounts corrupt frames
+                    rotated = None
+                if rotated is not None:
+                    self._io_error_counter = 0
+                    self._consecutive_corrupt_frames = 0
+                    return rotated
 
             # Slow path: decode, rotate, re-encode
-            data = np.frombuffer(file_data, dtype=np.uint8)
-            img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+            img = self._decode_jpeg(file_data)
             
             if img is None:
                 self._io_error_counter += 1
@@ -272,52 +637,118 @@ class CameraHandler:
             # Apply rotation
             img = self._apply_rotation(img)
             
-            # Compress to JPEG (quality 85 for better quality when rotating)
-            success, buffer = cv2.imencode('.jpg', img, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
-            if not success:
+            # Compress to JPEG with preview settings (Q75 4:2:0, close to the camera's own)
+            buffer = self._encode_jpeg(img, self._preview_jpeg_quality, self._preview_subsample)
+            if buffer is None:
                 logger.warning("Failed to encode frame to JPEG")
                 return None
             
-            # Convert to base64
             # reset intermittent error counter on success
             self._io_error_counter = 0
             self._consecutive_corrupt_frames = 0
-            # Return base64 string with data URI prefix for Flet Image control
-            b64_str = base64.b64encode(buffer).decode('utf-8')
-            return f"data:image/jpeg;base64,{b64_str}"
+            return buffer
             
         except Exception as e:
-            err_str = str(e)
+            # Decode/rotate/encode errors (NumPy, OpenCV, ctypes) carry no gphoto2
+            # code, and their text may contain e.g. "-1": classify by .code only
+            error_code = getattr(e, "code", None)
             # If we see device-level errors during processing, mark device lost and release
-            if "-52" in err_str or "Could not find the requested device" in err_str:
-                logger.error("Device lost during frame processing: %s", err_str)
-                self.lost_device = True
-                try:
-                    self.release()
-                except Exception:
-                    pass
-                try:
-                    if hasattr(self, "_disconnect_callback") and self._disconnect_callback:
-                        self._disconnect_callback(False, err_str)
-                except Exception:
-                    pass
+            if error_code in _GP_DEVICE_LOST:
+                logger.error("Device lost during frame processing: %s", e)
+                self._mark_device_lost(e)
                 return None
-            if "-1" in err_str or "Unspecified error" in err_str:
-                logger.exception("Fatal device error during frame processing: %s", err_str)
-                self.lost_device = True
-                try:
-                    self.release()
-                except Exception:
-                    pass
-                try:
-                    if hasattr(self, "_disconnect_callback") and self._disconnect_callback:
-                        self._disconnect_callback(False, err_str)
-                except Exception:
-                    pass
+            if error_code in _GP_FATAL:
+                logger.exception("Fatal device error during frame processing: %s", e)
+                self._mark_device_lost(e)
                 return None
             logger.exception("Frame processing error")
             return None
 
+    def _decode_jpeg(self, jpeg_data):
+        """
+        Decode JPEG data to a BGR image, using libjpeg-turbo when available.
+        
+        With libjpeg-turbo the image is decoded into a work buffer reused across
+        frames (valid until the next decode). Images larger than _preview_max_dim
+        are downscaled: by libjpeg-turbo's DCT scaling (1/2, 1/4, 1/8) during
+        decode, or with an INTER_AREA resize after an OpenCV decode.
+        
+        Returns:
+            np.ndarray: Decoded image, or None if the data could not be decoded
+        """
+        max_dim = self._preview_max_dim
+        if HAS_TURBOJPEG:
+            try:
+                width, height = _turbojpeg.decode_header(jpeg_data)[:2]
+                denom = 1
+                if max_dim:
+                    while denom < 8 and max(width, height) > max_dim * denom:
+                        denom *= 2
+                # Same rounding as libjpeg-turbo's TJSCALED()
+                shape = ((height + denom - 1) // denom, (width + denom - 1) // denom, 3)
+                self._bgr_buf = self._reuse_array(self._bgr_buf, shape)
+                return _turbojpeg.decode(
+                    jpeg_data, pixel_format=TJPF_BGR,
+                    scaling_factor=(1, denom) if denom > 1 else None,
+                    dst=self._bgr_buf
+                )
+            except Exception:
+                return None
+        # cv2.imdecode has no output-array argument in the Python bindings
+        data = np.frombuffer(jpeg_data, dtype=np.uint8)
+        img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        if img is not None and max_dim:
+            height, width = img.shape[:2]
+            if max(width, height) > max_dim:
+                scale = max_dim / max(width, height)
+                new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                img = cv2.resize(img, new_size, interpolation=cv2.INTER_AREA)
+        return img
+
+    def _encode_jpeg(self, img, quality, subsample="420"):
+        """
+        Encode a BGR image to JPEG, using libjpeg-turbo when available.
+        
+        With libjpeg-turbo the JPEG is written into an output buffer reused across
+        frames (valid until the next encode).
+        
+        Args:
+            img: BGR image (numpy array)
+            quality: JPEG quality (1-100)
+            subsample: Chroma subsampling, "444", "422" or "420"
+            
+        Returns:
+            bytes-like: Encoded JPEG data, or None on failure
+        """
+        if HAS_TURBOJPEG:
+            try:
+                height, width = img.shape[:2]
+                # Worst-case JPEG size (libjpeg-turbo's tj3JPEGBufSize bound for 4:4:4)
+                bound = ((width + 15) & ~15) * ((height + 15) & ~15) * 6 + 2048
+                if self._encode_buf is None or len(self._encode_buf) < bound:
+                    self._encode_buf = bytearray(bound)
+                buf, size = _turbojpeg.encode(
+                    img, quality=quality, pixel_format=TJPF_BGR,
+                    jpeg_subsample=_TJ_SUBSAMPLE.get(subsample, TJSAMP_420),
+                    dst=self._encode_buf
+                )
+                return memoryview(buf)[:size]
+            except Exception:
+                return None
+        params = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+        factor = _CV2_SUBSAMPLE.get(subsample)
+        if factor is not None:
+            params += [int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR), factor]
+        success, buffer = cv2.imencode('.jpg', img, params)
+        return buffer if success else None
+
+    @staticmethod
+    def _reuse_array(buf, shape):
+        """Return buf if it already has the given shape, else a new uint8 array."""
+        if buf is None or buf.shape != shape:
+            return np.empty(shape, dtype=np.uint8)
+        return buf
+
     def _apply_rotation(self, img):
         """
         Apply rotation to image based on current orientation setting.
@@ -326,16 +757,32 @@ class CameraHandler:
             img: OpenCV image (numpy array)
             
         Returns:
-            np.ndarray: Rotated image
+            np.ndarray: Rotated, C-contiguous image (encoders take the data
+                pointer and row pitch, so reversed-stride views cannot be passed)
         """
         if self.orientation == self.ORIENTATION_180:
-            return cv2.rotate(img, cv2.ROTATE_180)
+            self._rot_buf = self._reuse_array(self._rot_buf, img.shape)
+            return cv2.rotate(img, cv2.ROTATE_180, dst=self._rot_buf)
         elif self.orientation == self.ORIENTATION_270:
-            return cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
+            return self._rotate_90(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
         elif self.orientation == self.ORIENTATION_90:
-            return cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
+            return self._rotate_90(img, cv2.ROTATE_90_CLOCKWISE)
         return img
 
+    def _rotate_90(self, img, rotate_code):
+        """Rotate by 90°, on the GPU through OpenCV's OpenCL T-API when available.
+
+        The CPU path writes into a work buffer reused across frames.
+        """
+        if _USE_OPENCL:
+            try:
+                return cv2.rotate(cv2.UMat(img), rotate_code).get()
+            except Exception:
+                pass
+        height, width = img.shape[:2]
+        self._rot_buf = self._reuse_array(self._rot_buf, (width, height) + img.shape[2:])
+        return cv2.rotate(img, rotate_code, dst=self._rot_buf)
+
     def set_orientation(self, orientation_code):
         """
         Set manual rotation orientation.
@@ -347,6 +794,24 @@ class CameraHandler:
                                self.ORIENTATION_180, self.ORIENTATION_270):
             self.orientation = orientation_code
 
+    def set_display_size(self, width, height):
+        """
+        Limit rotated preview frames to the size they are displayed at.
+        
+        Frames that have to be decoded and re-encoded are downscaled to the
+        display's long side (with 20% headroom) instead of the fixed default.
+        
+        Args:
+            width: Display area width in pixels
+            height: Display area height in pixels
+        """
+        try:
+            long_side = max(int(width), int(height))
+        except (TypeError, ValueError):
+            return
+        if long_side > 0:
+            self._preview_max_dim = int(long_side * 1.2)
+
     def release(self):
         """Release camera resources and reset state."""
         # Ensure tethering is stopped when releasing the device
@@ -355,6 +820,12 @@ class CameraHandler:
         except Exception:
             pass
 
+        # Let an in-flight preview capture finish before exiting the camera
+        try:
+            self._stop_capture_thread()
+        except Exception:
+            pass
+
         if self.camera:
             # Try graceful exit
             try:
@@ -375,6 +846,7 @@ class CameraHandler:
         # Reset state
         self.camera = None
         self.context = None
+        self._preview_file = None
         self.is_streaming = False
         self.lost_device = False
         self.orientation = self.ORIENTATION_NORMAL
@@ -420,44 +892,66 @@ class CameraHandler:
         """Enable tethering. Events are polled inline during preview capture.
 
         callback(path, filetype) will be invoked when a file is saved locally.
+        poll_interval is the minimum number of seconds between event polls.
         """
         self._tether_callback = callback
+        self._tether_poll_interval = poll_interval
+        self._last_event_poll_ts = 0.0
         self._tether_running = True
         logger.info("Tether: enabled (download dir=%s)", self._tether_download_dir)
 
     def stop_tether(self):
-        """Disable tethering."""
+        """Disable tethering and park the preview capture thread.
+
+        The capture thread also runs the event polling; the next get_frame_*()
+        call restarts it if live view continues.
+        """
         self._tether_running = False
+        self._stop_capture_thread()
 
     def set_tether_callback(self, callback):
         """Register a callback invoked when tethered files are saved locally."""
         self._tether_callback = callback
 
-    def _poll_events_unlocked(self):
+    def _poll_events_unlocked(self, now=None):
         """Poll for camera events without blocking. Must be called with camera_lock held.
         
         Downloads any new files detected via FILE_ADDED events.
+        
+        Args:
+            now: Current time.monotonic() value, if the caller already has one
         """
         if not getattr(self, '_tether_running', False):
             return
         if self.camera is None:
             return
+
+        # Skip the extra USB round-trip on most frames; capture stays one transfer
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_event_poll_ts < self._tether_poll_interval:
+            return
+        self._last_event_poll_ts = now
         
-        # Drain all pending events with 0ms timeout (non-blocking)
+        # Drain pending events with 0ms timeout (non-blocking), at most
+        # _max_events_per_poll per call so lock hold time stays bounded; any
+        # remaining events are picked up on the next poll
+        wait_for_event = self.camera.wait_for_event
+        event_timeout = gp.GP_EVENT_TIMEOUT
+        event_file_added = gp.GP_EVENT_FILE_ADDED
         try:
-            while True:
-                evt = self.camera.wait_for_event(0)  # 0ms = immediate return
-                if isinstance(evt, (tuple, list)) and len(evt) >= 2:
-                    event_type, event_data = evt[0], evt[1]
-                else:
+            for _ in range(self._max_events_per_poll):
+                evt = wait_for_event(0)  # 0ms = immediate return
+                if not isinstance(evt, (tuple, list)) or len(evt) < 2:
                     break
+                event_type, event_data = evt[0], evt[1]
                 
                 # Timeout means no more events
-                if event_type == gp.GP_EVENT_TIMEOUT:
+                if event_type == event_timeout:
                     break
                 
                 # Handle FILE_ADDED
-                if event_type == gp.GP_EVENT_FILE_ADDED:
+                if event_type == event_file_added:
                     folder = getattr(event_data, 'folder', None)
                     filename = getattr(event_data, 'name', None)
                     if not folder or not filename:
@@ -467,45 +961,45 @@ class CameraHandler:
                     
                     if filename:
                         # Queue download (will be processed after releasing lock)
-                        if not hasattr(self, '_pending_downloads'):
-                            self._pending_downloads = []
-                        self._pending_downloads.append((folder, filename))
+                        self._pending_folders.append(folder)
+                        self._pending_filenames.append(filename)
         except Exception:
             pass
 
     def _process_pending_downloads(self):
         """Download any files queued by _poll_events_unlocked. Called outside the lock."""
-        if not hasattr(self, '_pending_downloads') or not self._pending_downloads:
-            return
-        
-        downloads = self._pending_downloads
-        self._pending_downloads = []
-        
-        for folder, filename in downloads:
+        while self._pending_folders:
+            folder = self._pending_folders.popleft()
+            filename = self._pending_filenames.popleft()
             logger.info("Tether: FILE_ADDED -> folder=%s, filename=%s", folder, filename)
             ext = os.path.splitext(filename)[1].lower()
             filetype = 'arw' if ext in ('.arw', '.nef', '.cr2', '.rw2', '.raf') else 'jpg'
             
-            path = self._download_file(folder, filename)
-            if path and self._tether_callback:
-                try:
-                    logger.debug("Tether: invoking callback for %s", path)
-                    self._tether_callback(path, filetype)
-                except Exception as e:
-                    logger.exception("Tether: callback failed")
-            elif path:
-                logger.warning("Tether: WARNING - no callback registered for %s", path)
+            # Only the USB read holds camera_lock; the disk write runs on the pool
+            camera_file, data = self._camera_read(folder, filename)
+            if data is None:
+                continue
+            self._get_download_executor().submit(
+                self._write_download, camera_file, data, filename, filetype
+            )
 
-    def _download_file(self, folder, filename):
-        """Download a single file from camera to the tether download directory.
+    def _get_download_executor(self):
+        """Return the single writer thread that saves tethered files to disk.
 
-        Returns the local path on success or None on failure.
+        One worker keeps writes and tether callbacks sequential and in arrival
+        order, so a RAW+JPEG pair is always seen complete and in camera order.
+        """
+        if self._download_executor is None:
+            self._download_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tether-write")
+        return self._download_executor
+
+    def _camera_read(self, folder, filename):
+        """Read a file from the camera into memory under camera_lock.
+
+        Returns:
+            tuple: (camera_file, data) where data is a memoryview kept valid by
+                camera_file, or (None, None) on failure
         """
-        try:
-            os.makedirs(self._tether_download_dir, exist_ok=True)
-        except Exception:
-            pass
-        target_path = os.path.join(self._tether_download_dir, filename)
         try:
             with self.camera_lock:
                 # Create a CameraFile object to receive the data
@@ -513,12 +1007,53 @@ class CameraHandler:
                 gp.check_result(
                     gp.gp_camera_file_get(self.camera, folder, filename, gp.GP_FILE_TYPE_NORMAL, camera_file, self.context)
                 )
-                gp.check_result(gp.gp_file_save(camera_file, target_path))
+                data = gp.check_result(gp.gp_file_get_data_and_size(camera_file))
+            return camera_file, data
+        except Exception as e:
+            logger.exception("Tether download failed for %s", filename)
+            return None, None
+
+    def _write_download(self, camera_file, data, filename, filetype):
+        """Write downloaded file data to the tether directory and notify the callback.
+
+        Runs on the download executor; camera_file keeps data's buffer alive.
+        """
+        path = self._download_file(data, filename)
+        if path and self._tether_callback:
+            try:
+                logger.debug("Tether: invoking callback for %s", path)
+                self._tether_callback(path, filetype)
+            except Exception as e:
+                logger.exception("Tether: callback failed")
+        elif path:
+            logger.warning("Tether: WARNING - no callback registered for %s", path)
+
+    def _download_file(self, data, filename):
+        """Save downloaded file data to the tether download directory.
+
+        Returns the local path on success or None on failure.
+        """
+        try:
+            os.makedirs(self._tether_download_dir, exist_ok=True)
+        except Exception:
+            pass
+        target_path = os.path.join(self._tether_download_dir, filename)
+        # Write under a temporary name and move it into place, so nothing scanning
+        # the directory can pick up a partially written file
+        tmp_path = target_path + '.part'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, target_path)
 
             logger.info("Tether: downloaded %s -> %s", filename, target_path)
             return target_path
         except Exception as e:
             logger.exception("Tether download failed for %s", filename)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return None
 
 
@@ -553,3 +1088,11 @@ class CameraHandler:
                 getattr(gp_module, func_name)(obj)
         except Exception:
             pass
+
+
+# Optional: lossless live view rotation (needs PyTurboJPEG and libjpeg-turbo 3.x)
+try:
+    _jpeg_transformer = JpegTransformer() if HAS_TURBOJPEG else None
+except Exception:
+    _jpeg_transformer = None
+HAS_LOSSLESS_ROTATE = _jpeg_transformer is not None
@@ -6,17 +6,282 @@ import flet as ft
 import flet.canvas as cv
 import cv2
 import numpy as np
-import base64
+import binascii
 import os
 import threading
 import time
 import asyncio
 import logging
+import operator
+import re
+import struct
+import functools
+from collections import OrderedDict
+from types import MappingProxyType
 from translations import t, set_locale, get_system_locale, is_supported
 from image_preview import ImagePreviewManager, CachedImage
 
 logger = logging.getLogger(__name__)
 
+# Optional: libjpeg-turbo (PyTurboJPEG) to read JPEG dimensions from the header alone
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg = TurboJPEG()
+    HAS_TURBOJPEG = True
+except Exception:
+    # Package missing or libturbojpeg shared library could not be loaded
+    _turbojpeg = None
+    HAS_TURBOJPEG = False
+
+
+# Key event normalization: key and modifier names that mean Shift, and flag values read as True
+# (str(True).lower() == 'true', so bool flags need no special case)
+_SHIFT_MODIFIER_STRINGS = frozenset({'shift', 'shiftleft', 'shiftright'})
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+# Deletes spaces, hyphens and quotes from key names ('Arrow Left' -> 'ArrowLeft')
+_KEY_TRANS = str.maketrans('', '', " -'\"")
+
+# Keyboard shortcuts: rotation keys 1-4 -> degrees, duration keys 8/9/0 -> duration button value.
+# Read-only views: they seed _build_key_dispatch() and are never rebuilt per key press.
+_ROTATION_KEYS = MappingProxyType({
+    '1': 0, 'digit1': 0, 'numpad1': 0,
+    '2': 90, 'digit2': 90, 'numpad2': 90,
+    '3': 180, 'digit3': 180, 'numpad3': 180,
+    '4': 270, 'digit4': 270, 'numpad4': 270,
+})
+_DURATION_KEYS = MappingProxyType({
+    '8': '3', 'digit8': '3', 'numpad8': '3',
+    '9': '10', 'digit9': '10', 'numpad9': '10',
+    '0': 'inf', 'digit0': 'inf', 'numpad0': 'inf',
+})
+# Key event fields read on every key press, and window bounds saved before full-screen;
+# attrgetter objects look the interned names up in C
+_GET_KEY_ATTRS = operator.attrgetter('key', 'shift')
+_WIN_BOUND_FIELDS = ('width', 'height', 'left', 'top', 'maximized')
+_GET_WIN_BOUNDS = operator.attrgetter(*_WIN_BOUND_FIELDS)
+# Same bounds under the older page.window_* attribute names
+_PAGE_WINDOW_BOUND_FIELDS = ('window_width', 'window_height', 'window_x', 'window_y')
+# Guide color name -> stroke color for the guide Paint
+_GUIDE_PAINT_COLORS = {
+    "white": ft.Colors.WHITE,
+    "green": ft.Colors.GREEN,
+    "red": ft.Colors.RED,
+    "yellow": getattr(ft.Colors, 'YELLOW', ft.Colors.ORANGE),
+    "blue": getattr(ft.Colors, 'BLUE', ft.Colors.INDIGO),
+    "black": ft.Colors.BLACK,
+}
+# Selection-state borders shared by the toolbar buttons. Borders are immutable
+# values, so one instance each replaces a fresh ft.border.all() per restyle.
+_BORDER_IDLE = ft.border.all(1, ft.Colors.GREY_700)
+_BORDER_SELECTED = ft.border.all(2, ft.Colors.BLUE_400)
+_BORDER_GUIDE_ACTIVE = ft.border.all(1, ft.Colors.AMBER_400)
+_BORDER_COLOR_ACTIVE = ft.border.all(2, ft.Colors.WHITE)
+# Matching backgrounds: selected option in a button group / enabled toggle button
+_BG_SELECTED = "rgba(100,100,255,0.4)"
+_BG_TOGGLE_ON = "rgba(100,100,255,0.18)"
+# Status text color, text opacity, icon and icon color of the shared status line in
+# preview mode and while streaming (the text itself comes from t() at use)
+_PREVIEW_STATUS_STYLE = (ft.Colors.GREEN_400, 0.95, ft.Icons.PHOTO_CAMERA, ft.Colors.GREEN_400)
+_STREAMING_STATUS_STYLE = (ft.Colors.AMBER_400, 0.7, ft.Icons.VIDEOCAM, ft.Colors.AMBER_400)
+# Known hardware disconnect indicators in gphoto2 error text. Plain substring semantics,
+# as before: "-1" also covers "-105" and any other code starting with -1.
+_DISCONNECT_RE = re.compile(r"-52|-1|Could not find the requested device|Unspecified error|Unknown model")
+# Quiet period after the last canvas resize event before guides are redrawn (~1 frame)
+_RESIZE_DEBOUNCE_S = 0.016
+# Memoized guide shape lists kept by _get_cached_guide_shapes() (LRU)
+_GUIDE_SHAPE_CACHE_SIZE = 64
+# Preview duration button value -> seconds
+_PREVIEW_DURATIONS = {'3': 3.0, '10': 10.0, 'inf': float('inf')}
+# EXIF orientation (1, 3, 6, 8) -> live view rotation in degrees
+_EXIF_ORIENTATION_DEGREES = {1: 0, 3: 180, 6: 270, 8: 90}
+
+
+# 1x1 black grayscale PNG (67 bytes) shown until the first live frame arrives;
+# BoxFit.CONTAIN stretches it, so nothing needs to be encoded at startup
+_PLACEHOLDER_IMAGE = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00"
+    b"\x00:~\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00"
+    b"\x00IEND\xaeB`\x82"
+)
+
+
+# Golden spiral polyline on the unit square, shared by all fibonacci guide variants
+_FIBONACCI_UNIT_POINTS = None
+
+
+def _fibonacci_unit_points():
+    """
+    Return the golden spiral polyline normalized to the unit square.
+
+    The spiral is built from quarter arcs on a perfect Golden Rectangle
+    (PHI x 1.0) and divided by (PHI, 1.0), so callers only scale it to the
+    display size. Computed once; arc points come from one NumPy expression.
+
+    Returns:
+        Read-only (N, 2) float array of (x, y) points in 0..1
+    """
+    global _FIBONACCI_UNIT_POINTS
+    if _FIBONACCI_UNIT_POINTS is not None:
+        return _FIBONACCI_UNIT_POINTS
+
+    # 1. Konfiguracja Wirtualnego Płótna (Idealny Złoty Prostokąt)
+    # Pracujemy na liczbach zmiennoprzecinkowych 0.0 -> PHI
+    PHI = 1.61803398875
+
+    # Ustalamy wirtualne granice.
+    # Zakładamy orientację Landscape (poziomą), bo to standard w aparatach.
+    v_left, v_top = 0.0, 0.0
+    v_right, v_bottom = PHI, 1.0
+
+    iterations = 16  # Wystarczająco, by zejść do niewidocznych detali
+    segments = 10
+    centers = np.empty((iterations, 2))
+    sides = np.empty(iterations)
+    starts = np.empty(iterations)
+
+    # Kierunek: 0=Lewo, 1=Góra, 2=Prawo, 3=Dół
+    for i in range(iterations):
+        # W idealnym Złotym Prostokącie ten algorytm NIGDY się nie zatnie.
+        side = min(v_right - v_left, v_bottom - v_top)
+        step = i % 4
+        if step == 0:  # Lewy kwadrat (łuk w górę)
+            centers[i] = (v_left + side, v_top + side)
+            starts[i] = 180
+            v_left += side
+        elif step == 1:  # Górny kwadrat (łuk w prawo)
+            centers[i] = (v_left, v_top + side)
+            starts[i] = 270
+            v_top += side
+        elif step == 2:  # Prawy kwadrat (łuk w dół)
+            centers[i] = (v_right - side, v_top)
+            starts[i] = 0
+            v_right -= side
+        else:  # Dolny kwadrat (łuk w lewo)
+            centers[i] = (v_right, v_bottom - side)
+            starts[i] = 90
+            v_bottom -= side
+        sides[i] = side
+
+    # Generowanie punktów w przestrzeni wirtualnej: każdy łuk to 90 stopni
+    ang = np.radians(starts[:, None] + np.linspace(0.0, 90.0, segments + 1)[None, :])
+    xs = centers[:, 0:1] + sides[:, None] * np.cos(ang)
+    ys = centers[:, 1:2] + sides[:, None] * np.sin(ang)
+    pts = np.stack([xs.ravel() / PHI, ys.ravel()], axis=-1)
+    pts.flags.writeable = False
+    _FIBONACCI_UNIT_POINTS = pts
+    return pts
+
+
+# JPEG start-of-frame markers (SOF0..SOF15 without DHT, JPG and DAC), which carry the image size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Bytes read from an image file when looking for its size header (covers EXIF/APP segments)
+_HEADER_PROBE_BYTES = 128 * 1024
+
+
+def _parse_image_header_size(data):
+    """
+    Read (width, height) from a JPEG SOF segment or the PNG IHDR chunk.
+
+    Only marker headers are walked, so no pixel data is decoded.
+
+    Args:
+        data: Encoded image (bytes, bytearray or memoryview)
+
+    Returns:
+        tuple: (width, height), or None if the header is not recognized
+    """
+    n = len(data)
+    if n >= 24 and bytes(data[:8]) == _PNG_SIGNATURE:
+        width, height = struct.unpack_from('>II', data, 16)
+        return (width, height)
+    if n < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 <= n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Standalone markers without a length field
+            i += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from('>HH', data, i + 5)
+            return (width, height)
+        if marker in (0xD9, 0xDA):
+            # End of image / start of scan before any SOF
+            return None
+        i += 2 + struct.unpack_from('>H', data, i + 2)[0]
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _triangle_feet(w, h):
+    """
+    Feet of the perpendiculars from (w, 0) and (0, h) onto the (0, 0)-(w, h) diagonal.
+
+    Depends only on the display size, so results are cached per (w, h); the
+    caller builds the line geometry from them.
+
+    Returns:
+        tuple: (px1, py1, px2, py2)
+    """
+    # Calculate the perpendicular distance from corner to main diagonal
+    # For a rectangle with width w and height h, the main diagonal goes
+    # from (0,0) to (w,h). The perpendicular from (w,0) hits the diagonal
+    # at a specific point.
+
+    # The distance along the diagonal where the perpendicular from (w,0) meets it:
+    # Using projection formula: the foot of perpendicular from point P to line AB
+    # For diagonal from A(0,0) to B(w,h), perpendicular from P(w,0):
+    # dst = (w*w) / sqrt(w*w + h*h) ... but we need the actual intersection point
+
+    # The perpendicular from (w,0) to line y = (h/w)*x meets at:
+    # x = w*w / (w + h*h/w) = w^2 / (w + h^2/w) = w^3 / (w^2 + h^2)
+    # y = h * x / w
+
+    # Actually, for harmonious triangles, we compute dst as:
+    # dst = height * cos(atan(width/height)) / cos(atan(height/width))
+    # This gives the x-coordinate where the perpendicular from top-right corner
+    # meets the left edge (extended if needed)
+
+    # Simpler: compute intersection of perpendicular with diagonal
+    diag_len_sq = w * w + h * h
+
+    # Perpendicular from (w, 0) to diagonal y = (h/w)*x
+    # Foot of perpendicular: t = (w*w + 0*h) / (w*w + h*h) = w*w / diag_len_sq
+    # Point on diagonal: (t*w, t*h) = (w^3/diag_len_sq, w^2*h/diag_len_sq)
+    px1 = (w * w * w) / diag_len_sq
+    py1 = (w * w * h) / diag_len_sq
+
+    # Perpendicular from (0, h) to diagonal
+    # Foot of perpendicular: t = (0*w + h*h) / diag_len_sq = h*h / diag_len_sq  
+    # Point on diagonal: (t*w, t*h) = (w*h^2/diag_len_sq, h^3/diag_len_sq)
+    px2 = (w * h * h) / diag_len_sq
+    py2 = (h * h * h) / diag_len_sq
+    return px1, py1, px2, py2
+
+
+def _set_if_changed(obj, attr, value):
+    """
+    Assign obj.attr = value only when it differs from the current value.
+
+    Flet serializes every assigned property on the next update, so skipping equal
+    values keeps no-op state transitions off the wire.
+
+    Returns:
+        bool: True if the attribute was changed
+    """
+    if getattr(obj, attr, None) == value:
+        return False
+    setattr(obj, attr, value)
+    return True
+
 
 class LiveViewGUI:
     """Main GUI controller for the live view application."""
@@ -31,6 +296,14 @@ class LiveViewGUI:
                 the ImagePreviewManager will pick a sensible platform-specific default.
         """
         self.camera = camera_handler
+        # Rotation degrees <-> camera orientation codes, built once from the handler's constants
+        self._orientation_by_deg = {
+            0: camera_handler.ORIENTATION_NORMAL,
+            90: camera_handler.ORIENTATION_90,
+            180: camera_handler.ORIENTATION_180,
+            270: camera_handler.ORIENTATION_270,
+        }
+        self._deg_by_orientation = {code: deg for deg, code in self._orientation_by_deg.items()}
         # Preview manager lets the GUI show and navigate captured images
         try:
             self._preview_manager = ImagePreviewManager(download_dir=download_dir)
@@ -39,30 +312,63 @@ class LiveViewGUI:
             self._preview_manager = ImagePreviewManager()
 
         self.streaming_event = threading.Event()
+        # Set when streaming ends, so the frame thread's waits return immediately
+        self._stream_stop_event = threading.Event()
         self.frame_thread = None
         
         # Execution loop (captured in build) for scheduling UI updates from background threads
         self._loop = None
-        # Keep frame lock in case of future buffering needs
+        # Latest-frame slot handed from the frame thread to the UI loop (guarded by
+        # _frame_lock); at most one UI update is scheduled at a time and it always
+        # applies the newest frame, so a slow UI never builds a backlog
         self._frame_lock = threading.Lock()
+        self._pending_frame = None
+        self._pending_frame_size = None  # (width, height) read on the frame thread, if any
+        self._ui_update_pending = False
+        # Timer-driven display path (_start_update_timer): newest frame and its thread
+        self._latest_frame = None
+        self._update_timer = None
+        self._update_stop = threading.Event()
+        # Controls changed since the last batched update, see _mark_dirty()
+        self._dirty_lock = threading.Lock()
+        self._dirty_controls = {}
+        self._dirty_flush_scheduled = False
         # Display throttling to avoid flicker and overload (seconds)
         self._display_min_interval = 1.0 / 15.0  # 15 FPS
-        self._last_display_ts = 0.0
+        self._next_display_deadline = 0.0  # time.monotonic() when the next frame may be shown
 
         # Preview mode state
         self._preview_mode = False  # True when showing captured image preview
-        self._preview_timer = None  # Timer for auto-return to live view
+        self._preview_timer = None  # asyncio TimerHandle for auto-return to live view
         self._preview_timeout = 3.0  # Seconds before returning to live view
         self._preview_duration = 3.0  # Current duration setting: 3.0, 10.0, or float('inf')
-        self._last_user_interaction = 0.0  # Timestamp of last keyboard navigation
+        self._preview_deadline = 0.0  # time.monotonic() at which the preview auto-hides
         
         # Composition guide state
         self._guide_type = "none"  # none, thirds, golden, grid, diagonal, center, fibonacci, fibonacci_vflip, fibonacci_hflip, fibonacci_both, triangles, triangles_flip
         self._guide_color = "white"  # white, green, red, yellow, blue, black
+        # Pending debounced guide redraws per canvas, see _debounce_guide_update()
+        self._resize_timers = {}
+        # Guide color -> ft.Paint, see _get_guide_paint()
+        self._guide_paint_cache = {}
+        # Memoized guide shape lists, see _get_cached_guide_shapes()
+        self._guide_shape_cache = OrderedDict()
         self._guide_types = ["none", "thirds", "golden", "grid", "diagonal", "center", "fibonacci", "fibonacci_vflip", "fibonacci_hflip", "fibonacci_both", "triangles", "triangles_flip"]
         # Order chosen to display in two rows: top (white, green, red), bottom (yellow, blue, black)
         self._guide_colors = ["white", "green", "red", "yellow", "blue", "black"]
         
+        # Left/right Shift held state, tracked independently of event flags
+        # (workaround for macOS/Flet uppercase key issue)
+        self._shift_l = False
+        self._shift_r = False
+        # (monotonic time, key, shift) of the last handled key press, for duplicate suppression
+        self._last_key_event = (float('-inf'), None, None)
+        # Key name -> handler(shift_pressed), see _build_key_dispatch(): shortcuts match
+        # the lower-cased key name, navigation keys the name with spaces/hyphens removed
+        self._key_dispatch, self._nav_key_dispatch = self._build_key_dispatch()
+        # Guide type -> geometry creator, see _build_guide_dispatch()
+        self._guide_dispatch = self._build_guide_dispatch()
+
         # Image preview manager (callback set in _start_stream after method is available)
         self._preview_manager = ImagePreviewManager()
 
@@ -70,20 +376,72 @@ class LiveViewGUI:
         self.page = None
         self.img_control = None
         self.status_text = None
+        self.rotate_control = None
+        self.keyboard_listener = None
+
+        # Last live frame shown and its intrinsic (width, height); the size is probed
+        # from the first frame of each stream and reset in _start_stream()
+        self._current_frame = None
+        self._current_frame_size = None
         
         # Preview overlay elements (initialized in _create_ui_elements)
         self._preview_overlay = None
         self._preview_image = None
         self._preview_filename_text = None
         self._preview_counter_text = None
+        self._preview_filename_container = None
+        self._preview_counter_container = None
+        # Status snapshot taken when entering preview mode and restored by _hide_preview();
+        # the same dict is refilled each time, _prev_status_valid says whether it holds one
+        self._prev_status = {'value': None, 'color': None, 'opacity': None, 'icon_name': None, 'icon_color': None}
+        self._prev_status_valid = False
+        # Intrinsic (width, height) of the shown preview image, or None if unknown
+        self._current_preview_size = None
+
+        # Guide canvases, their laid-out sizes and the guide/rotation controls
+        # (created in _create_ui_elements); the guide update path reads these directly
+        self._guide_canvas = None
+        self._guide_canvas_width = 0
+        self._guide_canvas_height = 0
+        self._preview_guide_canvas = None
+        self._preview_guide_canvas_width = 0
+        self._preview_guide_canvas_height = 0
+        self._guide_type_buttons = {}
+        self._guide_color_buttons = {}
+        self._active_rotation = 0
+        self._autorotate_enabled = True
+        # (button, enabled) last rendered by _update_autorotate_ui()
+        self._last_autorotate_ui_state = None
+        # Toolbar toggle buttons, located in _create_ui_elements()
+        self._autorotate_btn = None
+        self._fullscreen_btn = None
 
         # Saved window bounds for toggling full-screen mode
         self._saved_window_bounds = None
 
+        # Resolved translations for argument-free keys on hot paths, see _tc();
+        # cleared in build() once the locale is chosen
+        self._t_cache = {}
+
         # Help overlay (toggle with 'H')
         self._help_overlay = None
         self._help_text = None
+        self._help_visible = False
+
 
+    def _cleanup_async(self):
+        """Scan the download folder on a background thread.
+
+        The preview manager fills its cache under its own lock, so navigation
+        simply sees the images loaded so far.
+        """
+        def _cleanup():
+            try:
+                self._preview_manager.cleanup_download_folder()
+            except Exception as e:
+                logger.warning("Failed to cleanup download folder: %s", e)
+
+        threading.Thread(target=_cleanup, name="download-folder-scan", daemon=True).start()
 
     def build(self, page: ft.Page):
         """
@@ -106,12 +464,8 @@ class LiveViewGUI:
                         set_locale(lang)
         except Exception:
             pass
-        
-        # Clean up download folder on startup
-        try:
-            self._preview_manager.cleanup_download_folder()
-        except Exception as e:
-            logger.warning(f"Failed to cleanup download folder: {e}")
+        # Locale may have changed: drop translations resolved under the previous one
+        self._t_cache.clear()
         
         # Capture the running asyncio loop for scheduling UI updates from threads
         try:
@@ -132,6 +486,9 @@ class LiveViewGUI:
         
         page.update()
 
+        # Load existing downloads into the preview cache without delaying the first paint
+        self._cleanup_async()
+
         # Start camera watcher (auto-start enabled by design)
         try:
             self.camera.start_watch(callback=self._on_camera_detected)
@@ -165,9 +522,9 @@ class LiveViewGUI:
     def _create_ui_elements(self):
         """Create all UI controls."""
         # Video preview with placeholder
-        placeholder_b64 = self._create_placeholder_image()
+        placeholder_image = _PLACEHOLDER_IMAGE
         self.img_control = ft.Image(
-            src=placeholder_b64,
+            src=placeholder_image,
             fit=ft.BoxFit.CONTAIN,
             gapless_playback=True,
             width=float("inf"),
@@ -199,8 +556,6 @@ class LiveViewGUI:
         ROT_BTN_HEIGHT = 32
 
         def _make_rotation_btn(val, label, tooltip):
-            def _on_click(e):
-                self._handle_rotation_click(val)
             btn = ft.Container(
                 content=ft.Text(label, size=14, color=ft.Colors.WHITE, weight=ft.FontWeight.W_500),
                 width=ROT_BTN_WIDTH,
@@ -209,7 +564,8 @@ class LiveViewGUI:
                 tooltip=tooltip,
                 border=ft.border.all(1, ft.Colors.GREY_700),
                 border_radius=6,
-                on_click=_on_click,
+                data=val,
+                on_click=self._on_rotation_btn_click,
             )
             self._rotation_buttons[val] = btn
             return btn
@@ -269,8 +625,6 @@ class LiveViewGUI:
         DUR_BTN_HEIGHT = 32
 
         def _make_duration_btn(val, label, tooltip):
-            def _on_click(e):
-                self._handle_duration_click(val)
             btn = ft.Container(
                 content=ft.Text(label, size=14, color=ft.Colors.WHITE, weight=ft.FontWeight.W_500),
                 width=DUR_BTN_WIDTH,
@@ -279,7 +633,8 @@ class LiveViewGUI:
                 tooltip=tooltip,
                 border=ft.border.all(1, ft.Colors.GREY_700),
                 border_radius=6,
-                on_click=_on_click,
+                data=val,
+                on_click=self._on_duration_btn_click,
             )
             self._duration_buttons[val] = btn
             return btn
@@ -300,8 +655,6 @@ class LiveViewGUI:
         BTN_SIZE = 36
 
         def _make_type_btn(val, label, tooltip):
-            def _on_click(e):
-                self._set_active_guide_type(val)
             btn = ft.Container(
                 content=ft.Text(label, size=14, color=ft.Colors.WHITE),
                 width=BTN_SIZE,
@@ -310,16 +663,14 @@ class LiveViewGUI:
                 tooltip=tooltip,
                 border=ft.border.all(1, ft.Colors.GREY_700),
                 border_radius=6,
-                on_click=_on_click,
+                data=val,
+                on_click=self._on_guide_type_click,
             )
             self._guide_type_buttons[val] = btn
             return btn
 
         # Fibonacci popup menu button with 4 variants
         def _make_fibonacci_popup():
-            def _on_fib_select(e):
-                self._set_active_guide_type(e.control.data)
-            
             popup_btn = ft.PopupMenuButton(
                 content=ft.Container(
                     content=ft.Text("φ", size=16, color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD),
@@ -331,10 +682,10 @@ class LiveViewGUI:
                 ),
                 tooltip=t('tooltip_guide_fibonacci'),
                 items=[
-                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_normal')), data="fibonacci", on_click=_on_fib_select),
-                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_vflip')), data="fibonacci_vflip", on_click=_on_fib_select),
-                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_hflip')), data="fibonacci_hflip", on_click=_on_fib_select),
-                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_both')), data="fibonacci_both", on_click=_on_fib_select),
+                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_normal')), data="fibonacci", on_click=self._on_guide_type_click),
+                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_vflip')), data="fibonacci_vflip", on_click=self._on_guide_type_click),
+                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_hflip')), data="fibonacci_hflip", on_click=self._on_guide_type_click),
+                    ft.PopupMenuItem(content=ft.Text(t('guide_fibonacci_variant_both')), data="fibonacci_both", on_click=self._on_guide_type_click),
                 ],
                 menu_padding=ft.padding.all(4),
             )
@@ -365,8 +716,6 @@ class LiveViewGUI:
         ], spacing=6)
 
         def _make_color_btn(val, label, tooltip, color):
-            def _on_click(e):
-                self._set_active_guide_color(val)
             inner = ft.Container(width=16, height=16, bgcolor=color, border_radius=8, border=ft.border.all(1, ft.Colors.GREY_900))
             btn = ft.Container(
                 content=inner,
@@ -376,7 +725,8 @@ class LiveViewGUI:
                 tooltip=tooltip,
                 border=ft.border.all(1, ft.Colors.GREY_700),
                 border_radius=6,
-                on_click=_on_click,
+                data=val,
+                on_click=self._on_guide_color_click,
             )
             self._guide_color_buttons[val] = btn
             return btn
@@ -424,7 +774,7 @@ class LiveViewGUI:
         
         # Preview overlay elements
         self._preview_image = ft.Image(
-            src=placeholder_b64,
+            src=placeholder_image,
             fit=ft.BoxFit.CONTAIN,
             gapless_playback=True,
             width=float("inf"),
@@ -465,28 +815,9 @@ class LiveViewGUI:
             visible=False,  # Hidden by default
         )
 
-        # Help overlay (toggle with 'H') - compact centered box using translations
-        help_text = t('help_text')
-        help_lines = []
-        try:
-            for line in str(help_text).split('\n'):
-                help_lines.append(ft.Text(line, size=13, color=ft.Colors.WHITE70))
-        except Exception:
-            help_lines = [ft.Text('Keyboard Shortcuts', size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE70)]
-
-        help_inner = ft.Container(
-            content=ft.Column(help_lines, spacing=6, horizontal_alignment=ft.CrossAxisAlignment.BASELINE),
-            width=560,
-            height=370,
-            offset=ft.Offset(0, -0.15),
-            padding=ft.padding.all(12),
-            bgcolor="rgba(0,0,0,0.86)",
-            border_radius=8,
-            border=ft.border.all(1, ft.Colors.GREY_700),
-        )
-        self._help_text = help_inner
+        # Help overlay (toggle with 'H'): an empty hidden container; its content is
+        # built on first toggle by _ensure_help_overlay()
         self._help_overlay = ft.Container(
-            content=ft.Column([help_inner], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
             expand=True,
             visible=False,
             bgcolor="rgba(0,0,0,0.34)",
@@ -537,7 +868,7 @@ class LiveViewGUI:
         # Initialize fullscreen and autorotate button references and UI
         try:
             try:
-                if hasattr(self, 'rotate_control') and self.rotate_control is not None and len(self.rotate_control.controls) > 0:
+                if self.rotate_control is not None and len(self.rotate_control.controls) > 0:
                     try:
                         # Find buttons by icon type (robust to spacer elements)
                         for ctrl in self.rotate_control.controls:
@@ -681,26 +1012,114 @@ class LiveViewGUI:
         self.page.add(self._main_stack)
 
 
+    # Shared click handlers for the value buttons; the value is stored in the control's data
+    def _on_rotation_btn_click(self, e):
+        self._handle_rotation_click(e.control.data)
+
+    def _on_duration_btn_click(self, e):
+        self._handle_duration_click(e.control.data)
+
+    def _on_guide_type_click(self, e):
+        self._set_active_guide_type(e.control.data)
+
+    def _on_guide_color_click(self, e):
+        self._set_active_guide_color(e.control.data)
+
     def _handle_rotation_click(self, val):
         """Handle rotation button click (0, 90, 180, 270)."""
-        orientation_map = {
-            "0": self.camera.ORIENTATION_NORMAL,
-            "90": self.camera.ORIENTATION_90,
-            "180": self.camera.ORIENTATION_180,
-            "270": self.camera.ORIENTATION_270,
-        }
-        code = orientation_map.get(val, self.camera.ORIENTATION_NORMAL)
-        self.camera.set_orientation(code)
-        self._set_active_rotation(int(val))
+        deg = int(val)
+        self.camera.set_orientation(self._orientation_by_deg.get(deg, self.camera.ORIENTATION_NORMAL))
+        self._set_active_rotation(deg)
 
     def _handle_duration_click(self, val):
         """Handle preview duration button click (3, 10, inf)."""
-        duration_map = {'3': 3.0, '10': 10.0, 'inf': float('inf')}
-        self._preview_duration = duration_map.get(val, 3.0)
+        self._preview_duration = _PREVIEW_DURATIONS.get(val, 3.0)
         self._set_active_duration(val)
         if self._preview_mode:
             self._start_preview_timer()
 
+    def _build_key_dispatch(self):
+        """
+        Build the keyboard shortcut table used by _on_key_down.
+
+        Returns:
+            tuple: (shortcuts, navigation) dicts of key name -> callable taking the
+                shift_pressed flag. Shortcuts are looked up by the lower-cased key
+                name as is (so "Numpad 1" does not match 'numpad1'); navigation
+                keys by the name with spaces and hyphens removed ('arrowleft').
+        """
+        dispatch = {}
+        # Rotation shortcuts (1-4) and duration keys (8, 9, 0), including digit/numpad aliases
+        for name, deg in _ROTATION_KEYS.items():
+            dispatch[name] = lambda shift, deg=deg: self._handle_rotation_click(deg)
+        for name, val in _DURATION_KEYS.items():
+            dispatch[name] = lambda shift, val=val: self._handle_duration_click(val)
+        dispatch.update({
+            # G / C cycle guide types / colors (Shift reverses)
+            'g': self._on_guide_type_key,
+            'c': self._on_guide_color_key,
+            # H toggles help in center of screen, A automatic rotation, F full-screen
+            'h': lambda shift: self._toggle_help_overlay(),
+            'a': lambda shift: self._toggle_autorotate(),
+            'f': lambda shift: self._toggle_fullscreen(),
+            # Space: toggle preview mode / return to live view
+            'space': self._on_space_key,
+        })
+        nav_dispatch = {
+            # Space arrives as ' ', i.e. '' once normalized
+            '': self._on_space_key,
+            'space': self._on_space_key,
+            # Arrow keys: navigate cached images (only when preview mode is active)
+            'arrowleft': self._on_left_key,
+            'left': self._on_left_key,
+            'arrowright': self._on_right_key,
+            'right': self._on_right_key,
+        }
+        return dispatch, nav_dispatch
+
+    def _on_guide_type_key(self, shift_pressed):
+        logger.debug("GUI: cycling guides - shift_pressed=%s, reverse=%s", shift_pressed, shift_pressed)
+        self._cycle_guide_type(reverse=shift_pressed)
+
+    def _on_guide_color_key(self, shift_pressed):
+        logger.debug("GUI: cycling guide colors - shift_pressed=%s", shift_pressed)
+        self._cycle_guide_color(reverse=shift_pressed)
+
+    def _on_space_key(self, shift_pressed):
+        logger.debug("GUI: key press SPACE (preview_mode=%s)", self._preview_mode)
+        if self._preview_mode:
+            # Return to live view
+            self._hide_preview()
+        elif self._preview_manager.has_cached_images():
+            # Show latest preview if available
+            preview = self._preview_manager.get_latest_preview()
+            if preview:
+                self._show_preview(preview)
+
+    def _on_left_key(self, shift_pressed):
+        logger.debug("GUI: key press LEFT (preview_mode=%s)", self._preview_mode)
+        # Ignore arrow navigation when in live view
+        if not self._preview_mode:
+            logger.debug("GUI: LEFT ignored (not in preview mode)")
+            return
+        if self._preview_manager.has_cached_images():
+            preview = self._preview_manager.navigate_previous()
+            logger.debug("GUI: navigate_previous returned: %s", getattr(preview, 'filename', None))
+            if preview:
+                self._show_preview(preview, reset_timer=True)
+
+    def _on_right_key(self, shift_pressed):
+        logger.debug("GUI: key press RIGHT (preview_mode=%s)", self._preview_mode)
+        # Ignore arrow navigation when in live view
+        if not self._preview_mode:
+            logger.debug("GUI: RIGHT ignored (not in preview mode)")
+            return
+        if self._preview_manager.has_cached_images():
+            preview = self._preview_manager.navigate_next()
+            logger.debug("GUI: navigate_next returned: %s", getattr(preview, 'filename', None))
+            if preview:
+                self._show_preview(preview, reset_timer=True)
+
     def _setup_event_handlers(self):
         """Wire up all event handlers."""
         # Rotation and duration button handlers are now attached directly in _create_ui_elements
@@ -708,94 +1127,65 @@ class LiveViewGUI:
         # Guide controls are click-driven; selection is reflected by _refresh_guide_controls_ui()
 
         # Keyboard shortcut handler for rotation (keys 1-4) and preview navigation
-        orientation_map = {
-            0: (self.camera.ORIENTATION_NORMAL, None),
-            90: (self.camera.ORIENTATION_90, None),
-            180: (self.camera.ORIENTATION_180, None),
-            270: (self.camera.ORIENTATION_270, None),
-        }
-        
-        # Track last key event to prevent duplicate handling
-        import time
-        last_key_event = {'time': 0, 'key': None, 'shift': None}
-        
-        # Track Shift key state independently (workaround for macOS/Flet uppercase key issue)
-        shift_key_pressed = {'left': False, 'right': False}
-        
         def _on_key_down(e):
             try:
-                raw_key = str(getattr(e, 'key', ''))
-
-                # Helper: coerce various truthy values (bool or string) into boolean True/False
-                def _is_true(val):
-                    try:
-                        if isinstance(val, bool):
-                            return val
-                        s = str(val).strip().lower()
-                        return s in ('true', '1', 'yes', 'on')
-                    except Exception:
-                        return False
-
-                # Detect Shift via attributes, modifiers, or uppercase letter (robust to string-typed flags)
-                shift_pressed = False
-                try:
-                    if _is_true(getattr(e, 'shift', False)) or _is_true(getattr(e, 'shiftKey', False)):
-                        shift_pressed = True
-                except Exception:
-                    pass
-                try:
-                    mods = getattr(e, 'modifiers', None)
-                    if isinstance(mods, (list, tuple)):
-                        if any(str(m).lower() == 'shift' for m in mods):
-                            shift_pressed = True
-                    elif isinstance(mods, str):
-                        if 'shift' in mods.lower():
-                            shift_pressed = True
-                except Exception:
-                    pass
-
-                # Normalize key name by stripping surrounding quotes and whitespace
                 try:
-                    key_name = raw_key.strip().strip("'\"")
-                except Exception:
-                    key_name = raw_key
+                    raw_key, shift_attr = _GET_KEY_ATTRS(e)
+                except AttributeError:
+                    raw_key = getattr(e, 'key', '')
+                    shift_attr = getattr(e, 'shift', '')
+                raw_key = str(raw_key)
+
+                # Detect Shift via attributes or modifiers (robust to string-typed flags)
+                shift_pressed = (
+                    shift_attr is True
+                    or str(shift_attr).strip().lower() in _TRUTHY
+                    or str(getattr(e, 'shiftKey', '')).strip().lower() in _TRUTHY
+                )
+                if not shift_pressed:
+                    mods = getattr(e, 'modifiers', None) or ()
+                    if isinstance(mods, str):
+                        shift_pressed = 'shift' in mods.lower()
+                    elif isinstance(mods, (list, tuple)):
+                        shift_pressed = not _SHIFT_MODIFIER_STRINGS.isdisjoint(
+                            str(m).strip().lower() for m in mods
+                        )
 
-                # Use normalized lower-case key for matching
-                key = key_name.lower() if key_name else ''
-                # Normalize key by removing spaces and hyphens (e.g., 'Arrow Left' -> 'arrowleft')
-                nkey = key.replace(' ', '').replace('-', '')
+                # Normalized lower-case key for matching (surrounding quotes/whitespace stripped)
+                key = raw_key.strip().strip("'\"").lower()
+                # Normalize key by removing spaces, hyphens and quotes in one pass
+                # (e.g., 'Arrow Left' -> 'arrowleft'); for Shift and navigation keys
+                nkey = raw_key.translate(_KEY_TRANS).lower()
 
                 # Track Shift key state (workaround for macOS/Flet where all letters arrive uppercase)
-                if nkey in ('shift', 'shiftleft', 'shiftright'):
+                if nkey in _SHIFT_MODIFIER_STRINGS:
                     if 'left' in nkey:
-                        shift_key_pressed['left'] = True
+                        self._shift_l = True
                     elif 'right' in nkey:
-                        shift_key_pressed['right'] = True
+                        self._shift_r = True
                     else:
-                        shift_key_pressed['left'] = True  # Generic shift, assume left
-                    logger.debug(f"Shift key pressed: {nkey}")
+                        self._shift_l = True  # Generic shift, assume left
+                    logger.debug("Shift key pressed: %s", nkey)
                     return  # Don't process shift key itself
                 
                 # Check if Shift is currently held down (tracked state)
-                if not shift_pressed and (shift_key_pressed['left'] or shift_key_pressed['right']):
+                if not shift_pressed and (self._shift_l or self._shift_r):
                     shift_pressed = True
-                    logger.debug(f"Shift detected from tracked key state")
+                    logger.debug("Shift detected from tracked key state")
 
                 # Prevent duplicate event handling (both keyboard_listener and page.on_key_down fire)
                 # Check if this is the same key event within 50ms
-                current_time = time.time()
-                if (current_time - last_key_event['time'] < 0.05 and 
-                    last_key_event['key'] == key and 
-                    last_key_event['shift'] == shift_pressed):
-                    logger.debug(f"Ignoring duplicate key event: {key}, shift={shift_pressed}")
+                now = time.monotonic()
+                last_ts, last_key, last_shift = self._last_key_event
+                if now - last_ts < 0.05 and last_key == key and last_shift == shift_pressed:
+                    logger.debug("Ignoring duplicate key event: %s, shift=%s", key, shift_pressed)
                     return
-                last_key_event['time'] = current_time
-                last_key_event['key'] = key
-                last_key_event['shift'] = shift_pressed
+                self._last_key_event = (now, key, shift_pressed)
 
                 # Focused debug for 'G' key events: capture only a small set of attributes and truncate long strings
+                # (the repr/dict work is skipped entirely unless DEBUG logging is enabled)
                 try:
-                    if key == 'g':
+                    if key == 'g' and logger.isEnabledFor(logging.DEBUG):
                         def _short(x):
                             try:
                                 s = repr(x)
@@ -815,121 +1205,14 @@ class LiveViewGUI:
                 except Exception:
                     logger.exception('Failed to log key event attributes')
                 
-                # Rotation shortcuts (1-4)
-                key_map = {
-                    '1': 0, 'digit1': 0, 'numpad1': 0,
-                    '2': 90, 'digit2': 90, 'numpad2': 90,
-                    '3': 180, 'digit3': 180, 'numpad3': 180,
-                    '4': 270, 'digit4': 270, 'numpad4': 270,
-                }
-                if key in key_map:
-                    deg = key_map[key]
-                    code = orientation_map.get(deg, (self.camera.ORIENTATION_NORMAL, None))[0]
-                    self.camera.set_orientation(code)
-                    self._set_active_rotation(deg)
-                    return                
-                # Duration keys: 8, 9, 0
-                duration_map = {
-                    '8': ('3', 3.0), 'digit8': ('3', 3.0), 'numpad8': ('3', 3.0),
-                    '9': ('10', 10.0), 'digit9': ('10', 10.0), 'numpad9': ('10', 10.0),
-                    '0': ('inf', float('inf')), 'digit0': ('inf', float('inf')), 'numpad0': ('inf', float('inf')),
-                }
-                if key in duration_map:
-                    val, duration = duration_map[key]
-                    self._preview_duration = duration
-                    self._set_active_duration(val)
-                    # Restart timer if in preview mode
-                    if self._preview_mode:
-                        self._start_preview_timer()
-                    return
-                
-                # Guide type key: G cycles through guide types (Shift+G -> backward)
-                if key == 'g':
-                    try:
-                        logger.debug(f"GUI: cycling guides - shift_pressed={shift_pressed}, reverse={shift_pressed}")
-                        if shift_pressed:
-                            self._cycle_guide_type(reverse=True)
-                        else:
-                            self._cycle_guide_type()
-                    except Exception:
-                        logger.exception("Failed to cycle guide type")
-                    return
-                
-                # Guide color key: C cycles through guide colors (Shift+C -> reverse)
-                if key == 'c':
+                # Shortcut dispatch: one dict lookup on the key, then on the normalized
+                # name for navigation keys (same matching as before the table)
+                handler = self._key_dispatch.get(key) or self._nav_key_dispatch.get(nkey)
+                if handler is not None:
                     try:
-                        logger.debug(f"GUI: cycling guide colors - shift_pressed={shift_pressed}")
-                        if shift_pressed:
-                            self._cycle_guide_color(reverse=True)
-                        else:
-                            self._cycle_guide_color()
+                        handler(shift_pressed)
                     except Exception:
-                        logger.exception("Failed to cycle guide color")
-                    return
-
-                # Help overlay key: H toggles help in center of screen
-                if key == 'h':
-                    try:
-                        self._toggle_help_overlay()
-                    except Exception:
-                        logger.exception("Failed toggling help overlay")
-                    return
-
-                # Autorotate toggle: 'A' toggles automatic rotation
-                if key == 'a':
-                    try:
-                        self._toggle_autorotate()
-                    except Exception:
-                        logger.exception("Failed toggling autorotate")
-                    return
-
-                # Full-screen toggle: 'f'
-                if key == 'f':
-                    try:
-                        self._toggle_fullscreen()
-                    except Exception:
-                        logger.exception("Failed toggling full-screen")
-                    return
-
-                # Space key: toggle preview mode / return to live view
-                if nkey in ('', 'space') or key in (' ', 'space'):
-                    logger.debug("GUI: key press SPACE (preview_mode=%s)", self._preview_mode)
-                    if self._preview_mode:
-                        # Return to live view
-                        self._hide_preview()
-                    else:
-                        # Show latest preview if available
-                        if self._preview_manager.has_cached_images():
-                            preview = self._preview_manager.get_latest_preview()
-                            if preview:
-                                self._show_preview(preview)
-                    return
-                
-                # Arrow keys: navigate cached images (only when preview mode is active)
-                if nkey in ('arrowleft', 'left'):
-                    logger.debug("GUI: key press LEFT (preview_mode=%s)", self._preview_mode)
-                    # Ignore arrow navigation when in live view
-                    if not self._preview_mode:
-                        logger.debug("GUI: LEFT ignored (not in preview mode)")
-                        return
-                    if self._preview_manager.has_cached_images():
-                        preview = self._preview_manager.navigate_previous()
-                        logger.debug("GUI: navigate_previous returned: %s", getattr(preview, 'filename', None))
-                        if preview:
-                            self._show_preview(preview, reset_timer=True)
-                    return
-                
-                if nkey in ('arrowright', 'right'):
-                    logger.debug("GUI: key press RIGHT (preview_mode=%s)", self._preview_mode)
-                    # Ignore arrow navigation when in live view
-                    if not self._preview_mode:
-                        logger.debug("GUI: RIGHT ignored (not in preview mode)")
-                        return
-                    if self._preview_manager.has_cached_images():
-                        preview = self._preview_manager.navigate_next()
-                        logger.debug("GUI: navigate_next returned: %s", getattr(preview, 'filename', None))
-                        if preview:
-                            self._show_preview(preview, reset_timer=True)
+                        logger.exception("Keyboard shortcut %r failed", key)
                     return
                     
             except Exception as ex:
@@ -939,31 +1222,25 @@ class LiveViewGUI:
             """Handle key release to track Shift key state"""
             try:
                 raw_key = str(getattr(e, 'key', ''))
-                try:
-                    key_name = raw_key.strip().strip("'\"")
-                except Exception:
-                    key_name = raw_key
-                
-                key = key_name.lower() if key_name else ''
-                nkey = key.replace(' ', '').replace('-', '')
+                nkey = raw_key.translate(_KEY_TRANS).lower()
                 
                 # Reset Shift key state when released
-                if nkey in ('shift', 'shiftleft', 'shiftright'):
+                if nkey in _SHIFT_MODIFIER_STRINGS:
                     if 'left' in nkey:
-                        shift_key_pressed['left'] = False
+                        self._shift_l = False
                     elif 'right' in nkey:
-                        shift_key_pressed['right'] = False
+                        self._shift_r = False
                     else:
                         # Generic shift release - clear both
-                        shift_key_pressed['left'] = False
-                        shift_key_pressed['right'] = False
-                    logger.debug(f"Shift key released: {nkey}")
+                        self._shift_l = False
+                        self._shift_r = False
+                    logger.debug("Shift key released: %s", nkey)
             except Exception as ex:
                 logger.exception("Key up handler error")
 
         # attach keyboard handler to the listener (if present)
         try:
-            if hasattr(self, 'keyboard_listener') and self.keyboard_listener is not None:
+            if self.keyboard_listener is not None:
                 self.keyboard_listener.on_key_down = _on_key_down
                 self.keyboard_listener.on_key_up = _on_key_up
             # Also assign to page to ensure key events are received even when focus differs
@@ -981,13 +1258,7 @@ class LiveViewGUI:
 
     def _deg_from_orientation(self, orientation_code):
         """Map camera orientation code to degrees used by the rotation buttons."""
-        mapping = {
-            self.camera.ORIENTATION_NORMAL: 0,
-            self.camera.ORIENTATION_90: 90,
-            self.camera.ORIENTATION_180: 180,
-            self.camera.ORIENTATION_270: 270,
-        }
-        return mapping.get(orientation_code, None)
+        return self._deg_by_orientation.get(orientation_code, None)
 
     def _sync_rotation_from_camera(self):
         """Set the active rotation button to match the camera's current orientation."""
@@ -1016,8 +1287,9 @@ class LiveViewGUI:
                 self._current_frame_size = None
             except Exception:
                 pass
+            self._stream_stop_event.clear()
             self.streaming_event.set()
-            self.frame_thread = threading.Thread(target=self._frame_update_loop, daemon=True)
+            self.frame_thread = threading.Thread(target=self._frame_update_loop, name="frame-update", daemon=True)
             self.frame_thread.start()
             # Enable tethering with preview callback
             self.camera.start_tether(callback=self._preview_manager.process_downloaded_file)
@@ -1037,19 +1309,23 @@ class LiveViewGUI:
             self.page.snack_bar = ft.SnackBar(ft.Text(t('snackbar_failed_connect', msg=msg)))
             self.page.snack_bar.open = True
 
+    def _end_streaming(self):
+        """Clear the streaming flag and wake the frame thread from any pending wait."""
+        self.streaming_event.clear()
+        self._stream_stop_event.set()
+
     def _stop_stream(self):
         """Stop camera streaming (manual stop)."""
-        self.streaming_event.clear()
-        # Stop tethering
-        self.camera.stop_tether()
-        # Wait for background thread to exit
-        time.sleep(0.2)
+        self._end_streaming()
+        # Wait for background thread to exit (so it cannot restart capture)
         if self.frame_thread is not None:
             try:
                 self.frame_thread.join(timeout=1)
             except Exception:
                 pass
             self.frame_thread = None
+        # Stop tethering; this also parks the camera's capture thread
+        self.camera.stop_tether()
         # Release camera
         self.camera.release()
         # Update UI
@@ -1062,26 +1338,51 @@ class LiveViewGUI:
         """Background loop to fetch frames and schedule UI updates."""
         while self.streaming_event.is_set():
             try:
-                frame_b64 = self.camera.get_frame_base64()
+                # Throttle display updates to avoid flicker: wait for the next display
+                # deadline before fetching, so no frame is processed only to be dropped
+                # (the capture thread keeps the newest frame meanwhile)
+                wait = self._next_display_deadline - time.monotonic()
+                if wait > 0 and self._stream_stop_event.wait(wait):
+                    break
+
+                # Raw JPEG bytes: Flet's Image.src takes bytes, so no base64/data URI step
+                frame = self.camera.get_frame_bytes()
                 
-                if frame_b64:
-                    # Throttle display updates to avoid flicker
-                    now = time.time()
-                    if now - self._last_display_ts < self._display_min_interval:
-                        continue
-                    self._last_display_ts = now
-
-                    # Schedule coroutine to update UI on Flet's asyncio loop
-                    if self._loop:
+                if frame:
+                    # Fixed-period deadlines (no drift); resync if we fell behind
+                    self._next_display_deadline = max(
+                        self._next_display_deadline + self._display_min_interval,
+                        time.monotonic(),
+                    )
+
+                    # Until the stream's frame size is known, read it here from the JPEG
+                    # header so the event loop only receives the result
+                    size = None
+                    if self._current_frame_size is None:
                         try:
-                            asyncio.run_coroutine_threadsafe(self._update_image(frame_b64), self._loop)
-                        except Exception as e:
-                            logger.exception("Failed to schedule UI update")
+                            size = self._image_size_from_bytes(frame)
+                        except Exception:
+                            logger.debug("Failed to read live frame size", exc_info=True)
+
+                    # Schedule a plain callback (no coroutine or Future) on Flet's asyncio loop
+                    if self._loop:
+                        with self._frame_lock:
+                            self._pending_frame = frame  # replaces a frame not yet shown
+                            self._pending_frame_size = size
+                            schedule = not self._ui_update_pending
+                            self._ui_update_pending = True
+                        if schedule:
+                            try:
+                                self._loop.call_soon_threadsafe(self._apply_pending_frame)
+                            except Exception as e:
+                                with self._frame_lock:
+                                    self._ui_update_pending = False
+                                logger.exception("Failed to schedule UI update")
                     else:
                         # As a fallback, set image control src directly
                         try:
-                            self.img_control.src = frame_b64
-                            self.page.update()
+                            self.img_control.src = frame
+                            self._mark_dirty(self.img_control)
                         except Exception:
                             pass
                 else:
@@ -1093,141 +1394,246 @@ class LiveViewGUI:
                 logger.exception("Exception in frame update loop")
                 if self._handle_frame_error():
                     break
-                time.sleep(0.5)
+                self._stream_stop_event.wait(0.5)
+
+    def _mark_dirty(self, *controls):
+        """Queue controls for a batched update instead of a full page.update().
+
+        All controls marked during one event-loop tick are sent to Flet with a
+        single page.update(*controls) call; without a captured loop the update
+        happens immediately.
+        """
+        with self._dirty_lock:
+            for control in controls:
+                if control is not None:
+                    # Keyed by id(): controls are not guaranteed to be hashable
+                    self._dirty_controls[id(control)] = control
+            schedule = bool(self._dirty_controls) and not self._dirty_flush_scheduled
+            if schedule:
+                self._dirty_flush_scheduled = True
+        if not schedule:
+            return
+        loop = self._loop
+        if loop is None:
+            self._flush_dirty()
+            return
+        try:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                # Already on the loop (frame/status callbacks): plain call_soon runs the
+                # flush after this callback, with no self-pipe wakeup
+                loop.call_soon(self._flush_dirty)
+            else:
+                loop.call_soon_threadsafe(self._flush_dirty)
+        except Exception:
+            # Loop closed (shutting down): fall back to flushing here
+            self._flush_dirty()
+
+    def _flush_dirty(self):
+        """Send all controls queued by _mark_dirty() to Flet in one update."""
+        with self._dirty_lock:
+            controls = list(self._dirty_controls.values())
+            self._dirty_controls.clear()
+            self._dirty_flush_scheduled = False
+        if controls:
+            try:
+                self.page.update(*controls)
+            except Exception:
+                logger.exception("Batched UI update failed")
+
+    def _apply_pending_frame(self):
+        """Run on main event loop: show the newest frame from the latest-frame slot."""
+        with self._frame_lock:
+            frame = self._pending_frame
+            size = self._pending_frame_size
+            self._pending_frame = None
+            self._pending_frame_size = None
+            self._ui_update_pending = False
+        if frame:
+            self._update_image(frame, size)
+
+    def _update_image(self, frame, size=None):
+        """Run on main event loop: apply new image and update page.
 
-    async def _update_image(self, frame_b64):
-        """Run on main event loop: apply new image and update page."""
+        Args:
+            frame: Live JPEG bytes, or a base64 string / file path
+            size: (width, height) already read by the frame thread, if known
+        """
         try:
             # Fast, gapless update of the Image control to avoid flicker
             if self.img_control is not None:
-                self.img_control.src = frame_b64
+                self.img_control.src = frame
             else:
                 # Fallback - set container decoration
-                self.video_container.image = ft.DecorationImage(src=frame_b64, fit=ft.BoxFit.CONTAIN)
+                self.video_container.image = ft.DecorationImage(src=frame, fit=ft.BoxFit.CONTAIN)
             # Remember current frame so we can reapply on resize
-            self._current_frame = frame_b64
+            self._current_frame = frame
 
-            # Capture source image dimensions (only once to avoid overhead)
-            try:
-                if not hasattr(self, '_current_frame_size') or self._current_frame_size is None:
-                    # frame_b64 is typically a data URI (live frame)
-                    if isinstance(frame_b64, str) and frame_b64.startswith('data:'):
-                        b64 = frame_b64.split(',', 1)[1]
-                        data = base64.b64decode(b64)
-                        arr = np.frombuffer(data, dtype=np.uint8)
-                        img = cv2.imdecode(arr, cv2.IMREAD_UNCHANGED)
-                        if img is not None:
-                            h, w = img.shape[:2]
-                            self._current_frame_size = (w, h)
-                            # First time we determine the live frame intrinsic size, update guides once
-                            try:
-                                self._update_guide_canvas()
-                            except Exception:
-                                pass
-                    else:
-                        # Could be a filepath for preview; try reading metadata
-                        try:
-                            img = cv2.imread(frame_b64)
-                            if img is not None:
-                                h, w = img.shape[:2]
-                                self._current_frame_size = (w, h)
-                                # Update guides once now that we know the intrinsic size
-                                try:
-                                    self._update_guide_canvas()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+            # Capture source image dimensions (only once to avoid overhead); after the
+            # first frame this is a single attribute test
+            if self._current_frame_size is None:
+                try:
+                    # Normally measured on the frame thread; probe here only for
+                    # frames that arrive without a size
+                    if size is None:
+                        if type(frame) is bytes:
+                            size = self._image_size_from_bytes(frame)
+                        else:
+                            size = self._probe_frame_size(frame)
+                    if size is not None:
+                        self._current_frame_size = size
+                        # First time we determine the live frame intrinsic size, update guides once
+                        self._update_guide_canvas()
+                except Exception:
+                    pass
 
 
-            # Page update must be invoked on main loop
-            self.page.update()
+            # Only the image changed: update that control, not the whole page
+            self._mark_dirty(self.img_control if self.img_control is not None else self.video_container)
         except Exception as e:
             logger.exception("Exception in _update_image")
 
+    @staticmethod
+    def _probe_frame_size(frame):
+        """Return (width, height) of a live frame given as JPEG bytes, base64 string or data URI.
+
+        Strings are always treated as base64 payloads here; preview files are
+        measured with _probe_file_size().
+
+        Returns:
+            tuple: (width, height), or None if the image could not be read
+        """
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            data = frame
+        elif isinstance(frame, str) and frame.startswith('data:'):
+            data = binascii.a2b_base64(frame.partition(',')[2])
+        elif isinstance(frame, str):
+            # Bare base64 payload, as returned by CameraHandler.get_frame_base64()
+            data = binascii.a2b_base64(frame)
+        else:
+            return None
+        return LiveViewGUI._image_size_from_bytes(data)
+
+    @staticmethod
+    def _probe_file_size(path):
+        """Return (width, height) of the image file at path (a saved preview).
+
+        The SOF header normally sits in the first few KiB, so the rest of the
+        file is only read if it is not there.
+
+        Returns:
+            tuple: (width, height), or None if the image could not be read
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = f.read(_HEADER_PROBE_BYTES)
+                try:
+                    size = _parse_image_header_size(data)
+                except Exception:
+                    size = None
+                if size is not None:
+                    return size
+                data += f.read()
+        except OSError as e:
+            logger.debug("Could not read preview %s: %s", path, e)
+            return None
+        return LiveViewGUI._image_size_from_bytes(data)
+
+    @staticmethod
+    def _image_size_from_bytes(data):
+        """Return (width, height) of encoded image bytes.
+
+        Only the image header is parsed (libjpeg-turbo, or the JPEG SOF / PNG IHDR
+        fields directly); OpenCV decodes the whole image as a last resort.
+
+        Args:
+            data: Encoded JPEG/PNG (bytes, bytearray or memoryview)
+
+        Returns:
+            tuple: (width, height), or None if the image could not be read
+        """
+        if HAS_TURBOJPEG:
+            try:
+                width, height = _turbojpeg.decode_header(data)[:2]
+                return (width, height)
+            except Exception:
+                pass
+        try:
+            size = _parse_image_header_size(data)
+            if size is not None:
+                return size
+        except Exception:
+            pass
+        img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        if img is None:
+            return None
+        h, w = img.shape[:2]
+        return (w, h)
+
     def _ensure_current_frame_size(self):
         """Attempt to determine the current live frame intrinsic size from cached frame data.
 
         Sometimes the live frame size wasn't captured during the initial frame update (e.g. decode failed
         or frames arrived as different types). This helper tries to derive width/height from
-        self._current_frame (data URI or filepath) and caches the result in
+        self._current_frame (JPEG bytes or base64 string) and caches the result in
         `self._current_frame_size` so guide rendering can correctly letterbox to the image area.
         """
         try:
-            if hasattr(self, '_current_frame_size') and self._current_frame_size:
+            if self._current_frame_size:
                 return
-            cf = getattr(self, '_current_frame', None)
+            cf = self._current_frame
             if not cf:
                 return
-            # Data URI (live frames)
-            if isinstance(cf, str) and cf.startswith('data:'):
-                try:
-                    b64 = cf.split(',', 1)[1]
-                    data = base64.b64decode(b64)
-                    arr = np.frombuffer(data, dtype=np.uint8)
-                    img = cv2.imdecode(arr, cv2.IMREAD_UNCHANGED)
-                    if img is not None:
-                        h, w = img.shape[:2]
-                        self._current_frame_size = (w, h)
-                        logger.debug("Determined current_frame_size from data URI: %sx%s", w, h)
-                except Exception:
-                    logger.debug("Failed to decode current frame from data URI for size detection")
-            else:
-                # Try reading metadata from filepath
-                try:
-                    img = cv2.imread(cf)
-                    if img is not None:
-                        h, w = img.shape[:2]
-                        self._current_frame_size = (w, h)
-                        logger.debug("Determined current_frame_size from filepath: %sx%s", w, h)
-                except Exception:
-                    logger.debug("Failed to read current frame file for size detection: %s", cf)
+            try:
+                size = self._probe_frame_size(cf)
+                if size is not None:
+                    self._current_frame_size = size
+                    logger.debug("Determined current_frame_size: %sx%s", size[0], size[1])
+            except Exception:
+                logger.debug("Failed to read current frame for size detection")
         except Exception:
             logger.exception("_ensure_current_frame_size error")
 
-    async def _reapply_current_frame(self):
+    def _reapply_current_frame(self):
         """Reapply the current frame to force a re-render after resize."""
         try:
-            if hasattr(self, "_current_frame") and self._current_frame:
+            if self._current_frame:
                 if self.img_control is not None:
                     self.img_control.src = self._current_frame
                 else:
                     self.video_container.image = ft.DecorationImage(src=self._current_frame, fit=ft.BoxFit.CONTAIN)
-                self.page.update()
+                self._mark_dirty(self.img_control if self.img_control is not None else self.video_container)
         except Exception as e:
             logger.exception("Exception in _reapply_current_frame")
     def _start_update_timer(self):
-        """Start timer to poll for new frames and update UI from main thread."""
-        def update_frame():
-            """Timer callback to update UI with latest frame."""
-            if not self.streaming_event.is_set():
-                return
-            
+        """Start a thread that polls for new frames and updates the UI every 60 ms (~16 fps)."""
+        if self._update_timer is not None and self._update_timer.is_alive():
+            return
+        self._update_stop.clear()
+        self._update_timer = threading.Thread(target=self._update_timer_loop, name="ui-update", daemon=True)
+        self._update_timer.start()
+
+    def _update_timer_loop(self):
+        """One long-running loop in place of a new threading.Timer per tick."""
+        while self.streaming_event.is_set():
             with self._frame_lock:
-                if self._latest_frame:
-                        # Set container decoration image so it scales to container bounds
-                        self.video_container.image = ft.DecorationImage(
-                            src=self._latest_frame, fit=ft.BoxFit.CONTAIN
-                        )
-                        self._latest_frame = None  # Clear after consuming
-                        self.page.update()
-            # Schedule next update (60ms = ~16fps)
-            if self.streaming_event.is_set():
-                import threading
-                self._update_timer = threading.Timer(0.06, update_frame)
-                self._update_timer.daemon = True
-                self._update_timer.start()
-        
-        # Start the update cycle
-        update_frame()
-    
+                frame = self._latest_frame
+                self._latest_frame = None  # Clear after consuming
+            if frame:
+                # Set container decoration image so it scales to container bounds
+                self.video_container.image = ft.DecorationImage(src=frame, fit=ft.BoxFit.CONTAIN)
+                # Batched and flushed on the event loop, like every other UI update
+                self._mark_dirty(self.video_container)
+            if self._update_stop.wait(0.06):
+                break
+
     def _stop_update_timer(self):
         """Stop the UI update timer."""
-        if self._update_timer:
-            self._update_timer.cancel()
-            self._update_timer = None
+        self._update_stop.set()
+        self._update_timer = None
 
     def _handle_frame_error(self):
         """
@@ -1238,13 +1644,13 @@ class LiveViewGUI:
         """
         # Device disconnected
         if self.camera.lost_device:
-            self.streaming_event.clear()
+            self._end_streaming()
             self.camera.release()
             self.status_text.value = t('status_disconnected')
             self.status_text.color = "red"
             self.status_icon.name = ft.Icons.VIDEOCAM_OFF
             self.status_icon.color = "red"
-            self.page.update()
+            self._mark_dirty(self.status_text, self.status_icon)
             return True
         
         # I/O busy errors
@@ -1253,11 +1659,11 @@ class LiveViewGUI:
             self.status_text.color = ft.Colors.ORANGE_400
             self.status_icon.name = ft.Icons.WARNING_AMBER_ROUNDED
             self.status_icon.color = ft.Colors.ORANGE_400
-            self.page.update()
+            self._mark_dirty(self.status_text, self.status_icon)
             
             # Too many errors - stop streaming
             if self.camera._io_error_counter >= self.camera._io_error_threshold:
-                self.streaming_event.clear()
+                self._end_streaming()
                 self.camera.lost_device = True
                 self.camera.release()
                 self.status_text.value = t('status_disconnected_io')
@@ -1266,25 +1672,29 @@ class LiveViewGUI:
                 self.status_icon.name = ft.Icons.VIDEOCAM_OFF
                 self.status_icon.color = "red"
                 # UI button removed; showing disconnected status instead
-                self.page.update()
+                self._mark_dirty(self.status_text, self.status_icon)
                 return True
             
-            time.sleep(0.2)
+            self._stream_stop_event.wait(0.2)
             return False
         
         # Other transient errors
-        time.sleep(0.1)
+        self._stream_stop_event.wait(0.1)
         return False
 
     def _on_window_event(self, e):
         """Handle window events (e.g., close, resize)."""
         # Close event
         if e.data == "close":
-            self.streaming_event.clear()
+            self._end_streaming()
             try:
                 self.camera.stop_watch()
             except Exception:
                 pass
+            try:
+                self._preview_manager.shutdown()
+            except Exception:
+                pass
             self.camera.release()
             self.page.window_destroy()
             return
@@ -1296,37 +1706,59 @@ class LiveViewGUI:
         try:
             data_str = str(e.data)
             if "resize" in data_str.lower() or "size" in data_str.lower():
-                if hasattr(self, "_current_frame") and self._current_frame:
+                if self._current_frame:
                     if self._loop:
-                        asyncio.run_coroutine_threadsafe(self._reapply_current_frame(), self._loop)
+                        self._loop.call_soon_threadsafe(self._reapply_current_frame)
                     else:
                         try:
                             self.img_control.src = self._current_frame
-                            self.page.update()
+                            self._mark_dirty(self.img_control)
                         except Exception:
                             pass
         except Exception:
             pass
 
+    def _ensure_help_overlay(self):
+        """Build the help overlay content (compact centered box using translations) once."""
+        if self._help_text is not None:
+            return
+        help_text = t('help_text')
+        help_lines = []
+        try:
+            for line in str(help_text).split('\n'):
+                help_lines.append(ft.Text(line, size=13, color=ft.Colors.WHITE70))
+        except Exception:
+            help_lines = [ft.Text('Keyboard Shortcuts', size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE70)]
+
+        help_inner = ft.Container(
+            content=ft.Column(help_lines, spacing=6, horizontal_alignment=ft.CrossAxisAlignment.BASELINE),
+            width=560,
+            height=370,
+            offset=ft.Offset(0, -0.15),
+            padding=ft.padding.all(12),
+            bgcolor="rgba(0,0,0,0.86)",
+            border_radius=8,
+            border=ft.border.all(1, ft.Colors.GREY_700),
+        )
+        self._help_text = help_inner
+        self._help_overlay.content = ft.Column(
+            [help_inner], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER
+        )
+
     def _toggle_help_overlay(self):
         """Toggle visibility of the centered help overlay."""
         try:
-            if not hasattr(self, '_help_overlay') or self._help_overlay is None:
+            if self._help_overlay is None:
                 return
-            vis = not getattr(self._help_overlay, 'visible', False)
-            self._help_overlay.visible = vis
-            if vis:
+            self._help_visible = not self._help_visible
+            if self._help_visible:
+                self._ensure_help_overlay()
+            self._help_overlay.visible = self._help_visible
+            if self._help_visible:
                 # When showing help, hide preview overlay and HUD so help is clear
-                try:
-                    if hasattr(self, '_preview_overlay') and self._preview_overlay is not None:
-                        self._preview_overlay.visible = False
-                    if hasattr(self, '_preview_filename_container') and self._preview_filename_container is not None:
-                        self._preview_filename_container.visible = False
-                    if hasattr(self, '_preview_counter_container') and self._preview_counter_container is not None:
-                        self._preview_counter_container.visible = False
-
-                except Exception:
-                    pass
+                for ov in (self._preview_overlay, self._preview_filename_container, self._preview_counter_container):
+                    if ov is not None:
+                        ov.visible = False
 
             # Trigger UI refresh
             try:
@@ -1344,28 +1776,14 @@ class LiveViewGUI:
             if success and not self.streaming_event.is_set():
                 logger.info("Auto-starting live view: %s", msg)
                 # Start streaming on the main loop
-                if self._loop:
-                    try:
-                        asyncio.run_coroutine_threadsafe(self._start_stream_async(), self._loop)
-                    except Exception:
-                        # Fallback to direct call
-                        self._start_stream()
-                else:
-                    self._start_stream()
+                self._schedule(self._start_stream)
         except Exception as e:
                 logger.exception("Exception in camera detected callback")
-    async def _start_stream_async(self):
-        """Async wrapper to call _start_stream on the main loop."""
-        self._start_stream()
-
     def _on_camera_lost(self, success, msg):
         """Called by CameraHandler when the device is lost."""
         try:
             # Schedule the main-thread UI update
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._handle_camera_lost(msg), self._loop)
-            else:
-                self._handle_camera_lost_sync(msg)
+            self._schedule(self._handle_camera_lost, msg)
         except Exception as e:
             logger.exception("Exception in _on_camera_lost")
     def _format_disconnect_message(self, msg: str) -> str:
@@ -1374,53 +1792,40 @@ class LiveViewGUI:
             return t('status_disconnected')
         s = str(msg)
         # Known hardware disconnect indicators
-        disconnect_tokens = ["-52", "Could not find the requested device", "-1", "Unspecified error", "-105", "Unknown model"]
-        for token in disconnect_tokens:
-            if token in s:
-                return t('status_disconnected_device')
+        if _DISCONNECT_RE.search(s):
+            return t('status_disconnected_device')
         # Otherwise show a short, single-line message
         short = s.splitlines()[0]
         if len(short) > 80:
             short = short[:77] + "..."
         return t('status_disconnected_short', short=short)
 
-    async def _handle_camera_lost(self, msg):
+    def _apply_disconnected_ui(self, msg):
+        """Stop streaming, release the camera and show the disconnect status.
+
+        Shared by the async and sync disconnect entry points so both paths run
+        the same sequence and end in a single batched UI update.
+
+        Args:
+            msg: Error message reported by the camera handler
+        """
+        self._end_streaming()
+        try:
+            self.camera.release()
+        except Exception:
+            pass
+        self.status_text.value = self._format_disconnect_message(msg)
+        self.status_text.color = "red"
+        self.status_icon.name = ft.Icons.VIDEOCAM_OFF
+        self.status_icon.color = "red"
+        self._mark_dirty(self.status_text, self.status_icon)
+
+    def _handle_camera_lost(self, msg):
         """Main-thread handler to stop streaming and update UI on disconnect."""
         try:
-            self.streaming_event.clear()
-            try:
-                self.camera.release()
-            except Exception:
-                pass
-            self.status_text.value = self._format_disconnect_message(msg)
-            self.status_text.color = "red"
-            self.status_icon.name = ft.Icons.VIDEOCAM_OFF
-            self.status_icon.color = "red"
-            self.page.update()
+            self._apply_disconnected_ui(msg)
         except Exception as e:
             logger.exception("Exception in _handle_camera_lost")
-    def _handle_camera_lost_sync(self, msg):
-        try:
-            self.streaming_event.clear()
-            try:
-                self.camera.release()
-            except Exception:
-                pass
-            self.status_text.value = self._format_disconnect_message(msg)
-            self.status_text.color = "red"
-            self.status_icon.name = ft.Icons.VIDEOCAM_OFF
-            self.status_icon.color = "red"
-            self.page.update()
-        except Exception as e:
-            logger.exception("Exception in _handle_camera_lost_sync")
-    @staticmethod
-    def _create_placeholder_image():
-        """Create a 1x1 black placeholder image as base64 with data URI."""
-        placeholder_img = np.zeros((1, 1, 3), dtype=np.uint8)
-        _, placeholder_buffer = cv2.imencode('.jpg', placeholder_img)
-        b64_str = base64.b64encode(placeholder_buffer).decode('utf-8')
-        return f"data:image/jpeg;base64,{b64_str}"
-
     def _set_active_rotation(self, degrees: int):
         """Update rotation selection highlighting.
 
@@ -1431,16 +1836,16 @@ class LiveViewGUI:
             val_str = str(degrees)
             for val, btn in self._rotation_buttons.items():
                 if val == val_str:
-                    btn.bgcolor = "rgba(100,100,255,0.4)"
-                    btn.border = ft.border.all(2, ft.Colors.BLUE_400)
+                    btn.bgcolor = _BG_SELECTED
+                    btn.border = _BORDER_SELECTED
                 else:
                     btn.bgcolor = None
-                    btn.border = ft.border.all(1, ft.Colors.GREY_700)
+                    btn.border = _BORDER_IDLE
             
             # Update autorotate UI in case manual rotation implies user preference
             try:
                 # If user manually rotates, disable autorotate so it doesn't override
-                if getattr(self, '_autorotate_enabled', True):
+                if self._autorotate_enabled:
                     self._autorotate_enabled = False
                     self._update_autorotate_ui()
             except Exception:
@@ -1450,7 +1855,7 @@ class LiveViewGUI:
             self._update_guide_canvas()
             self._update_preview_guide_canvas()
             
-            self.page.update()
+            self._mark_dirty(*self._rotation_buttons.values())
         except Exception as e:
             logger.exception("_set_active_rotation error")
 
@@ -1462,12 +1867,12 @@ class LiveViewGUI:
         try:
             for val, btn in self._duration_buttons.items():
                 if val == value:
-                    btn.bgcolor = "rgba(100,100,255,0.4)"
-                    btn.border = ft.border.all(2, ft.Colors.BLUE_400)
+                    btn.bgcolor = _BG_SELECTED
+                    btn.border = _BORDER_SELECTED
                 else:
                     btn.bgcolor = None
-                    btn.border = ft.border.all(1, ft.Colors.GREY_700)
-            self.page.update()
+                    btn.border = _BORDER_IDLE
+            self._mark_dirty(*self._duration_buttons.values())
         except Exception as e:
             logger.exception("_set_active_duration error")
 
@@ -1492,38 +1897,40 @@ class LiveViewGUI:
     def _refresh_guide_controls_ui(self):
         """Refresh visual state of the guide buttons (selection sync)."""
         try:
+            # Restyle every button first, then send them to Flet in one batched update
+            dirty = []
             # guide type buttons
-            if hasattr(self, '_guide_type_buttons') and self._guide_type_buttons:
+            if self._guide_type_buttons:
+                guide_type = self._guide_type
+                # Treat all fibonacci variants as a single group for highlighting
+                fibonacci_active = str(guide_type).startswith("fibonacci")
                 for val, btn in self._guide_type_buttons.items():
                     try:
-                        # Treat all fibonacci variants as a single group for highlighting
                         if val.startswith("fibonacci"):
-                            active = str(self._guide_type).startswith("fibonacci")
+                            active = fibonacci_active
                         else:
-                            active = (val == self._guide_type)
+                            active = (val == guide_type)
 
                         if active:
                             btn.bgcolor = ft.Colors.AMBER_400
-                            btn.border = ft.border.all(1, ft.Colors.AMBER_400)
+                            btn.border = _BORDER_GUIDE_ACTIVE
                         else:
                             btn.bgcolor = None
-                            btn.border = ft.border.all(1, ft.Colors.GREY_700)
+                            btn.border = _BORDER_IDLE
 
-                        btn.update()
+                        dirty.append(btn)
                     except Exception:
                         pass
 
             # guide color buttons
-            if hasattr(self, '_guide_color_buttons') and self._guide_color_buttons:
+            if self._guide_color_buttons:
                 for val, btn in self._guide_color_buttons.items():
                     if val == self._guide_color:
-                        btn.border = ft.border.all(2, ft.Colors.WHITE)
+                        btn.border = _BORDER_COLOR_ACTIVE
                     else:
-                        btn.border = ft.border.all(1, ft.Colors.GREY_700)
-                    try:
-                        btn.update()
-                    except Exception:
-                        pass
+                        btn.border = _BORDER_IDLE
+                    dirty.append(btn)
+            self._mark_dirty(*dirty)
         except Exception as e:
             logger.exception("_refresh_guide_controls_ui error")
     def _cycle_guide_type(self, reverse: bool = False):
@@ -1557,28 +1964,28 @@ class LiveViewGUI:
         except Exception as e:
             logger.exception("_cycle_guide_color error")
     def _get_guide_paint(self):
-        """Get paint object for current guide color."""
-        color_map = {
-            "white": ft.Colors.WHITE,
-            "green": ft.Colors.GREEN,
-            "red": ft.Colors.RED,
-            "yellow": getattr(ft.Colors, 'YELLOW', ft.Colors.YELLOW if hasattr(ft.Colors, 'YELLOW') else ft.Colors.ORANGE),
-            "blue": getattr(ft.Colors, 'BLUE', ft.Colors.BLUE if hasattr(ft.Colors, 'BLUE') else ft.Colors.INDIGO),
-            "black": ft.Colors.BLACK,
-        }
-        color = color_map.get(self._guide_color, ft.Colors.WHITE)
-        return ft.Paint(
-            stroke_width=1.5,
-            style=ft.PaintingStyle.STROKE,
-            color=color,
-        )
+        """Get paint object for current guide color (one cached Paint per color)."""
+        paint = self._guide_paint_cache.get(self._guide_color)
+        if paint is None:
+            paint = ft.Paint(
+                stroke_width=1.5,
+                style=ft.PaintingStyle.STROKE,
+                color=_GUIDE_PAINT_COLORS.get(self._guide_color, ft.Colors.WHITE),
+            )
+            self._guide_paint_cache[self._guide_color] = paint
+        return paint
 
     def _on_guide_canvas_resize(self, e):
         """Handle canvas resize to update guide shapes with new dimensions."""
         try:
             self._guide_canvas_width = e.width
             self._guide_canvas_height = e.height
-            self._update_guide_canvas()
+            # Let the camera downscale rotated frames to what is actually shown
+            try:
+                self.camera.set_display_size(e.width, e.height)
+            except Exception:
+                pass
+            self._debounce_guide_update("live", self._update_guide_canvas)
         except Exception as ex:
             logger.exception("_on_guide_canvas_resize error")
     def _on_preview_guide_canvas_resize(self, e):
@@ -1586,9 +1993,31 @@ class LiveViewGUI:
         try:
             self._preview_guide_canvas_width = e.width
             self._preview_guide_canvas_height = e.height
-            self._update_preview_guide_canvas()
+            self._debounce_guide_update("preview", self._update_preview_guide_canvas)
         except Exception as ex:
             logger.exception("_on_preview_guide_canvas_resize error")
+
+    def _debounce_guide_update(self, canvas_key, update):
+        """Run a guide canvas update once a resize storm settles.
+
+        Each resize records the new size and re-arms a short TimerHandle on the
+        event loop, so only the last size within _RESIZE_DEBOUNCE_S is drawn.
+
+        Args:
+            canvas_key: "live" or "preview" (one pending timer per canvas)
+            update: Bound update method to run
+        """
+        loop = self._loop
+        if loop is None:
+            update()
+            return
+        if not self._on_event_loop():
+            loop.call_soon_threadsafe(self._debounce_guide_update, canvas_key, update)
+            return
+        handle = self._resize_timers.get(canvas_key)
+        if handle is not None:
+            handle.cancel()
+        self._resize_timers[canvas_key] = loop.call_later(_RESIZE_DEBOUNCE_S, update)
     def _update_guide_canvas(self):
         """Update the guide canvas with current guide type and color.
 
@@ -1596,11 +2025,17 @@ class LiveViewGUI:
         Compute the displayed image rectangle and draw guide shapes only within that area.
         """
         try:
-            if not hasattr(self, '_guide_canvas') or self._guide_canvas is None:
+            if self._guide_canvas is None:
+                return
+
+            # Guides off: clear once, then skip sizing/letterboxing work entirely
+            if self._guide_type == "none":
+                if self._guide_canvas.shapes:
+                    self._set_canvas_shapes(self._guide_canvas, [])
                 return
 
-            cw = getattr(self, '_guide_canvas_width', 0)
-            ch = getattr(self, '_guide_canvas_height', 0)
+            cw = self._guide_canvas_width
+            ch = self._guide_canvas_height
             if cw <= 0 or ch <= 0:
                 return
 
@@ -1610,54 +2045,11 @@ class LiveViewGUI:
             except Exception:
                 pass
 
-            # If we don't know source image size, fall back to full canvas
-            src = getattr(self, '_current_frame_size', None)
-            if not src:
-                src_w, src_h = (None, None)
-            else:
-                src_w, src_h = src
-            if not src_w or not src_h:
+            # If we don't know source image size, guides are drawn over the full canvas
+            src = self._current_frame_size
+            if not src or not src[0] or not src[1]:
                 logger.debug("_update_guide_canvas: source frame size unknown; drawing guides over full canvas %sx%s", cw, ch)
-            if not src_w or not src_h:
-                # fallback: draw over full canvas
-                shapes = self._create_guide_shapes(cw, ch)
-                self._guide_canvas.shapes = shapes
-            else:
-                # Account for image rotation: swap dimensions if 90° or 270°
-                rotation = getattr(self, '_active_rotation', 0)
-                if rotation in (90, 270):
-                    display_src_w, display_src_h = src_h, src_w
-                else:
-                    display_src_w, display_src_h = src_w, src_h
-                
-                # Compute displayed image size when using BoxFit.CONTAIN (preserves aspect)
-                scale = min(cw / display_src_w, ch / display_src_h)
-                disp_w = display_src_w * scale
-                disp_h = display_src_h * scale
-                ox = (cw - disp_w) / 2.0
-                oy = (ch - disp_h) / 2.0
-
-                # Create shapes for the image area and then offset them into canvas space
-                shapes = self._create_guide_shapes(disp_w, disp_h)
-                offset_shapes = []
-                for s in shapes:
-                    try:
-                        if isinstance(s, cv.Line):
-                            offset_shapes.append(cv.Line(s.x1 + ox, s.y1 + oy, s.x2 + ox, s.y2 + oy, paint=s.paint))
-                        elif isinstance(s, cv.Circle):
-                            offset_shapes.append(cv.Circle(s.x + ox, s.y + oy, s.radius, paint=s.paint))
-                        else:
-                            # Unknown shape - add as-is
-                            offset_shapes.append(s)
-                    except Exception:
-                        # If shape lacks expected attributes, skip it
-                        continue
-                self._guide_canvas.shapes = offset_shapes
-
-            try:
-                self._guide_canvas.update()
-            except Exception:
-                pass
+            self._set_canvas_shapes(self._guide_canvas, self._get_cached_guide_shapes("live", cw, ch, src))
 
         except Exception as e:
             logger.exception("_update_guide_canvas error")
@@ -1667,91 +2059,144 @@ class LiveViewGUI:
         Align shapes to the preview image area inside the preview overlay (which may be letterboxed).
         """
         try:
-            if not hasattr(self, '_preview_guide_canvas') or self._preview_guide_canvas is None:
+            if self._preview_guide_canvas is None:
+                return
+
+            # Guides off: clear once, then skip sizing/letterboxing work entirely
+            if self._guide_type == "none":
+                if self._preview_guide_canvas.shapes:
+                    self._set_canvas_shapes(self._preview_guide_canvas, [])
                 return
 
-            cw = getattr(self, '_preview_guide_canvas_width', 0)
-            ch = getattr(self, '_preview_guide_canvas_height', 0)
+            cw = self._preview_guide_canvas_width
+            ch = self._preview_guide_canvas_height
             if cw <= 0 or ch <= 0:
                 return
 
             # Try to get source preview image size if available
-            src = getattr(self, '_current_preview_size', None)
-            if not src:
-                src_w, src_h = (None, None)
-            else:
-                src_w, src_h = src
-            if not src_w or not src_h:
-                shapes = self._create_guide_shapes(cw, ch)
-                self._preview_guide_canvas.shapes = shapes
-            else:
-                # Account for image rotation: swap dimensions if 90° or 270°
-                rotation = getattr(self, '_active_rotation', 0)
-                if rotation in (90, 270):
-                    display_src_w, display_src_h = src_h, src_w
-                else:
-                    display_src_w, display_src_h = src_w, src_h
-                
-                scale = min(cw / display_src_w, ch / display_src_h)
-                disp_w = display_src_w * scale
-                disp_h = display_src_h * scale
-                ox = (cw - disp_w) / 2.0
-                oy = (ch - disp_h) / 2.0
-                shapes = self._create_guide_shapes(disp_w, disp_h)
-                offset_shapes = []
-                for s in shapes:
-                    try:
-                        if isinstance(s, cv.Line):
-                            offset_shapes.append(cv.Line(s.x1 + ox, s.y1 + oy, s.x2 + ox, s.y2 + oy, paint=s.paint))
-                        elif isinstance(s, cv.Circle):
-                            offset_shapes.append(cv.Circle(s.x + ox, s.y + oy, s.radius, paint=s.paint))
-                        else:
-                            offset_shapes.append(s)
-                    except Exception:
-                        continue
-                self._preview_guide_canvas.shapes = offset_shapes
-
-            try:
-                self._preview_guide_canvas.update()
-            except Exception:
-                pass
+            src = self._current_preview_size
+            self._set_canvas_shapes(self._preview_guide_canvas, self._get_cached_guide_shapes("preview", cw, ch, src))
         except Exception as e:
             logger.exception("_update_preview_guide_canvas error")
+    def _set_canvas_shapes(self, canvas, shapes):
+        """Show shapes on a guide canvas, skipping the update if nothing changed.
+
+        _get_cached_guide_shapes returns the same list object for an unchanged
+        layout, so an identity check is enough to avoid re-sending (and having
+        Flet re-diff) a shape list the canvas already holds.
+        """
+        if canvas.shapes is shapes:
+            return
+        canvas.shapes = shapes
+        try:
+            canvas.update()
+        except Exception:
+            pass
+
+    def _get_cached_guide_shapes(self, canvas_key, cw, ch, src):
+        """Return guide shapes for a canvas, letterboxed to the displayed image area.
+
+        Shape lists are memoized per (canvas, guide type, color, canvas size, source
+        size, rotation), so switching guides back and forth or re-rendering the same
+        layout reuses the existing shape objects instead of rebuilding them. Each
+        canvas gets its own entries since a control can only have one parent.
+
+        Args:
+            canvas_key: "live" or "preview"
+            cw, ch: Canvas size
+            src: (width, height) of the source image, or None to use the full canvas
+        """
+        rotation = self._active_rotation
+        key = (canvas_key, self._guide_type, self._guide_color, cw, ch, src, rotation)
+        shapes = self._guide_shape_cache.get(key)
+        if shapes is not None:
+            self._guide_shape_cache.move_to_end(key)
+            return shapes
+
+        src_w, src_h = src if src else (None, None)
+        if not src_w or not src_h:
+            # fallback: draw over full canvas
+            lines, circles = self._create_guide_shapes(cw, ch)
+        else:
+            # Account for image rotation: swap dimensions if 90° or 270°
+            if rotation in (90, 270):
+                display_src_w, display_src_h = src_h, src_w
+            else:
+                display_src_w, display_src_h = src_w, src_h
+            
+            # Compute displayed image size when using BoxFit.CONTAIN (preserves aspect)
+            scale = min(cw / display_src_w, ch / display_src_h)
+            disp_w = display_src_w * scale
+            disp_h = display_src_h * scale
+            ox = (cw - disp_w) / 2.0
+            oy = (ch - disp_h) / 2.0
+
+            # Create geometry for the image area and offset it into canvas space,
+            # one vectorized add per array
+            lines, circles = self._create_guide_shapes(disp_w, disp_h)
+            lines = lines + (ox, oy, ox, oy)
+            circles = circles + (ox, oy, 0.0)
+
+        # One shared Paint for every shape of this update
+        paint = self._get_guide_paint()
+        shapes = [cv.Line(x1, y1, x2, y2, paint=paint) for x1, y1, x2, y2 in lines.tolist()]
+        shapes.extend(cv.Circle(x, y, r, paint=paint) for x, y, r in circles.tolist())
+
+        # Keep the cache bounded (window resizes produce many distinct sizes); evict
+        # least recently used entries so the layouts in use survive a resize storm
+        self._guide_shape_cache[key] = shapes
+        while len(self._guide_shape_cache) > _GUIDE_SHAPE_CACHE_SIZE:
+            self._guide_shape_cache.popitem(last=False)
+        return shapes
+
     def _create_guide_shapes(self, w, h):
-        """Create guide shapes for the given dimensions.
+        """Create guide geometry for the given dimensions.
         
         Note: The camera handler rotates the actual image data, so w and h
         are already in the correct orientation. No additional transformation needed.
+
+        Returns:
+            tuple: (lines, circles) float arrays of shape (N, 4) as x1, y1, x2, y2
+            and (M, 3) as x, y, radius
+        """
+        lines, circles = self._create_guide_geometry(w, h)
+        return (
+            np.asarray(lines, dtype=np.float64).reshape(-1, 4),
+            np.asarray(circles, dtype=np.float64).reshape(-1, 3),
+        )
+
+    def _build_guide_dispatch(self):
+        """
+        Build the guide type table used by _create_guide_geometry.
+
+        "none" is intentionally absent: unknown types and "none" draw nothing.
+
+        Returns:
+            dict: guide type -> callable taking (w, h) and returning (lines, circles)
         """
-        if self._guide_type == "none":
-            return []
-        elif self._guide_type == "thirds":
-            return self._create_thirds_shapes(w, h)
-        elif self._guide_type == "golden":
-            return self._create_golden_shapes(w, h)
-        elif self._guide_type == "grid":
-            return self._create_grid_shapes(w, h)
-        elif self._guide_type == "diagonal":
-            return self._create_diagonal_shapes(w, h)
-        elif self._guide_type == "center":
-            return self._create_center_shapes(w, h)
-        elif self._guide_type == "fibonacci":
-            return self._create_fibonacci_shapes(w, h, flip_h=False, flip_v=False)
-        elif self._guide_type == "fibonacci_vflip":
-            return self._create_fibonacci_shapes(w, h, flip_h=False, flip_v=True)
-        elif self._guide_type == "fibonacci_hflip":
-            return self._create_fibonacci_shapes(w, h, flip_h=True, flip_v=False)
-        elif self._guide_type == "fibonacci_both":
-            return self._create_fibonacci_shapes(w, h, flip_h=True, flip_v=True)
-        elif self._guide_type == "triangles":
-            return self._create_triangles_shapes(w, h, flipped=False)
-        elif self._guide_type == "triangles_flip":
-            return self._create_triangles_shapes(w, h, flipped=True)
-        return []
+        return {
+            'thirds': self._create_thirds_shapes,
+            'golden': self._create_golden_shapes,
+            'grid': self._create_grid_shapes,
+            'diagonal': self._create_diagonal_shapes,
+            'center': self._create_center_shapes,
+            'fibonacci': functools.partial(self._create_fibonacci_shapes, flip_h=False, flip_v=False),
+            'fibonacci_vflip': functools.partial(self._create_fibonacci_shapes, flip_h=False, flip_v=True),
+            'fibonacci_hflip': functools.partial(self._create_fibonacci_shapes, flip_h=True, flip_v=False),
+            'fibonacci_both': functools.partial(self._create_fibonacci_shapes, flip_h=True, flip_v=True),
+            'triangles': functools.partial(self._create_triangles_shapes, flipped=False),
+            'triangles_flip': functools.partial(self._create_triangles_shapes, flipped=True),
+        }
+
+    def _create_guide_geometry(self, w, h):
+        """Dispatch to the creator for the current guide type; returns (lines, circles)."""
+        creator = self._guide_dispatch.get(self._guide_type)
+        if creator is None:
+            return (), ()
+        return creator(w, h)
 
     def _create_thirds_shapes(self, w, h):
         """Create rule of thirds guide shapes."""
-        paint = self._get_guide_paint()
         # Vertical lines at 1/3 and 2/3
         x1 = w / 3
         x2 = w * 2 / 3
@@ -1759,15 +2204,14 @@ class LiveViewGUI:
         y1 = h / 3
         y2 = h * 2 / 3
         return [
-            cv.Line(x1, 0, x1, h, paint=paint),
-            cv.Line(x2, 0, x2, h, paint=paint),
-            cv.Line(0, y1, w, y1, paint=paint),
-            cv.Line(0, y2, w, y2, paint=paint),
-        ]
+            (x1, 0, x1, h),
+            (x2, 0, x2, h),
+            (0, y1, w, y1),
+            (0, y2, w, y2),
+        ], ()
 
     def _create_golden_shapes(self, w, h):
         """Create golden ratio guide shapes."""
-        paint = self._get_guide_paint()
         # Golden ratio: φ ≈ 1.618, positions at ~0.382 and ~0.618
         phi = 0.381966  # 1 - 1/φ
         x1 = w * phi
@@ -1775,46 +2219,44 @@ class LiveViewGUI:
         y1 = h * phi
         y2 = h * (1 - phi)
         return [
-            cv.Line(x1, 0, x1, h, paint=paint),
-            cv.Line(x2, 0, x2, h, paint=paint),
-            cv.Line(0, y1, w, y1, paint=paint),
-            cv.Line(0, y2, w, y2, paint=paint),
-        ]
+            (x1, 0, x1, h),
+            (x2, 0, x2, h),
+            (0, y1, w, y1),
+            (0, y2, w, y2),
+        ], ()
 
     def _create_grid_shapes(self, w, h):
         """Create 3x3 grid guide shapes (same as thirds but more visible)."""
-        paint = self._get_guide_paint()
         shapes = []
         # 3x3 grid = 4 lines each direction
         for i in range(1, 4):
             x = w * i / 4
             y = h * i / 4
-            shapes.append(cv.Line(x, 0, x, h, paint=paint))
-            shapes.append(cv.Line(0, y, w, y, paint=paint))
-        return shapes
+            shapes.append((x, 0, x, h))
+            shapes.append((0, y, w, y))
+        return shapes, ()
 
     def _create_diagonal_shapes(self, w, h):
         """Create diagonal guide shapes from corners."""
-        paint = self._get_guide_paint()
         return [
             # Main diagonals
-            cv.Line(0, 0, w, h, paint=paint),
-            cv.Line(w, 0, 0, h, paint=paint),
-        ]
+            (0, 0, w, h),
+            (w, 0, 0, h),
+        ], ()
 
     def _create_center_shapes(self, w, h):
         """Create center crosshair shapes."""
-        paint = self._get_guide_paint()
         cx = w / 2
         cy = h / 2
         # Small crosshair at center
         size = min(w, h) * 0.05  # 5% of smaller dimension
-        return [
-            cv.Line(cx - size, cy, cx + size, cy, paint=paint),
-            cv.Line(cx, cy - size, cx, cy + size, paint=paint),
-            # Optional: add a small circle
-            cv.Circle(cx, cy, size * 0.5, paint=paint),
+        lines = [
+            (cx - size, cy, cx + size, cy),
+            (cx, cy - size, cx, cy + size),
         ]
+        # Optional: add a small circle
+        circles = [(cx, cy, size * 0.5)]
+        return lines, circles
 
     def _create_fibonacci_shapes(self, w, h, flip_h=False, flip_v=False):
         """
@@ -1831,102 +2273,18 @@ class LiveViewGUI:
             flip_h: Flip horizontally (mirror vertically around horizontal axis)
             flip_v: Flip vertically (mirror horizontally around vertical axis)
         """
-        import math
-        paint = self._get_guide_paint()
-        shapes = []
-        points = []
 
-        # 1. Konfiguracja Wirtualnego Płótna (Idealny Złoty Prostokąt)
-        # Pracujemy na liczbach zmiennoprzecinkowych 0.0 -> PHI
-        PHI = 1.61803398875
-        
-        # Ustalamy wirtualne granice.
-        # Zakładamy orientację Landscape (poziomą), bo to standard w aparatach.
-        v_left, v_top = 0.0, 0.0
-        v_right, v_bottom = PHI, 1.0
-        
-        # Kierunek: 0=Lewo, 1=Góra, 2=Prawo, 3=Dół
-        direction = 0 
-        iterations = 16 # Wystarczająco, by zejść do niewidocznych detali
-
-        for i in range(iterations):
-            # Obliczamy wymiary wirtualnego pudełka
-            v_width = v_right - v_left
-            v_height = v_bottom - v_top
-            
-            # W idealnym Złotym Prostokącie ten algorytm NIGDY się nie zatnie.
-            side = min(v_width, v_height)
-            
-            cx, cy = 0.0, 0.0
-            angle_start, angle_end = 0, 0
+        # 2. MAPOWANIE (Skalowanie) do rzeczywistego ekranu; punkty wirtualne
+        # (0..1) są liczone raz, tu tylko skalujemy i odbijamy całą tablicę
+        pts = _fibonacci_unit_points() * (float(w), float(h))
+        # Obsługa lustrzanego odbicia
+        if flip_v:  # Vertical flip (mirror around vertical axis)
+            pts[:, 0] = w - pts[:, 0]
+        if flip_h:  # Horizontal flip (mirror around horizontal axis)
+            pts[:, 1] = h - pts[:, 1]
 
-            step = direction % 4
-            
-            if step == 0:  # Lewy kwadrat (łuk w górę)
-                cx = v_left + side
-                cy = v_top + side
-                angle_start, angle_end = 180, 270
-                v_left += side
-
-            elif step == 1: # Górny kwadrat (łuk w prawo)
-                cx = v_left
-                cy = v_top + side
-                angle_start, angle_end = 270, 360
-                v_top += side
-
-            elif step == 2: # Prawy kwadrat (łuk w dół)
-                cx = v_right - side
-                cy = v_top
-                angle_start, angle_end = 0, 90
-                v_right -= side
-
-            elif step == 3: # Dolny kwadrat (łuk w lewo)
-                cx = v_right
-                cy = v_bottom - side
-                angle_start, angle_end = 90, 180
-                v_bottom -= side
-
-            direction += 1
-
-            # Generowanie punktów w przestrzeni wirtualnej
-            segments = 10
-            a_start_rad = math.radians(angle_start)
-            a_end_rad = math.radians(angle_end)
-            
-            for j in range(segments + 1):
-                t = j / segments
-                ang = a_start_rad + (a_end_rad - a_start_rad) * t
-                
-                # Punkt na wirtualnym płótnie
-                vx = cx + side * math.cos(ang)
-                vy = cy + side * math.sin(ang)
-                
-                # 2. MAPOWANIE (Skalowanie) do rzeczywistego ekranu
-                # Przeliczamy współrzędną wirtualną (0..PHI) na ekranową (0..w)
-                # To sprawia, że spirala idealnie wypełnia kadr 16:9
-                
-                screen_x = (vx / PHI) * w
-                screen_y = (vy / 1.0) * h
-                
-                points.append((screen_x, screen_y))
-
-        # 3. Rysowanie
-        prev_pt = None
-        for pt in points:
-            px, py = pt
-            
-            # Obsługa lustrzanego odbicia
-            if flip_v:  # Vertical flip (mirror around vertical axis)
-                px = w - px
-            if flip_h:  # Horizontal flip (mirror around horizontal axis)
-                py = h - py
-            
-            if prev_pt is not None:
-                # Rzutowanie na int jest bezpieczne dla cv.Line, ale zachowujemy float w obliczeniach
-                shapes.append(cv.Line(prev_pt[0], prev_pt[1], px, py, paint=paint))
-            prev_pt = (px, py)
-
-        return shapes
+        # 3. Rysowanie: kolejne punkty łączone odcinkami (x0, y0, x1, y1)
+        return np.concatenate((pts[:-1], pts[1:]), axis=1), ()
 
     def _create_triangles_shapes(self, w, h, flipped=False):
         """Create golden/harmonious triangle guide shapes.
@@ -1938,64 +2296,29 @@ class LiveViewGUI:
         The perpendicular intersection point divides the diagonal at a
         ratio based on the frame's aspect ratio.
         """
-        import math
-        paint = self._get_guide_paint()
-        
-        # Calculate the perpendicular distance from corner to main diagonal
-        # For a rectangle with width w and height h, the main diagonal goes
-        # from (0,0) to (w,h). The perpendicular from (w,0) hits the diagonal
-        # at a specific point.
-        
-        # The distance along the diagonal where the perpendicular from (w,0) meets it:
-        # Using projection formula: the foot of perpendicular from point P to line AB
-        # For diagonal from A(0,0) to B(w,h), perpendicular from P(w,0):
-        # dst = (w*w) / sqrt(w*w + h*h) ... but we need the actual intersection point
-        
-        # The perpendicular from (w,0) to line y = (h/w)*x meets at:
-        # x = w*w / (w + h*h/w) = w^2 / (w + h^2/w) = w^3 / (w^2 + h^2)
-        # y = h * x / w
-        
-        # Actually, for harmonious triangles, we compute dst as:
-        # dst = height * cos(atan(width/height)) / cos(atan(height/width))
-        # This gives the x-coordinate where the perpendicular from top-right corner
-        # meets the left edge (extended if needed)
-        
-        # Simpler: compute intersection of perpendicular with diagonal
-        diag_len_sq = w * w + h * h
-        
-        # Perpendicular from (w, 0) to diagonal y = (h/w)*x
-        # Foot of perpendicular: t = (w*w + 0*h) / (w*w + h*h) = w*w / diag_len_sq
-        # Point on diagonal: (t*w, t*h) = (w^3/diag_len_sq, w^2*h/diag_len_sq)
-        px1 = (w * w * w) / diag_len_sq
-        py1 = (w * w * h) / diag_len_sq
-        
-        # Perpendicular from (0, h) to diagonal
-        # Foot of perpendicular: t = (0*w + h*h) / diag_len_sq = h*h / diag_len_sq  
-        # Point on diagonal: (t*w, t*h) = (w*h^2/diag_len_sq, h^3/diag_len_sq)
-        px2 = (w * h * h) / diag_len_sq
-        py2 = (h * h * h) / diag_len_sq
+        px1, py1, px2, py2 = _triangle_feet(w, h)
         
         if not flipped:
             # Standard orientation: main diagonal from top-left to bottom-right
             return [
                 # Main diagonal from top-left (0,0) to bottom-right (w,h)
-                cv.Line(0, 0, w, h, paint=paint),
+                (0, 0, w, h),
                 # Perpendicular from top-right (w,0) to the diagonal
-                cv.Line(w, 0, px1, py1, paint=paint),
+                (w, 0, px1, py1),
                 # Perpendicular from bottom-left (0,h) to the diagonal
-                cv.Line(0, h, px2, py2, paint=paint),
-            ]
+                (0, h, px2, py2),
+            ], ()
         else:
             # Flipped orientation: main diagonal from top-right to bottom-left
             # Mirror the x-coordinates
             return [
                 # Main diagonal from top-right (w,0) to bottom-left (0,h)
-                cv.Line(w, 0, 0, h, paint=paint),
+                (w, 0, 0, h),
                 # Perpendicular from top-left (0,0) to the diagonal
-                cv.Line(0, 0, w - px1, py1, paint=paint),
+                (0, 0, w - px1, py1),
                 # Perpendicular from bottom-right (w,h) to the diagonal
-                cv.Line(w, h, w - px2, py2, paint=paint),
-            ]
+                (w, h, w - px2, py2),
+            ], ()
 
     # --- Preview Mode Methods ---
     
@@ -2003,23 +2326,13 @@ class LiveViewGUI:
         """Callback invoked when a new preview image is ready."""
         # Preview ready for display
         try:
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._show_preview_async(cached_image), self._loop)
-            else:
-                self._show_preview(cached_image)
+            self._schedule(self._show_preview, cached_image)
         except Exception as e:
             logger.exception("Exception in _on_new_preview")
     
-    async def _show_preview_async(self, cached_image: CachedImage):
-        """Async wrapper to show preview on main loop."""
-        self._show_preview(cached_image)
-    
     def _show_preview(self, cached_image: CachedImage, reset_timer: bool = True):
         """Show the preview overlay with the given image."""
         try:
-            # Update interaction timestamp first
-            self._last_user_interaction = time.time()
-            
             # If already showing this exact image, just reset timer
             if (self._preview_mode and 
                 hasattr(self._preview_image, 'src') and 
@@ -2027,67 +2340,65 @@ class LiveViewGUI:
                 not reset_timer):
                 return
             
-            was_preview = getattr(self, '_preview_mode', False)
+            was_preview = self._preview_mode
             self._preview_mode = True
+            # Controls that actually changed in this transition
+            dirty = []
             
             # Update preview image using file path (much faster than base64!)
-            self._preview_image.src = cached_image.filepath
+            if _set_if_changed(self._preview_image, 'src', cached_image.filepath):
+                dirty.append(self._preview_image)
             # Record preview image original size for proper guide alignment
+            # (known from the preview manager when it saved the JPEG; otherwise the
+            # header is read once, off the event loop, and kept on the cache entry)
             try:
-                img = cv2.imread(cached_image.filepath)
-                if img is not None:
-                    h, w = img.shape[:2]
-                    self._current_preview_size = (w, h)
-                    # Recompute preview guide shapes immediately so portrait/landscape images
-                    # get correct, letterboxed guide overlays on each cycle.
-                    try:
-                        logger.debug("Preview image size detected: %sx%s", w, h)
-                        self._update_preview_guide_canvas()
-                    except Exception:
-                        pass
+                size = cached_image.size
+                if size is None and self._on_event_loop():
+                    self._current_preview_size = None
+                    fut = self._loop.run_in_executor(None, self._probe_file_size, cached_image.filepath)
+                    fut.add_done_callback(lambda f, img=cached_image: self._on_preview_size_probed(img, f))
+                else:
+                    if size is None:
+                        size = self._probe_file_size(cached_image.filepath)
+                        cached_image.size = size
+                    self._apply_preview_size(size)
             except Exception:
                 self._current_preview_size = None
             
             # Update filename
-            self._preview_filename_text.value = cached_image.filename
+            if _set_if_changed(self._preview_filename_text, 'value', cached_image.filename):
+                dirty.append(self._preview_filename_text)
             
             # Update counter and show overlay
             current, total = self._preview_manager.get_cache_info()
-            self._preview_counter_text.value = t('preview_counter', current=current, total=total)
-            self._preview_overlay.visible = True
-            # show HUD elements on top of controls; update main status to preview
-            try:
-                # Only save previous status when entering preview from live view
-                if not was_preview:
-                    self._prev_status = {
-                        'value': self.status_text.value,
-                        'color': self.status_text.color,
-                        'opacity': getattr(self.status_text, 'opacity', None),
-                        'icon_name': getattr(self.status_icon, 'name', None),
-                        'icon_color': getattr(self.status_icon, 'color', None),
-                    }
-                    try:
-                        logger.debug("saved prev_status: %s", self._prev_status)
-                    except Exception:
-                        pass
-                    # set shared status to Preview mode (green still camera)
-                    self.status_text.value = t('preview_mode')
-                    self.status_text.color = ft.Colors.GREEN_400
-                    try:
-                        self.status_text.opacity = 0.95
-                    except Exception:
-                        pass
-                    self.status_icon.name = ft.Icons.PHOTO_CAMERA
-                    self.status_icon.color = ft.Colors.GREEN_400
-
-                # Always ensure HUD elements are visible when previewing
-                self._preview_filename_container.visible = True
-                self._preview_counter_container.visible = True
-            except Exception:
-                pass
-            self.page.update()
+            if _set_if_changed(self._preview_counter_text, 'value', t('preview_counter', current=current, total=total)):
+                dirty.append(self._preview_counter_text)
+            if _set_if_changed(self._preview_overlay, 'visible', True):
+                dirty.append(self._preview_overlay)
+            # show HUD elements on top of controls; update main status to preview.
+            # Only save previous status when entering preview from live view
+            if not was_preview:
+                st, si = self.status_text, self.status_icon
+                prev = self._prev_status
+                prev['value'] = st.value
+                prev['color'] = st.color
+                prev['opacity'] = getattr(st, 'opacity', None)
+                prev['icon_name'] = getattr(si, 'name', None)
+                prev['icon_color'] = getattr(si, 'color', None)
+                self._prev_status_valid = True
+                logger.debug("saved prev_status: %s", self._prev_status)
+                # set shared status to Preview mode (green still camera)
+                self._apply_status(dirty, self._tc('preview_mode'), *_PREVIEW_STATUS_STYLE)
+
+            # Always ensure HUD elements are visible when previewing
+            for hud in (self._preview_filename_container, self._preview_counter_container):
+                if _set_if_changed(hud, 'visible', True):
+                    dirty.append(hud)
+            # One targeted update with only the controls that changed; re-showing
+            # the same state sends nothing
+            self._mark_dirty(*dirty)
             # Log concise preview info
-            logger.info(f"GUI: showing preview {cached_image.filename} ({current}/{total})")
+            logger.info("GUI: showing preview %s (%s/%s)", cached_image.filename, current, total)
             # Start/reset auto-hide timer
             if reset_timer:
                 self._start_preview_timer()
@@ -2095,107 +2406,197 @@ class LiveViewGUI:
         except Exception as e:
             logger.exception("Exception in _show_preview")
     
-    def _hide_preview(self):
-        """Hide the preview overlay and return to live view."""
+    def _on_event_loop(self):
+        """Return True when called on the captured Flet event loop's thread."""
+        if self._loop is None:
+            return False
         try:
-            self._preview_mode = False
-            self._preview_overlay.visible = False
-            # hide HUD elements and restore status
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _schedule(self, fn, *args):
+        """Run fn(*args) on the Flet event loop.
+
+        Callbacks that already run on the loop use plain call_soon() and skip the
+        thread-safe self-pipe wakeup; other threads go through
+        call_soon_threadsafe(). Without a captured (or still open) loop, fn runs
+        immediately.
+
+        Args:
+            fn: Callable to run on the loop
+            *args: Positional arguments passed to fn
+        """
+        loop = self._loop
+        if loop is not None:
             try:
-                self._preview_filename_container.visible = False
-                self._preview_counter_container.visible = False
-                # restore previous status
-                prev = getattr(self, '_prev_status', None)
-                if prev:
-                    try:
-                        logger.debug("restoring status from preview: %s", prev)
-                        self.status_text.value = prev.get('value', self.status_text.value)
-                        self.status_text.color = prev.get('color', self.status_text.color)
-                        if prev.get('opacity') is not None:
-                            try:
-                                self.status_text.opacity = prev.get('opacity')
-                            except Exception:
-                                pass
-                        self.status_icon.name = prev.get('icon_name', self.status_icon.name)
-                        self.status_icon.color = prev.get('icon_color', self.status_icon.color)
-                    except Exception:
-                        pass
-                    finally:
-                        # clear saved state
-                        try:
-                            self._prev_status = None
-                        except Exception:
-                            pass
+                if self._on_event_loop():
+                    loop.call_soon(fn, *args)
                 else:
-                    # No saved state - fall back to streaming if stream appears active
-                    try:
-                        if getattr(self, 'streaming_event', None) and self.streaming_event.is_set():
-                            self.status_text.value = t('status_streaming')
-                            self.status_text.color = ft.Colors.AMBER_400
-                            self.status_text.opacity = 0.7
-                            # Transmission: yellow video camera icon
-                            self.status_icon.name = ft.Icons.VIDEOCAM
-                            self.status_icon.color = ft.Colors.AMBER_400
-                    except Exception:
-                        pass
+                    loop.call_soon_threadsafe(fn, *args)
+                return
+            except Exception:
+                # Loop closed (shutting down): fall back to a direct call
+                pass
+        fn(*args)
+
+    def _apply_preview_size(self, size):
+        """Record the shown preview's (width, height) and re-letterbox its guides."""
+        self._current_preview_size = size
+        if size is not None:
+            # Recompute preview guide shapes immediately so portrait/landscape images
+            # get correct, letterboxed guide overlays on each cycle.
+            try:
+                logger.debug("Preview image size detected: %sx%s", size[0], size[1])
+                self._update_preview_guide_canvas()
             except Exception:
                 pass
+
+    def _on_preview_size_probed(self, cached_image, fut):
+        """Event-loop callback for a preview size probed in the executor."""
+        try:
+            size = fut.result()
+        except Exception:
+            logger.debug("Preview size probe failed for %s", cached_image.filepath, exc_info=True)
+            size = None
+        cached_image.size = size
+        # Only apply if that image is still the one on screen
+        if self._preview_mode and self._preview_image.src == cached_image.filepath:
+            self._apply_preview_size(size)
+
+    def _hide_preview(self):
+        """Hide the preview overlay and return to live view."""
+        try:
+            self._preview_mode = False
             self._preview_manager.reset_to_live_view()
             
             # Cancel any pending timer
-            if self._preview_timer:
-                self._preview_timer.cancel()
-                self._preview_timer = None
+            self._cancel_preview_timer()
+
+            # Controls that actually changed in this transition
+            dirty = []
+            # hide overlay and HUD elements (already-hidden ones are left alone, so a
+            # repeated hide sends nothing) and restore status
+            for ctrl in (self._preview_overlay, self._preview_filename_container, self._preview_counter_container):
+                if _set_if_changed(ctrl, 'visible', False):
+                    dirty.append(ctrl)
+            # restore previous status; the snapshot is consumed up front so a failed
+            # restore never leaves stale state behind
+            had_prev = self._prev_status_valid
+            self._prev_status_valid = False
+            if had_prev:
+                prev = self._prev_status
+                logger.debug("restoring status from preview: %s", prev)
+                self._apply_status(
+                    dirty, prev['value'], prev['color'], prev['opacity'],
+                    prev['icon_name'], prev['icon_color'],
+                )
+            elif self.streaming_event.is_set():
+                # No saved state - fall back to streaming since the stream is active
+                # (transmission: yellow video camera icon)
+                self._apply_status(dirty, self._tc('status_streaming'), *_STREAMING_STATUS_STYLE)
             
             # Ensure autorotate HUD is not left in a strange visible state
-            try:
-                if hasattr(self, '_autorotate_btn') and self._autorotate_btn is not None:
-                    try:
-                        self._autorotate_btn.visible = True
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            if self._autorotate_btn is not None and _set_if_changed(self._autorotate_btn, 'visible', True):
+                dirty.append(self._autorotate_btn)
             
-            self.page.update()
+            # One targeted update with only the controls that changed
+            self._mark_dirty(*dirty)
             
         except Exception as e:
             logger.exception("Exception in _hide_preview")
+    def _tc(self, key):
+        """Return t(key) for a key without format arguments, cached per locale."""
+        value = self._t_cache.get(key)
+        if value is None:
+            value = self._t_cache[key] = t(key)
+        return value
+
+    def _apply_status(self, dirty, value, color, opacity, icon_name, icon_color):
+        """Set the shared status text and icon, appending changed controls to dirty.
+
+        Args:
+            dirty: List collecting the controls that need an update
+            value, color, opacity: Status text fields (opacity None keeps the current one)
+            icon_name, icon_color: Status icon fields
+        """
+        st, si = self.status_text, self.status_icon
+        # Bitwise | so every field is applied, not just up to the first change
+        changed = _set_if_changed(st, 'value', value) | _set_if_changed(st, 'color', color)
+        if opacity is not None:
+            changed |= _set_if_changed(st, 'opacity', opacity)
+        if changed:
+            dirty.append(st)
+        if _set_if_changed(si, 'name', icon_name) | _set_if_changed(si, 'color', icon_color):
+            dirty.append(si)
+
     def _start_preview_timer(self):
-        """Start timer to auto-hide preview after timeout."""
-        # Cancel existing timer
+        """Start timer to auto-hide preview after timeout.
+
+        Uses a TimerHandle on the Flet event loop (no thread per timer); calls from
+        other threads are forwarded to the loop first. The timeout is tracked as a
+        monotonic deadline: while a timer is pending, pushing the deadline out only
+        updates it and the timer re-arms itself for the rest when it fires, so rapid
+        navigation does not cancel and reschedule on every key press.
+        """
+        loop = self._loop
+        if loop is not None:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                loop.call_soon_threadsafe(self._start_preview_timer)
+                return
+
+        # Skip timer if duration is infinity
+        if self._preview_duration == float('inf'):
+            self._cancel_preview_timer()
+            return
+
+        deadline = time.monotonic() + self._preview_duration
+        if self._preview_timer is not None and deadline >= self._preview_deadline:
+            self._preview_deadline = deadline
+            return
+
+        # No timer yet, or the deadline moved earlier (shorter duration selected)
+        self._cancel_preview_timer()
+        self._preview_deadline = deadline
+        self._arm_preview_timer(self._preview_duration)
+
+    def _arm_preview_timer(self, delay):
+        """Schedule _on_preview_timeout after delay seconds."""
+        loop = self._loop
+        if loop is not None:
+            self._preview_timer = loop.call_later(delay, self._on_preview_timeout)
+        else:
+            # No event loop captured yet: fall back to a thread timer
+            self._preview_timer = threading.Timer(delay, self._on_preview_timeout)
+            self._preview_timer.daemon = True
+            self._preview_timer.start()
+
+    def _cancel_preview_timer(self):
+        """Cancel the pending auto-hide timer, if any."""
         if self._preview_timer:
             self._preview_timer.cancel()
             self._preview_timer = None
-        
-        # Skip timer if duration is infinity
-        if self._preview_duration == float('inf'):
+
+    def _on_preview_timeout(self):
+        """Hide the preview once its deadline has passed, or re-arm for the rest."""
+        self._preview_timer = None
+        if not self._preview_mode:
             return
-        
-        def _timer_callback():
-            # Check if user has interacted recently
-            elapsed = time.time() - self._last_user_interaction
-            if elapsed >= self._preview_duration and self._preview_mode:
-                # Schedule hide on main loop
-                if self._loop:
-                    asyncio.run_coroutine_threadsafe(
-                        self._hide_preview_async(), self._loop
-                    )
-                else:
-                    self._hide_preview()
-        
-        self._preview_timer = threading.Timer(self._preview_duration, _timer_callback)
-        self._preview_timer.daemon = True
-        self._preview_timer.start()
+        remaining = self._preview_deadline - time.monotonic()
+        if remaining > 0:
+            # Deadline was pushed out (user kept navigating) since this timer was armed
+            self._arm_preview_timer(remaining)
+        else:
+            self._hide_preview()
     
-    async def _hide_preview_async(self):
-        """Async wrapper to hide preview on main loop."""
-        self._hide_preview()
-
     def _toggle_autorotate(self):
         """Toggle the autorotate setting and update UI."""
         try:
-            self._autorotate_enabled = not getattr(self, '_autorotate_enabled', True)
+            self._autorotate_enabled = not self._autorotate_enabled
             logger.info("Autorotate %s", 'enabled' if self._autorotate_enabled else 'disabled')
             self._update_autorotate_ui()
         except Exception as e:
@@ -2204,32 +2605,38 @@ class LiveViewGUI:
     def _update_autorotate_ui(self):
         """Update the autorotate button appearance to reflect current state."""
         try:
-            btn = getattr(self, '_autorotate_btn', None)
-            if not btn:
+            btn = self._autorotate_btn
+            if btn is None:
                 return
-            # The button content is an Icon; change color to indicate enabled/disabled
+            # Nothing to do if this button already shows this state (idempotent calls)
+            state = bool(self._autorotate_enabled)
+            last = self._last_autorotate_ui_state
+            if last is not None and last[0] is btn and last[1] == state:
+                return
+            # The button content is an Icon; change color to indicate enabled/disabled.
+            # Only fields that actually differ are assigned, so Flet ships just those.
+            dirty = False
             try:
                 icon = getattr(btn, 'content', None)
                 if icon and hasattr(icon, 'color'):
-                    icon.color = ft.Colors.AMBER_400 if self._autorotate_enabled else ft.Colors.WHITE54
+                    dirty |= _set_if_changed(icon, 'color', ft.Colors.AMBER_400 if state else ft.Colors.WHITE54)
             except Exception:
                 pass
 
-            # Background highlight when enabled
+            # Background highlight when enabled (shared constants, so the compare is cheap)
             try:
-                if self._autorotate_enabled:
-                    btn.bgcolor = "rgba(100,100,255,0.18)"
-                    btn.border = ft.border.all(2, ft.Colors.BLUE_400)
-                else:
-                    btn.bgcolor = None
-                    btn.border = ft.border.all(1, ft.Colors.GREY_700)
+                dirty |= _set_if_changed(btn, 'bgcolor', _BG_TOGGLE_ON if state else None)
+                dirty |= _set_if_changed(btn, 'border', _BORDER_SELECTED if state else _BORDER_IDLE)
             except Exception:
                 pass
 
-            try:
-                btn.update()
-            except Exception:
-                pass
+            # Properties are applied now even if the update below fails (not yet mounted)
+            self._last_autorotate_ui_state = (btn, state)
+            if dirty:
+                try:
+                    btn.update()
+                except Exception:
+                    pass
         except Exception as e:
             logger.exception("_update_autorotate_ui error")
 
@@ -2238,86 +2645,52 @@ class LiveViewGUI:
         try:
             win = getattr(self.page, 'window', None)
             if win is not None:
-                current_fs = getattr(win, 'full_screen', False)
-                if not current_fs:
-                    # Save current bounds (may be None on some platforms)
-                    self._saved_window_bounds = {
-                        'width': getattr(win, 'width', None),
-                        'height': getattr(win, 'height', None),
-                        'left': getattr(win, 'left', None),
-                        'top': getattr(win, 'top', None),
-                        'maximized': getattr(win, 'maximized', None),
-                    }
-                    try:
-                        win.full_screen = True
-                        win.update()
-                    except Exception:
-                        logger.exception("Failed setting window.full_screen")
-                else:
-                    try:
-                        win.full_screen = False
-                        win.update()
-                    except Exception:
-                        logger.exception("Failed unsetting window.full_screen")
-                    b = getattr(self, '_saved_window_bounds', None)
-                    if b:
-                        try:
-                            if b.get('width') is not None:
-                                win.width = b['width']
-                            if b.get('height') is not None:
-                                win.height = b['height']
-                            if b.get('left') is not None:
-                                win.left = b['left']
-                            if b.get('top') is not None:
-                                win.top = b['top']
-                            if b.get('maximized') is not None:
-                                win.maximized = b['maximized']
-                            win.update()
-                        except Exception:
-                            logger.exception("Failed restoring window bounds")
-                        finally:
-                            self._saved_window_bounds = None
-                # Update UI to reflect state
-                self._update_fullscreen_ui()
-                return
+                target, fs_attr, fields = win, 'full_screen', _WIN_BOUND_FIELDS
+            else:
+                # Fallback: older attribute names on page
+                target, fs_attr, fields = self.page, 'window_full_screen', _PAGE_WINDOW_BOUND_FIELDS
 
-            # Fallback: older attribute names on page
-            current_fs = getattr(self.page, 'window_full_screen', False)
-            if not current_fs:
-                self._saved_window_bounds = {
-                    'width': getattr(self.page, 'window_width', None),
-                    'height': getattr(self.page, 'window_height', None),
-                    'x': getattr(self.page, 'window_x', None),
-                    'y': getattr(self.page, 'window_y', None),
-                }
+            if not getattr(target, fs_attr, False):
+                # Save current bounds (may be None on some platforms)
                 try:
-                    self.page.window_full_screen = True
+                    bounds = _GET_WIN_BOUNDS(target) if win is not None else None
+                except AttributeError:
+                    bounds = None
+                if bounds is None:
+                    bounds = tuple(getattr(target, name, None) for name in fields)
+                self._saved_window_bounds = dict(zip(fields, bounds))
+                try:
+                    setattr(target, fs_attr, True)
+                    if win is not None:
+                        win.update()
                 except Exception:
-                    logger.exception("Failed setting page.window_full_screen")
+                    logger.exception("Failed setting %s", fs_attr)
             else:
                 try:
-                    self.page.window_full_screen = False
+                    setattr(target, fs_attr, False)
+                    if win is not None:
+                        win.update()
                 except Exception:
-                    logger.exception("Failed unsetting page.window_full_screen")
-                b = getattr(self, '_saved_window_bounds', None)
+                    logger.exception("Failed unsetting %s", fs_attr)
+                b = self._saved_window_bounds
                 if b:
                     try:
-                        if b.get('width') is not None:
-                            self.page.window_width = b['width']
-                        if b.get('height') is not None:
-                            self.page.window_height = b['height']
-                        if b.get('x') is not None:
-                            self.page.window_x = b['x']
-                        if b.get('y') is not None:
-                            self.page.window_y = b['y']
+                        for name, value in b.items():
+                            if value is not None:
+                                setattr(target, name, value)
+                        if win is not None:
+                            win.update()
                     except Exception:
-                        logger.exception("Failed restoring page bounds")
+                        logger.exception("Failed restoring window bounds")
                     finally:
                         self._saved_window_bounds = None
-            try:
-                self.page.update()
-            except Exception:
-                pass
+
+            if win is None:
+                try:
+                    self.page.update()
+                except Exception:
+                    pass
+            # Update UI to reflect state
             self._update_fullscreen_ui()
         except Exception as e:
             logger.exception("Failed toggling full-screen")
@@ -2325,8 +2698,8 @@ class LiveViewGUI:
     def _update_fullscreen_ui(self):
         """Update the fullscreen button icon/appearance based on current window state."""
         try:
-            btn = getattr(self, '_fullscreen_btn', None)
-            if not btn:
+            btn = self._fullscreen_btn
+            if btn is None:
                 return
             # Determine current fullscreen state
             is_fs = False
@@ -2342,12 +2715,12 @@ class LiveViewGUI:
             try:
                 if is_fs:
                     btn.content = ft.Icon(ft.Icons.FULLSCREEN_EXIT, color=ft.Colors.AMBER_400)
-                    btn.bgcolor = "rgba(100,100,255,0.18)"
-                    btn.border = ft.border.all(2, ft.Colors.BLUE_400)
+                    btn.bgcolor = _BG_TOGGLE_ON
+                    btn.border = _BORDER_SELECTED
                 else:
                     btn.content = ft.Icon(ft.Icons.FULLSCREEN, color=ft.Colors.WHITE)
                     btn.bgcolor = None
-                    btn.border = ft.border.all(1, ft.Colors.GREY_700)
+                    btn.border = _BORDER_IDLE
             except Exception:
                 pass
 
@@ -2368,7 +2741,7 @@ class LiveViewGUI:
         """
         try:
             # Respect user preference: only auto-rotate when enabled
-            if not getattr(self, '_autorotate_enabled', True):
+            if not self._autorotate_enabled:
                 logger.debug("Autorotate disabled — ignoring detected orientation %s", orientation_code)
                 return
 
@@ -2377,28 +2750,21 @@ class LiveViewGUI:
             # EXIF 3 = 180° -> ORIENTATION_180
             # EXIF 6 = 270° -> ORIENTATION_270
             # EXIF 8 = 90° -> ORIENTATION_90
-            if orientation_code == 1:
-                deg = 0
-            elif orientation_code == 3:
-                deg = 180
-            elif orientation_code == 6:
-                deg = 270
-            elif orientation_code == 8:
-                deg = 90
-            else:
+            deg = _EXIF_ORIENTATION_DEGREES.get(orientation_code)
+            if deg is None:
                 logger.warning("Unknown orientation code: %s", orientation_code)
                 return
+
+            # Burst downloads usually repeat the same orientation: skip the camera
+            # and UI work when live view already shows it
+            code = self._orientation_by_deg[deg]
+            if deg == self._active_rotation and getattr(self.camera, 'orientation', None) == code:
+                logger.debug("Live view already at %d°, ignoring repeated EXIF orientation", deg)
+                return
             
             logger.info("Auto-rotating live view to %d° based on captured image EXIF", deg)
             
             # Update camera orientation
-            orientation_map = {
-                0: self.camera.ORIENTATION_NORMAL,
-                90: self.camera.ORIENTATION_90,
-                180: self.camera.ORIENTATION_180,
-                270: self.camera.ORIENTATION_270,
-            }
-            code = orientation_map.get(deg, self.camera.ORIENTATION_NORMAL)
             self.camera.set_orientation(code)
             
             # Update UI to reflect new rotation
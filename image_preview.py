@@ -2,27 +2,57 @@
 Image Preview Module
 Handles RAW thumbnail extraction, JPEG processing, EXIF rotation, and preview caching.
 """
+import heapq
+import io
+import mmap
 import os
+import shutil
 import threading
-from typing import Optional, List, Tuple, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple, Callable
 from dataclasses import dataclass
-from datetime import datetime
 
 try:
-    from PIL import Image, ExifTags
+    from PIL import Image
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
 
+# EXIF Orientation tag (ExifTags.Base.Orientation)
+_EXIF_ORIENTATION_TAG = 0x0112
+# EXIF orientation -> transpose that brings the image upright (1 needs none)
+if HAS_PIL:
+    _EXIF_TRANSPOSE = {
+        2: Image.Transpose.FLIP_LEFT_RIGHT,
+        3: Image.Transpose.ROTATE_180,
+        4: Image.Transpose.FLIP_TOP_BOTTOM,
+        5: Image.Transpose.TRANSPOSE,
+        6: Image.Transpose.ROTATE_270,
+        7: Image.Transpose.TRANSVERSE,
+        8: Image.Transpose.ROTATE_90,
+    }
+else:
+    _EXIF_TRANSPOSE = {}
+
 try:
     import rawpy
     HAS_RAWPY = True
 except ImportError:
     HAS_RAWPY = False
 
+# Optional: lossless (jpegtran-style) EXIF rotation through libjpeg-turbo
+from jpeg_utils import HAS_TURBOJPEG, JpegTransformer
+
 # RAW file extensions
 RAW_EXTENSIONS = {'.arw', '.nef', '.cr2', '.cr3', '.rw2', '.raf', '.orf', '.dng', '.pef', '.srw'}
 JPEG_EXTENSIONS = {'.jpg', '.jpeg'}
+# Same, for str.endswith() on lowercased file names
+_JPEG_SUFFIXES = tuple(JPEG_EXTENSIONS)
+# Embedded full-size previews start within this many bytes of a RAW file's head
+_RAW_PREVIEW_SCAN_BYTES = 2 * 1024 * 1024
+# Scanned previews at least this large are taken without consulting rawpy
+_MIN_SCANNED_PREVIEW_BYTES = 100 * 1024
 
 import logging
 from pathlib import Path
@@ -32,6 +62,70 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def _jpeg_stream_end(buf, soi: int) -> int:
+    """Return the offset just past the EOI of the JPEG stream starting at soi.
+
+    The marker segments are walked by their lengths up to the first SOS, and a
+    frame header (SOF) must come before it; only then is the entropy-coded data
+    searched for EOI (FF bytes in it are stuffed, so FFD9 is unambiguous there).
+    Segments such as an EXIF thumbnail inside APP1 are skipped, not matched.
+
+    Args:
+        buf: bytes-like object (e.g. an mmap) holding the stream
+        soi: Offset of the FFD8 marker
+
+    Returns:
+        End offset, or -1 if the bytes at soi are not a well-formed JPEG header
+    """
+    n = len(buf)
+    pos = soi + 2
+    seen_sof = False
+    while pos + 4 <= n:
+        if buf[pos] != 0xFF:
+            return -1
+        marker = buf[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        # Standalone markers (TEM, RSTn, SOI, EOI) cannot appear before SOS
+        if marker < 0xC0 or 0xD0 <= marker <= 0xD9 or marker == 0xFF:
+            return -1
+        seg_len = (buf[pos + 2] << 8) | buf[pos + 3]
+        if seg_len < 2:
+            return -1
+        if marker == 0xDA:
+            if not seen_sof:
+                return -1
+            eoi = buf.find(b'\xff\xd9', pos + 2 + seg_len)
+            return -1 if eoi == -1 else eoi + 2
+        # SOF0..SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            seen_sof = True
+        pos += 2 + seg_len
+    return -1
+
+
+def _log_jpeg_backend():
+    """Log which libjpeg build Pillow uses for preview decode/encode.
+
+    libjpeg-turbo (the default in Pillow wheels) decodes and re-encodes
+    captures roughly twice as fast as plain libjpeg, so a non-turbo build is
+    worth knowing about when previews feel slow.
+    """
+    if not HAS_PIL:
+        return
+    try:
+        from PIL import features
+        turbo = features.check_feature('libjpeg_turbo')
+        logger.info("ImagePreview: Pillow JPEG library %s (libjpeg-turbo: %s)",
+                    features.version('jpg'), turbo)
+        if turbo is False:
+            logger.warning("ImagePreview: Pillow is built without libjpeg-turbo; preview processing will be slower")
+    except Exception as e:
+        logger.debug("ImagePreview: could not probe Pillow JPEG library: %s", e)
+
+
 def get_user_pictures_dir() -> str:
     """Return the user's Pictures/Images directory for the current platform.
 
@@ -78,19 +172,26 @@ def get_user_pictures_dir() -> str:
     return str(home / "Pictures")
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedImage:
-    """Represents a cached preview image."""
+    """Represents a cached preview image.
+
+    Only metadata is held in memory; the pixels stay in the JPEG on disk, which
+    Flet loads by path when the image is shown.
+    """
     filepath: str
     filename: str
     timestamp: float
     is_raw: bool
+    # (width, height) of the JPEG on disk, when known at creation time
+    size: Optional[Tuple[int, int]] = None
 
 
 class ImagePreviewManager:
     """Manages image preview extraction, caching, and navigation."""
     
-    def __init__(self, download_dir: Optional[str] = None, max_cache_size: int = 50):
+    def __init__(self, download_dir: Optional[str] = None, max_cache_size: int = 50,
+                 preview_max_dim: Optional[int] = None):
         """
         Initialize the preview manager.
         
@@ -99,21 +200,35 @@ class ImagePreviewManager:
                 to the user's Pictures folder (platform-specific) with a `StudioTether`
                 subdirectory (e.g., ~/Pictures/StudioTether).
             max_cache_size: Maximum number of images to cache
+            preview_max_dim: Optional long-side limit (pixels) for the JPEGs saved to
+                download_dir. When set, JPEG decoding shrinks on load (1/2, 1/4 or 1/8
+                scale) to the smallest size still covering it. None keeps full resolution,
+                since the saved JPEG is the copy that remains after a RAW is deleted.
         """
         # Compute a sensible default download directory when not provided
         if download_dir is None:
             pictures_dir = get_user_pictures_dir()
             download_dir = os.path.join(pictures_dir, "StudioTether")
 
-        self.download_dir = download_dir
+        # Stored absolute (Flet needs absolute paths), so every path joined onto it is too
+        self.download_dir = os.path.abspath(download_dir)
         # Ensure the download directory exists
         try:
             os.makedirs(self.download_dir, exist_ok=True)
         except Exception as e:
             logger.warning("Could not create download dir %s: %s", self.download_dir, e)
 
+        _log_jpeg_backend()
+
         self.max_cache_size = max_cache_size
+        self.preview_max_dim = preview_max_dim
         self._cache: List[CachedImage] = []
+        # Base names (filename without extension) kept parallel to _cache
+        self._cache_bases: List[str] = []
+        # Base name -> absolute position of its first entry; subtract _cache_offset
+        # (entries trimmed from the front so far) to get the index into _cache
+        self._base_index: Dict[str, int] = {}
+        self._cache_offset = 0
         self._cache_lock = threading.Lock()
         self._current_index = -1  # -1 means live view mode
         
@@ -126,6 +241,25 @@ class ImagePreviewManager:
         # Track pending RAW files waiting for their JPEG pair
         self._pending_raw: dict = {}  # filename_base -> (raw_path, timestamp)
         self._pair_timeout = 2.0  # seconds to wait for RAW+JPEG pair
+        # Guards _pending_raw and the two sets below: base names whose RAW preview is
+        # being extracted, and those of them whose real JPEG has since arrived
+        self._pending_lock = threading.Lock()
+        self._raw_in_flight: set = set()
+        self._raw_superseded: set = set()
+        # Bounded pool for RAW preview extraction (created on first RAW)
+        self._raw_executor: Optional[ThreadPoolExecutor] = None
+        # Pending-RAW expiry: one sweeper thread (started on first RAW) waits on a
+        # heap of (monotonic deadline, base name) instead of a Timer per RAW
+        self._pending_deadlines: List[Tuple[float, str]] = []
+        self._pending_cv = threading.Condition()
+        self._pending_sweeper: Optional[threading.Thread] = None
+        self._sweeper_stopped = False
+        # Own libjpeg-turbo transform handle (handles are not thread-safe, so
+        # not shared with live view); created on first rotated JPEG
+        self._jpeg_transformer: Optional[JpegTransformer] = None
+        self._jpeg_transformer_lock = threading.Lock()
+        # Set once creating the handle failed (e.g. libturbojpeg 3.x missing)
+        self._lossless_unavailable = not HAS_TURBOJPEG
     
     def set_preview_callback(self, callback: Callable[[CachedImage], None]):
         """Set callback invoked when a new preview is ready."""
@@ -156,43 +290,45 @@ class ImagePreviewManager:
                     logger.warning("Could not create download dir %s: %s", self.download_dir, e)
                     return
 
+            # scandir entries carry the file type from the directory listing, so
+            # only JPEGs cost a stat (for their mtime)
             jpeg_files = []
-            for filename in os.listdir(self.download_dir):
-                filepath = os.path.join(self.download_dir, filename)
-                try:
-                    if os.path.isfile(filepath):
-                        ext = os.path.splitext(filename)[1].lower()
+            with os.scandir(self.download_dir) as it:
+                for entry in it:
+                    try:
                         # Only consider JPEG files for loading into cache
-                        if ext in JPEG_EXTENSIONS:
-                            jpeg_files.append((filepath, filename))
-                except Exception as e:
-                    logger.warning("Cleanup: failed to inspect %s: %s", filename, e)
+                        if entry.name.lower().endswith(_JPEG_SUFFIXES) and entry.is_file():
+                            jpeg_files.append((entry.path, entry.name, entry.stat().st_mtime))
+                    except Exception as e:
+                        logger.warning("Cleanup: failed to inspect %s: %s", entry.name, e)
 
             # Load existing JPEGs into cache (sorted for deterministic order)
             if jpeg_files:
                 logger.info("Loading %d existing JPEG(s) into cache", len(jpeg_files))
                 jpeg_files.sort()
-                for filepath, filename in jpeg_files:
-                    self._load_jpeg_to_cache(filepath, filename)
+                for filepath, filename, mtime in jpeg_files:
+                    self._load_jpeg_to_cache(filepath, filename, mtime)
         except Exception as e:
             logger.warning("Cleanup failed: %s", e)
     
-    def _load_jpeg_to_cache(self, filepath: str, filename: str):
-        """Load an existing JPEG file into the cache."""
+    def _load_jpeg_to_cache(self, filepath: str, filename: str, mtime: Optional[float] = None):
+        """Load an existing JPEG file into the cache.
+
+        Args:
+            filepath: Path of the JPEG file
+            filename: Its base name
+            mtime: Modification time if already known (saves a stat)
+        """
         try:
-            # Convert to absolute path for Flet
-            filepath = os.path.abspath(filepath)
-            
             cached = CachedImage(
                 filepath=filepath,
                 filename=filename,
-                timestamp=os.path.getmtime(filepath),
+                timestamp=mtime if mtime is not None else os.path.getmtime(filepath),
                 is_raw=False
             )
             
             with self._cache_lock:
-                self._cache.append(cached)
-                self._current_index = len(self._cache) - 1
+                self._append_cached_locked(cached, trim=False)
             
             logger.debug("Cleanup: loaded %s into cache", filename)
             
@@ -207,9 +343,7 @@ class ImagePreviewManager:
             filepath: Path to the downloaded file
             filetype: 'arw' for RAW files, 'jpg' for JPEG files
         """
-        if not os.path.exists(filepath):
-            return
-        
+        # No existence pre-check: a missing file fails (and is logged) where it is opened
         filename = os.path.basename(filepath)
         # Strip 'capt_' prefix if present (silent)
         if filename.lower().startswith('capt_'):
@@ -227,7 +361,7 @@ class ImagePreviewManager:
         ext = os.path.splitext(filename)[1].lower()
         is_raw = ext in RAW_EXTENSIONS
         
-        now = datetime.now().timestamp()
+        now = time.time()
         
         # Check if this is part of a RAW+JPEG pair
         if is_raw:
@@ -240,18 +374,22 @@ class ImagePreviewManager:
                 self._safe_delete(filepath)
             else:
                 # Immediately process RAW in background (no 2s wait)
-
-                self._pending_raw[base_name] = (filepath, now)
-                t = threading.Thread(target=self._process_raw_file, args=(filepath,), daemon=True)
-                t.start()
+                with self._pending_lock:
+                    self._pending_raw[base_name] = (filepath, now)
+                    self._raw_in_flight.add(base_name)
+                self._get_raw_executor().submit(self._process_raw_file, filepath)
                 # Schedule a short-lived pending clear to avoid indefinite entries
-                threading.Timer(self._pair_timeout, 
-                                lambda bn=base_name: self._clear_pending_raw(bn)).start()
+                self._schedule_pending_clear(base_name)
         else:
             # JPEG file
             # If a RAW was pending/processed, prefer the real JPEG: replace cached thumbnail
-            if base_name in self._pending_raw:
-                raw_path, _ = self._pending_raw.pop(base_name)
+            with self._pending_lock:
+                pending = self._pending_raw.pop(base_name, None)
+                if base_name in self._raw_in_flight:
+                    # Its extraction must not write over the JPEG processed below
+                    self._raw_superseded.add(base_name)
+            if pending is not None:
+                raw_path, _ = pending
                 logger.info("ImagePreview: JPEG arrived for %s, updating cache", base_name)
                 # Process the incoming JPEG and delete RAW (raw may have been removed already)
                 self._process_jpeg_file(filepath)
@@ -267,25 +405,109 @@ class ImagePreviewManager:
 
     def _clear_pending_raw(self, base_name: str):
         """Clear a pending RAW entry; if file still exists, schedule processing."""
-        if base_name not in self._pending_raw:
-            return
-        raw_path, _ = self._pending_raw.pop(base_name)
-        if os.path.exists(raw_path):
-            t = threading.Thread(target=self._process_raw_file, args=(raw_path,), daemon=True)
-            t.start()
+        with self._pending_lock:
+            pending = self._pending_raw.pop(base_name, None)
+            if pending is None or base_name in self._raw_in_flight:
+                # Gone, or its extraction is still running
+                return
+            raw_path, _ = pending
+            if not os.path.exists(raw_path):
+                return
+            self._raw_in_flight.add(base_name)
+        self._get_raw_executor().submit(self._process_raw_file, raw_path)
+
+    def _schedule_pending_clear(self, base_name: str):
+        """Clear base_name from the pending RAWs once the pair timeout has passed."""
+        with self._pending_cv:
+            if self._sweeper_stopped:
+                return
+            heapq.heappush(self._pending_deadlines, (time.monotonic() + self._pair_timeout, base_name))
+            if self._pending_sweeper is None:
+                self._pending_sweeper = threading.Thread(
+                    target=self._sweep_pending_raw, name="raw-pair-sweep", daemon=True)
+                self._pending_sweeper.start()
+            self._pending_cv.notify()
+
+    def _sweep_pending_raw(self):
+        """Sweeper thread: sleep until the earliest deadline, then clear what is due."""
+        heap = self._pending_deadlines
+        while True:
+            with self._pending_cv:
+                while not self._sweeper_stopped:
+                    if not heap:
+                        self._pending_cv.wait()
+                        continue
+                    delay = heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._pending_cv.wait(delay)
+                if self._sweeper_stopped:
+                    return
+                now = time.monotonic()
+                due = []
+                while heap and heap[0][0] <= now:
+                    due.append(heapq.heappop(heap)[1])
+            for base_name in due:
+                try:
+                    self._clear_pending_raw(base_name)
+                except Exception as e:
+                    logger.warning("ImagePreview: pending RAW clear failed for %s: %s", base_name, e)
+
+    def _get_raw_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool that extracts RAW previews."""
+        if self._raw_executor is None:
+            self._raw_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="raw-extract")
+        return self._raw_executor
+
+    def shutdown(self):
+        """Stop accepting RAW extraction work; running extractions finish in the background."""
+        with self._pending_cv:
+            self._sweeper_stopped = True
+            self._pending_cv.notify_all()
+        executor = self._raw_executor
+        if executor is not None:
+            self._raw_executor = None
+            executor.shutdown(wait=False)
+    
+    def _lossless_exif_transpose(self, filepath: str, orientation: int) -> Optional[bytes]:
+        """Rotate/flip a JPEG upright in the DCT domain, without re-encoding.
+
+        Returns:
+            Upright JPEG data, or None when libjpeg-turbo is unavailable or fails
+        """
+        if self._lossless_unavailable:
+            return None
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            with self._jpeg_transformer_lock:
+                if self._jpeg_transformer is None:
+                    try:
+                        self._jpeg_transformer = JpegTransformer()
+                    except Exception as e:
+                        logger.info("Lossless JPEG rotation unavailable: %s", e)
+                        self._lossless_unavailable = True
+                        return None
+                return self._jpeg_transformer.exif_transpose(data, orientation)
+        except Exception as e:
+            logger.debug("Lossless EXIF rotation failed for %s: %s", filepath, e)
+            return None
     
     def _find_jpeg_pair(self, raw_path: str) -> Optional[str]:
         """Find a JPEG file with the same base name as the RAW file."""
         base_name = os.path.splitext(os.path.basename(raw_path))[0]
-        dir_path = os.path.dirname(raw_path)
+        dir_path = os.path.dirname(raw_path) or '.'
         
-        for ext in JPEG_EXTENSIONS:
-            jpeg_path = os.path.join(dir_path, base_name + ext)
-            if os.path.exists(jpeg_path):
-                return jpeg_path
-            jpeg_path = os.path.join(dir_path, base_name + ext.upper())
-            if os.path.exists(jpeg_path):
-                return jpeg_path
+        # One directory listing (tether downloads hold only in-flight files) instead
+        # of a stat per extension spelling; the extension matches in any case
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if stem == base_name and ext.lower() in JPEG_EXTENSIONS:
+                        return entry.path
+        except OSError as e:
+            logger.debug("JPEG pair lookup failed in %s: %s", dir_path, e)
         return None
     
     def _process_jpeg_file(self, filepath: str):
@@ -293,12 +515,16 @@ class ImagePreviewManager:
         try:
             filename = os.path.basename(filepath)
             
-            # Extract EXIF orientation before processing
+            # Read EXIF orientation and size from the header (no pixel decode)
             orientation_code = None
+            orientation = 1
+            size = None
             if HAS_PIL:
                 try:
                     with Image.open(filepath) as img:
                         orientation_code = self._extract_exif_orientation(img)
+                        orientation = img.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+                        size = img.size
                 except Exception:
                     pass
             
@@ -312,27 +538,39 @@ class ImagePreviewManager:
             # Save to disk with .jpg extension
             base_name = os.path.splitext(filename)[0]
             jpeg_filename = f"{base_name}.jpg"
+            # Absolute, since download_dir is
             jpeg_filepath = os.path.join(self.download_dir, jpeg_filename)
-            # Convert to absolute path for Flet
-            jpeg_filepath = os.path.abspath(jpeg_filepath)
             
-            if HAS_PIL:
+            needs_rotation = orientation in _EXIF_TRANSPOSE
+            needs_shrink = bool(self.preview_max_dim and size and max(size) > self.preview_max_dim)
+            rotated = None
+            if needs_rotation and not needs_shrink:
+                rotated = self._lossless_exif_transpose(filepath, orientation)
+            if rotated is not None:
+                with open(jpeg_filepath, 'wb') as f:
+                    f.write(rotated)
+                # Edge trimming may shave a partial block, so take the size from the result
+                with Image.open(jpeg_filepath) as img:
+                    size = img.size
+            elif HAS_PIL and (needs_rotation or needs_shrink):
                 # Load and auto-rotate based on EXIF
                 img = Image.open(filepath)
+                self._draft_for_preview(img)
                 img = self._apply_exif_rotation(img)
+                size = img.size
                 
                 # Save to disk
                 img.save(jpeg_filepath, format='JPEG', quality=90)
-            else:
-                # Fallback: copy file
-                import shutil
+            elif not (os.path.exists(jpeg_filepath) and os.path.samefile(filepath, jpeg_filepath)):
+                # Already upright (or no Pillow): keep the camera's bytes, no re-encode
                 shutil.copy2(filepath, jpeg_filepath)
             
             cached = CachedImage(
                 filepath=jpeg_filepath,
                 filename=jpeg_filename,
-                timestamp=datetime.now().timestamp(),
-                is_raw=False
+                timestamp=time.time(),
+                is_raw=False,
+                size=size
             )
             
             # Replace existing cached thumbnail for this base name or add new
@@ -342,9 +580,14 @@ class ImagePreviewManager:
             logger.warning("Failed to process JPEG %s: %s", filepath, e)
     
     def _process_raw_file(self, filepath: str):
-        """Extract embedded JPEG from RAW file and cache."""
+        """Extract embedded JPEG from RAW file and cache.
+
+        The preview is dropped if the camera's own JPEG for this shot arrived
+        while it was being extracted.
+        """
+        filename = os.path.basename(filepath)
+        base_name = os.path.splitext(filename)[0]
         try:
-            filename = os.path.basename(filepath)
             jpeg_data = self._extract_jpeg_from_raw(filepath)
             
             if not jpeg_data:
@@ -352,31 +595,50 @@ class ImagePreviewManager:
                 return
             
             # Save to disk with .jpg extension
-            base_name = os.path.splitext(filename)[0]
             jpeg_filename = f"{base_name}.jpg"
-            jpeg_filepath = os.path.join(self.download_dir, jpeg_filename)            # Convert to absolute path for Flet
-            jpeg_filepath = os.path.abspath(jpeg_filepath)            
+            # Absolute, since download_dir is
+            jpeg_filepath = os.path.join(self.download_dir, jpeg_filename)
+            
+            size = None
             if HAS_PIL:
-                # Load extracted JPEG and apply EXIF rotation
-                import io
+                # Header first (orientation, size); only decode when the preview
+                # must be rotated or shrunk, with draft() set before pixels load
                 img = Image.open(io.BytesIO(jpeg_data))
-                img = self._apply_exif_rotation(img)
-                
-                # Save to disk
-                img.save(jpeg_filepath, format='JPEG', quality=90)
-            else:
-                # Save raw JPEG data
-                with open(jpeg_filepath, 'wb') as f:
-                    f.write(jpeg_data)
+                orientation = img.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+                size = img.size
+                needs_shrink = bool(self.preview_max_dim and max(size) > self.preview_max_dim)
+                if orientation in _EXIF_TRANSPOSE or needs_shrink:
+                    self._draft_for_preview(img)
+                    img = self._apply_exif_rotation(img)
+                    size = img.size
+                    buffer = io.BytesIO()
+                    img.save(buffer, format='JPEG', quality=90)
+                    jpeg_data = buffer.getvalue()
+                # else: upright preview, written as is with no re-encode
             
             # Reference the saved JPEG file
             cached = CachedImage(
                 filepath=jpeg_filepath,
                 filename=jpeg_filename,
-                timestamp=datetime.now().timestamp(),
-                is_raw=False  # Now it's a JPEG on disk
+                timestamp=time.time(),
+                is_raw=False,  # Now it's a JPEG on disk
+                size=size
             )
             
+            # Write under a temporary name outside the lock; only the superseded
+            # check and the rename into place run under it, so a real JPEG that
+            # arrived meanwhile is never overwritten
+            tmp_path = jpeg_filepath + '.part'
+            with open(tmp_path, 'wb') as f:
+                f.write(jpeg_data)
+            with self._pending_lock:
+                superseded = base_name in self._raw_superseded
+                if not superseded:
+                    os.replace(tmp_path, jpeg_filepath)
+            if superseded:
+                logger.debug("ImagePreview: JPEG already arrived for %s, dropping RAW preview", base_name)
+                self._safe_delete(tmp_path)
+                return
             # Replace existing cached thumbnail for this base name or add new
             self._replace_or_add_cached(cached)
             # After saving extracted JPEG, delete RAW file
@@ -387,16 +649,24 @@ class ImagePreviewManager:
             
         except Exception as e:
             logger.warning("Failed to process RAW %s: %s", filepath, e)
+        finally:
+            with self._pending_lock:
+                self._raw_in_flight.discard(base_name)
+                self._raw_superseded.discard(base_name)
     
     def _extract_jpeg_from_raw(self, filepath: str) -> Optional[bytes]:
         """
-        Extract embedded JPEG thumbnail from RAW file using rawpy.
-        
-        Falls back to manual extraction if rawpy is not available.
+        Extract the embedded JPEG preview from a RAW file.
+
+        The marker scan over the memory-mapped file head is tried first since it
+        skips LibRaw's full file setup; rawpy is only used when the scan finds no
+        full-size preview (e.g. unusual DNG layouts).
         """
+        scanned = self._scan_embedded_jpeg(filepath)
+        if scanned is not None and len(scanned) > _MIN_SCANNED_PREVIEW_BYTES:
+            return scanned
 
-        
-        # Try rawpy first (preferred method)
+        # rawpy fallback
         if HAS_RAWPY:
             try:
                 with rawpy.imread(filepath) as raw:
@@ -407,9 +677,6 @@ class ImagePreviewManager:
                         return thumb.data
                     elif thumb.format == rawpy.ThumbFormat.BITMAP:
                         # Convert bitmap to JPEG
-
-                        import io
-                        import numpy as np
                         if HAS_PIL:
                             img = Image.fromarray(thumb.data)
                             buffer = io.BytesIO()
@@ -418,42 +685,74 @@ class ImagePreviewManager:
 
                             return jpeg_data
             except Exception as e:
-                logger.info("ImagePreview: rawpy extraction failed, falling back to manual method")
-        
-        # Fallback: manual JPEG extraction
+                logger.info("ImagePreview: rawpy extraction failed, using scanned preview")
+
+        if scanned is not None:
+            # Smaller than a typical full-size preview, but still the best available
+            return scanned
+        logger.debug("ImagePreview: no embedded JPEG found in RAW file")
+        return None
+
+    def _scan_embedded_jpeg(self, filepath: str) -> Optional[bytes]:
+        """
+        Return the largest SOI..EOI span that starts in the RAW file's head.
+
+        The file is memory-mapped rather than read, so only the pages the marker
+        search touches are loaded and only the chosen span is copied out.
+
+        Returns:
+            JPEG bytes (> 10KB), or None if no candidate was found
+        """
         try:
             with open(filepath, 'rb') as f:
-                data = f.read()
-            
-            jpegs = []
-            start = 0
-            while True:
-                # Find JPEG start marker (FFD8)
-                soi = data.find(b'\xff\xd8', start)
-                if soi == -1:
-                    break
-                # Find JPEG end marker (FFD9)
-                eoi = data.find(b'\xff\xd9', soi + 2)
-                if eoi == -1:
-                    break
-                jpeg_data = data[soi:eoi + 2]
-                # Only consider reasonably sized JPEGs (> 10KB)
-                if len(jpeg_data) > 10000:
-                    jpegs.append(jpeg_data)
-                start = eoi + 2
-            
-            if jpegs:
-                # Return the largest JPEG
-                largest = max(jpegs, key=len)
-                return largest
-            
-            logger.debug("ImagePreview: no embedded JPEG found in RAW file")
-            return None
-            
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Embedded previews start near the header; their end may lie beyond
+                    head_end = min(len(mm), _RAW_PREVIEW_SCAN_BYTES)
+                    best_start, best_end = -1, -1
+                    start = 0
+                    while True:
+                        # Find JPEG start marker (FFD8)
+                        soi = mm.find(b'\xff\xd8', start, head_end)
+                        if soi == -1:
+                            break
+                        end = _jpeg_stream_end(mm, soi)
+                        if end == -1:
+                            # Stray FFD8, not the start of a JPEG stream
+                            start = soi + 2
+                            continue
+                        # Only consider reasonably sized JPEGs (> 10KB); keep the largest
+                        if end - soi > 10000 and end - soi > best_end - best_start:
+                            best_start, best_end = soi, end
+                        start = end
+                    if best_start < 0:
+                        return None
+                    return mm[best_start:best_end]
         except Exception as e:
             logger.warning("ImagePreview: failed to extract JPEG from RAW: %s", e)
             return None
-    
+
+    def _draft_for_preview(self, img: Image.Image):
+        """Configure shrink-on-load so decoding stops at about preview_max_dim.
+
+        Must run before the pixels are loaded (rotation or save). draft() only
+        picks a DCT scale, so the result is at least the requested size; images
+        already small enough and non-JPEG sources are left as they are.
+        """
+        max_dim = self.preview_max_dim
+        if not max_dim:
+            return
+        w, h = img.size
+        long_side = max(w, h)
+        if long_side <= max_dim:
+            return
+        scale = max_dim / long_side
+        try:
+            img.draft('RGB', (max(1, int(w * scale)), max(1, int(h * scale))))
+        except Exception as e:
+            logger.debug("JPEG draft mode not applied: %s", e)
+
     def _extract_exif_orientation(self, img: Image.Image) -> Optional[int]:
         """Extract EXIF orientation value from image.
         
@@ -469,21 +768,7 @@ class ImagePreviewManager:
             - 8 = Rotated 90° (90° CW)
         """
         try:
-            exif = img.getexif()
-            if not exif:
-                return None
-            
-            # Find orientation tag
-            orientation_tag = None
-            for tag_id, tag_name in ExifTags.TAGS.items():
-                if tag_name == 'Orientation':
-                    orientation_tag = tag_id
-                    break
-            
-            if orientation_tag is None or orientation_tag not in exif:
-                return None
-            
-            orientation = exif[orientation_tag]
+            orientation = img.getexif().get(_EXIF_ORIENTATION_TAG)
             
             # Only return values that map to camera orientations (1, 3, 6, 8)
             # Ignore flipped orientations (2, 4, 5, 7) as they don't apply to live view
@@ -499,39 +784,12 @@ class ImagePreviewManager:
     def _apply_exif_rotation(self, img: Image.Image) -> Image.Image:
         """Apply rotation based on EXIF orientation tag."""
         try:
-            exif = img.getexif()
-            if not exif:
-                return img
-            
-            # Find orientation tag
-            orientation_tag = None
-            for tag_id, tag_name in ExifTags.TAGS.items():
-                if tag_name == 'Orientation':
-                    orientation_tag = tag_id
-                    break
-            
-            if orientation_tag is None or orientation_tag not in exif:
+            # Orientation 1 (or no EXIF) is the common tethered case: nothing to do
+            orientation = img.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+            op = _EXIF_TRANSPOSE.get(orientation)
+            if op is None:
                 return img
-            
-            orientation = exif[orientation_tag]
-            
-            # Apply rotation based on EXIF orientation
-            if orientation == 2:
-                img = img.transpose(Image.FLIP_LEFT_RIGHT)
-            elif orientation == 3:
-                img = img.rotate(180, expand=True)
-            elif orientation == 4:
-                img = img.transpose(Image.FLIP_TOP_BOTTOM)
-            elif orientation == 5:
-                img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(90, expand=True)
-            elif orientation == 6:
-                img = img.rotate(270, expand=True)
-            elif orientation == 7:
-                img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(270, expand=True)
-            elif orientation == 8:
-                img = img.rotate(90, expand=True)
-            
-            return img
+            return img.transpose(op)
             
         except Exception as e:
             logger.debug("EXIF rotation failed: %s", e)
@@ -540,14 +798,7 @@ class ImagePreviewManager:
     def _add_to_cache(self, cached: CachedImage):
         """Add image to cache and notify callback."""
         with self._cache_lock:
-            self._cache.append(cached)
-            
-            # Trim cache if too large
-            while len(self._cache) > self.max_cache_size:
-                self._cache.pop(0)
-            
-            # Set current index to newest image
-            self._current_index = len(self._cache) - 1
+            self._append_cached_locked(cached)
         
         logger.info("ImagePreview: added to cache: %s (cache size: %d)", cached.filename, len(self._cache))
         
@@ -562,37 +813,67 @@ class ImagePreviewManager:
         """Replace an existing cached image with same base name or add new one."""
         base_name = os.path.splitext(cached.filename)[0]
         with self._cache_lock:
-            for idx, entry in enumerate(self._cache):
-                if os.path.splitext(entry.filename)[0] == base_name:
-                    self._cache[idx] = cached
-                    self._current_index = idx
-                    logger.debug("ImagePreview: replaced cached %s at index %d", cached.filename, idx)
-                    # Notify callback for replacement
-                    if self._preview_callback:
-                        try:
-                            self._preview_callback(cached)
-                        except Exception as e:
-                            logger.exception("ImagePreview: Preview callback failed on replace")
-                    return
-            # Not found — append normally
-            self._cache.append(cached)
-            while len(self._cache) > self.max_cache_size:
-                self._cache.pop(0)
-            self._current_index = len(self._cache) - 1
-        logger.info("ImagePreview: added to cache: %s (cache size: %d)", cached.filename, len(self._cache))
-        # Notify callback for new item
-        if self._preview_callback:
+            pos = self._base_index.get(base_name)
+            replaced = pos is not None
+            if replaced:
+                idx = pos - self._cache_offset
+                self._cache[idx] = cached
+                self._current_index = idx
+            else:
+                # Not found — append normally
+                self._append_cached_locked(cached, base_name=base_name)
+            notify = self._preview_callback
+        # The callback runs UI code, so it is called after the lock is released
+        if replaced:
+            logger.debug("ImagePreview: replaced cached %s at index %d", cached.filename, idx)
+        else:
+            logger.info("ImagePreview: added to cache: %s (cache size: %d)", cached.filename, len(self._cache))
+        if notify:
             try:
-                self._preview_callback(cached)
+                notify(cached)
             except Exception as e:
-                logger.exception("ImagePreview: Preview callback failed")
+                if replaced:
+                    logger.exception("ImagePreview: Preview callback failed on replace")
+                else:
+                    logger.exception("ImagePreview: Preview callback failed")
+
+    def _append_cached_locked(self, cached: CachedImage, trim: bool = True,
+                              base_name: Optional[str] = None):
+        """Append to the cache and select it. Must be called with _cache_lock held.
+
+        Args:
+            cached: Image to append
+            trim: Drop the oldest entries beyond max_cache_size
+            base_name: cached.filename without extension, if already computed
+        """
+        if base_name is None:
+            base_name = os.path.splitext(cached.filename)[0]
+        # First entry wins for duplicate base names, matching a front-to-back search
+        self._base_index.setdefault(base_name, self._cache_offset + len(self._cache))
+        self._cache.append(cached)
+        self._cache_bases.append(base_name)
+        excess = len(self._cache) - self.max_cache_size
+        if trim and excess > 0:
+            for i, base in enumerate(self._cache_bases[:excess]):
+                if self._base_index.get(base) == self._cache_offset + i:
+                    # Re-point to a surviving duplicate, if any (rare), else forget it
+                    try:
+                        self._base_index[base] = self._cache_offset + self._cache_bases.index(base, excess)
+                    except ValueError:
+                        del self._base_index[base]
+            del self._cache[:excess]
+            del self._cache_bases[:excess]
+            self._cache_offset += excess
+        # Set current index to newest image
+        self._current_index = len(self._cache) - 1
 
     def _safe_delete(self, filepath: str):
         """Safely delete a file."""
         try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                logger.debug("Deleted: %s", os.path.basename(filepath))
+            os.remove(filepath)
+            logger.debug("Deleted: %s", os.path.basename(filepath))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning("Failed to delete %s: %s", filepath, e)
     
@@ -641,9 +922,12 @@ class ImagePreviewManager:
             return (self._current_index + 1, len(self._cache))
     
     def has_cached_images(self) -> bool:
-        """Check if there are any cached images."""
-        with self._cache_lock:
-            return len(self._cache) > 0
+        """Check if there are any cached images.
+
+        Lock-free: a single len() of the list is atomic, and the UI only uses this
+        as a hint before taking the locked navigation path.
+        """
+        return len(self._cache) > 0
     
     def reset_to_live_view(self):
         """Reset state to indicate live view mode."""
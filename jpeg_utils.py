@@ -0,0 +1,135 @@
+"""
+JPEG Utilities Module
+Lossless JPEG transforms through libjpeg-turbo, shared by live view and captured stills.
+"""
+import ctypes
+import os
+import platform
+from ctypes.util import find_library
+
+# Optional: PyTurboJPEG supplies the libturbojpeg structures, constants and library paths
+try:
+    import numpy as np
+    import turbojpeg
+    HAS_TURBOJPEG = True
+except Exception:
+    HAS_TURBOJPEG = False
+
+
+class JpegTransformer:
+    """Lossless (jpegtran-style) JPEG rotation through libturbojpeg's tj3Transform.
+
+    Rotation is done on DCT coefficients, so there is no IDCT/FDCT pass and no
+    re-encode quality loss. PyTurboJPEG does not expose a rotate call, so the
+    transform entry points are bound here, reusing its structures and constants.
+
+    A transformer wraps one libturbojpeg handle, which is not thread-safe: use
+    one instance per thread or serialize calls.
+    """
+
+    def __init__(self):
+        """Load libturbojpeg and create a transform handle (raises if unavailable)."""
+        if not HAS_TURBOJPEG:
+            raise RuntimeError("PyTurboJPEG not installed")
+
+        lib_path = find_library('turbojpeg')
+        if lib_path is None:
+            for candidate in turbojpeg.DEFAULT_LIB_PATHS.get(platform.system(), []):
+                if os.path.exists(candidate):
+                    lib_path = candidate
+                    break
+        if lib_path is None:
+            raise RuntimeError("libturbojpeg not found")
+        lib = ctypes.cdll.LoadLibrary(lib_path)
+
+        self._transform_struct = turbojpeg.TransformStruct
+        self._trim = turbojpeg.TJXOPT_TRIM
+        self._copy_none = turbojpeg.TJXOPT_COPYNONE
+        self._warning = turbojpeg.TJERR_WARNING
+        # Clockwise rotation in degrees -> transform
+        self.rotate_ops = {
+            90: turbojpeg.TJXOP_ROT90,
+            180: turbojpeg.TJXOP_ROT180,
+            270: turbojpeg.TJXOP_ROT270,
+        }
+        # EXIF orientation -> transform that brings a still upright (1 needs none)
+        self.exif_ops = {
+            2: turbojpeg.TJXOP_HFLIP,
+            3: turbojpeg.TJXOP_ROT180,
+            4: turbojpeg.TJXOP_VFLIP,
+            5: turbojpeg.TJXOP_TRANSPOSE,
+            6: turbojpeg.TJXOP_ROT90,
+            7: turbojpeg.TJXOP_TRANSVERSE,
+            8: turbojpeg.TJXOP_ROT270,
+        }
+
+        self._transform = lib.tj3Transform
+        self._transform.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t),
+            ctypes.POINTER(self._transform_struct),
+        ]
+        self._transform.restype = ctypes.c_int
+        self._free = lib.tj3Free
+        self._free.argtypes = [ctypes.c_void_p]
+        self._free.restype = None
+        self._get_error_code = lib.tj3GetErrorCode
+        self._get_error_code.argtypes = [ctypes.c_void_p]
+        self._get_error_code.restype = ctypes.c_int
+        self._get_error_str = lib.tj3GetErrorStr
+        self._get_error_str.argtypes = [ctypes.c_void_p]
+        self._get_error_str.restype = ctypes.c_char_p
+
+        init = lib.tj3Init
+        init.argtypes = [ctypes.c_int]
+        init.restype = ctypes.c_void_p
+        self._handle = init(turbojpeg.TJINIT_TRANSFORM)
+        if not self._handle:
+            raise RuntimeError("tj3Init failed")
+
+    def rotate(self, jpeg_data, degrees):
+        """Rotate JPEG data clockwise by 90, 180 or 270 degrees.
+
+        Partial MCU blocks at the edges are trimmed (TJXOPT_TRIM).
+
+        Returns:
+            bytes: Rotated JPEG data
+
+        Raises:
+            IOError: If libturbojpeg reports a fatal error
+        """
+        return self._apply(jpeg_data, self.rotate_ops[degrees], self._trim)
+
+    def exif_transpose(self, jpeg_data, exif_orientation):
+        """Losslessly bring a still upright for its EXIF orientation (2-8).
+
+        Edge blocks are trimmed and markers (EXIF included) are dropped, so the
+        result carries no stale orientation tag, as with a Pillow re-save.
+
+        Returns:
+            bytes: Transformed JPEG data
+
+        Raises:
+            IOError: If libturbojpeg reports a fatal error
+        """
+        return self._apply(jpeg_data, self.exif_ops[exif_orientation], self._trim | self._copy_none)
+
+    def _apply(self, jpeg_data, op, options):
+        """Run a single tj3Transform op over jpeg_data and return the result."""
+        src = np.frombuffer(jpeg_data, dtype=np.uint8)
+        transforms = (self._transform_struct * 1)()
+        transforms[0].op = op
+        transforms[0].options = options
+        dst_bufs = (ctypes.c_void_p * 1)()
+        dst_sizes = (ctypes.c_size_t * 1)()
+        try:
+            status = self._transform(
+                self._handle, src.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)), src.size,
+                1, dst_bufs, dst_sizes, transforms,
+            )
+            if status != 0 and self._get_error_code(self._handle) != self._warning:
+                raise IOError(self._get_error_str(self._handle).decode(errors='replace'))
+            return ctypes.string_at(dst_bufs[0], dst_sizes[0])
+        finally:
+            if dst_bufs[0]:
+                self._free(dst_bufs[0])